@@ -0,0 +1,100 @@
+"""
+.. module:: column index benchmark
+:synopsis: compares datatype and position lookups with and without indexes
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+
+Run from the repository root:
+
+    python -m benchmarks.column_index --columns 10000 --lookups 1000
+
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from simplify.columns import DatatypeIndex
+
+
+DATATYPES = ['float', 'integer', 'boolean', 'string', 'categorical']
+
+
+def make_datatypes(columns: int, seed: int = 43) -> Dict[str, str]:
+    """Returns proxy datatypes for 'columns' randomly named columns."""
+    choices = np.random.default_rng(seed).choice(DATATYPES, size = columns)
+    return {f'column_{i}': str(datatype) for i, datatype in enumerate(choices)}
+
+
+def scan_lookups(datatypes: Dict[str, str],
+                 changes: List[str],
+                 lookups: int) -> int:
+    """Scans every datatype on each lookup, as '__getattr__' used to."""
+    found = 0
+    for i in range(lookups):
+        datatypes[changes[i % len(changes)]] = DATATYPES[i % len(DATATYPES)]
+        found += len([
+            key for key, value in datatypes.items() if value == 'boolean'])
+    return found
+
+
+def index_lookups(datatypes: Dict[str, str],
+                  changes: List[str],
+                  lookups: int) -> int:
+    """Reads columns of a datatype from a maintained 'DatatypeIndex'."""
+    index = DatatypeIndex(contents = datatypes)
+    found = 0
+    for i in range(lookups):
+        index[changes[i % len(changes)]] = DATATYPES[i % len(DATATYPES)]
+        found += len(index.columns(datatype = 'boolean'))
+    return found
+
+
+def get_loc_positions(columns: pd.Index, names: List[str]) -> int:
+    """Finds positions one 'get_loc' call at a time."""
+    return sum(columns.get_loc(name) for name in names)
+
+
+def dict_positions(columns: pd.Index, names: List[str]) -> int:
+    """Finds positions in a dictionary built once from 'columns'."""
+    positions = {name: position for position, name in enumerate(columns)}
+    return sum(positions[name] for name in names)
+
+
+def measure(function: Callable, *args) -> float:
+    """Returns seconds taken by calling 'function' with 'args'."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument('--columns', type = int, default = 10_000)
+    parser.add_argument('--lookups', type = int, default = 1_000)
+    arguments = parser.parse_args()
+    datatypes = make_datatypes(columns = arguments.columns)
+    names = list(datatypes.keys())
+    changes = names[::max(1, len(names) // 100)]
+    columns = pd.Index(names)
+    lookups = [names[i % len(names)] for i in range(arguments.lookups * 10)]
+    results = {
+        'datatype scan': measure(
+            scan_lookups, dict(datatypes), changes, arguments.lookups),
+        'datatype index': measure(
+            index_lookups, dict(datatypes), changes, arguments.lookups),
+        'position get_loc': measure(get_loc_positions, columns, lookups),
+        'position index': measure(dict_positions, columns, lookups)}
+    print(f'{arguments.columns} columns, {arguments.lookups} datatype '
+          f'lookups, {len(lookups)} position lookups')
+    for name, seconds in results.items():
+        print(f'{name:>18}: {seconds:.4f} seconds')
+    return
+
+
+if __name__ == '__main__':
+    main()
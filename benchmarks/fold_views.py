@@ -0,0 +1,97 @@
+"""
+.. module:: fold views benchmark
+:synopsis: compares iloc fold copies and DataBunch views in a split loop
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+
+Run from the repository root:
+
+    python -m benchmarks.fold_views --rows 200000 --columns 50 --folds 10
+
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from simplify.dataset import DataBunch
+
+
+def make_folds(rows: int, folds: int, seed: int = 43) -> list:
+    """Returns list of (train_index, test_index) tuples like a KFold split."""
+    positions = np.random.default_rng(seed).permutation(rows)
+    tests = np.array_split(positions, folds)
+    return [
+        (np.concatenate(tests[:i] + tests[i + 1:]), test)
+        for i, test in enumerate(tests)]
+
+
+def copy_folds(full: DataBunch, folds: list) -> None:
+    """Copies each fold with iloc, as the split loop used to."""
+    for train_index, test_index in folds:
+        train = DataBunch(
+            name = 'training',
+            x = full.x.iloc[train_index],
+            y = full.y.iloc[train_index])
+        test = DataBunch(
+            name = 'testing',
+            x = full.x.iloc[test_index],
+            y = full.y.iloc[test_index])
+        use_fold(train = train, test = test)
+    return
+
+
+def view_folds(full: DataBunch, folds: list) -> None:
+    """Makes each fold a view, as the split loop does now."""
+    for train_index, test_index in folds:
+        train = full.view(name = 'training', index = train_index)
+        test = full.view(name = 'testing', index = test_index)
+        use_fold(train = train, test = test)
+    return
+
+
+def use_fold(train: DataBunch, test: DataBunch) -> None:
+    """Reads each fold several times, like fitting and transforming."""
+    means = train.x.to_numpy().mean(axis = 0)
+    train.x.to_numpy() - means
+    test.x.to_numpy() - means
+    train.y.to_numpy().mean()
+    return
+
+
+def measure(method: Callable, full: DataBunch, folds: list) -> Dict[str, float]:
+    """Returns seconds and peak megabytes allocated by 'method'."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    method(full, folds)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'seconds': seconds, 'peak_mb': peak / 1_000_000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument('--rows', type = int, default = 200_000)
+    parser.add_argument('--columns', type = int, default = 50)
+    parser.add_argument('--folds', type = int, default = 10)
+    arguments = parser.parse_args()
+    rng = np.random.default_rng(43)
+    full = DataBunch(
+        name = 'full',
+        x = pd.DataFrame(rng.random((arguments.rows, arguments.columns))),
+        y = pd.Series(rng.integers(0, 2, arguments.rows)))
+    folds = make_folds(rows = arguments.rows, folds = arguments.folds)
+    print('full x', round(full.x.memory_usage().sum() / 1_000_000, 1), 'MB')
+    for name, method in [('iloc copies', copy_folds), ('views', view_folds)]:
+        print(name, measure(method = method, full = full, folds = folds))
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+.. module:: import time benchmark
+:synopsis: measures cold import cost of public siMpLify entry points
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+
+Each entry point is imported in a fresh interpreter so that every run is a
+cold import. The median seconds, number of modules loaded, and peak resident
+memory are reported and compared to 'import_budgets.json'.
+
+Run from the repository root:
+
+    python -m benchmarks.import_time --repeat 5
+
+The exit status is 1 if any entry point fails to import or exceeds its
+budget.
+
+"""
+
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+# Statements which import each entry point.
+ENTRY_POINTS = {
+    'package': 'import simplify',
+    'Dataset': 'import simplify; simplify.Dataset',
+    'Clerk': 'import simplify; simplify.Clerk',
+    'Project': 'import simplify; simplify.Project',
+    'cli': 'import simplify.__main__'}
+
+# Runs in the child interpreter and prints one line of JSON.
+PROBE = '''
+import json, resource, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+exec({statement!r})
+seconds = time.perf_counter() - start
+loaded = sorted(set(sys.modules) - before)
+print(json.dumps({{
+    'seconds': seconds,
+    'modules': loaded,
+    'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))
+'''
+
+BUDGETS = pathlib.Path(__file__).with_name('import_budgets.json')
+
+
+def measure(statement: str, repeat: int) -> Dict[str, Any]:
+    """Returns median import cost of 'statement' over 'repeat' runs.
+
+    Raises:
+        RuntimeError: if 'statement' fails in the child interpreter.
+
+    """
+    runs = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, '-c', PROBE.format(statement = statement)],
+            capture_output = True,
+            text = True)
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr.strip().splitlines()[-1])
+        runs.append(json.loads(process.stdout.strip().splitlines()[-1]))
+    return {
+        'seconds': statistics.median(r['seconds'] for r in runs),
+        'rss_mb': statistics.median(r['rss_mb'] for r in runs),
+        'modules': runs[-1]['modules']}
+
+
+def check(name: str,
+        result: Dict[str, Any],
+        budget: Dict[str, Any]) -> List[str]:
+    """Returns descriptions of every way 'result' exceeds 'budget'."""
+    failures = []
+    if result['seconds'] > budget.get('seconds', float('inf')):
+        failures.append(
+            f'{name}: {result["seconds"]:.3f}s > {budget["seconds"]}s budget')
+    roots = {m.split('.')[0] for m in result['modules']}
+    for module in budget.get('forbidden', []):
+        if module in roots:
+            failures.append(f'{name}: imports {module}')
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument('--repeat', type = int, default = 5)
+    parser.add_argument('--budgets', default = str(BUDGETS))
+    parser.add_argument('--json', action = 'store_true',
+                        help = 'print results as JSON')
+    arguments = parser.parse_args()
+    with open(arguments.budgets, 'r') as budgets:
+        budgets = json.load(budgets)
+    results = {}
+    failures = []
+    for name, statement in ENTRY_POINTS.items():
+        try:
+            results[name] = measure(
+                statement = statement,
+                repeat = arguments.repeat)
+        except RuntimeError as error:
+            failures.append(f'{name}: {error}')
+            continue
+        failures.extend(check(
+            name = name,
+            result = results[name],
+            budget = budgets.get(name, {})))
+    if arguments.json:
+        print(json.dumps(results, indent = 2))
+    else:
+        for name, result in results.items():
+            print(f'{name:10} {result["seconds"]:7.3f}s '
+                  f'{len(result["modules"]):5d} modules '
+                  f'{result["rss_mb"]:8.1f} MB')
+    for failure in failures:
+        print('FAIL', failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
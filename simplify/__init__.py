@@ -4,24 +4,42 @@
 :author: Corey Rayburn Yung
 :copyright: 2019-2020
 :license: Apache-2.0
+
+Public objects and subpackages are imported the first time they are
+accessed, so 'import simplify' does not load pandas, plotting, or explainer
+packages until they are needed.
+
 """
 
-from simplify.core.dataset import Dataset
-from simplify.core.clerk import Clerk
-from simplify.core.idea import Idea
-from simplify.core.project import Project
-from simplify.core.worker import Worker
-from simplify.core.utilities import simple_timer
+from simplify.lazy import make_lazy
 
 
 __version__ = '0.1.1'
 
 __author__ = 'Corey Rayburn Yung'
 
+# Public object names and the modules where they are located.
+_LAZY_OBJECTS = {
+    'Dataset': 'simplify.dataset',
+    'Clerk': 'simplify.files',
+    'Idea': 'simplify.core.idea',
+    'Project': 'simplify.project',
+    'Worker': 'simplify.worker',
+    'simple_timer': 'simplify.core.utilities'}
+
+# Subpackages which are imported when accessed as attributes.
+_LAZY_SUBPACKAGES = ['analyst', 'artist', 'critic', 'wrangler']
+
 __all__ = [
     'Dataset',
     'Clerk',
     'Idea',
     'Project',
     'Worker',
-    'simple_timer']
\ No newline at end of file
+    'simple_timer']
+
+
+__getattr__, __dir__ = make_lazy(
+    package = __name__,
+    objects = _LAZY_OBJECTS,
+    subpackages = _LAZY_SUBPACKAGES)
\ No newline at end of file
@@ -9,9 +9,8 @@
 import sys
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-import sourdough
-
 import simplify
+from simplify import technique
 
 
 def _args_to_dict() -> Dict[str, str]:
@@ -42,7 +41,11 @@ if __name__ == '__main__':
     # Gets command line arguments and converts them to dict.
     arguments = _args_to_dict()
     # Calls Project with passed command-line arguments.
-    Project(
+    simplify.Project(
         idea = arguments.get('-idea'),
         clerk = arguments.get('-clerk', None),
-        dataset = arguments.get('-dataset', None))
\ No newline at end of file
+        dataset = arguments.get('-dataset', None))
+    # Prints seconds spent importing algorithm modules, if requested.
+    if arguments.get('-profile', 'False').lower() in ['true', '1', 'yes']:
+        for module, seconds in technique.import_profile():
+            print(f'{seconds:8.3f}s  {module}')
\ No newline at end of file
@@ -14,15 +14,21 @@ from __future__ import annotations
 import copy
 import dataclasses
 import functools
+import hashlib
+import os
+import pathlib
+import tempfile
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
                     Optional, Sequence, Tuple, Type, Union)
 
+import joblib
 import numpy as np
 import pandas as pd
 import scipy
 import sklearn
 
 import simplify
+from simplify.technique import Technique
 import sourdough
 
 
@@ -30,12 +36,15 @@ import sourdough
 def auto_categorize(
         data: 'Data',
         columns: Optional[Union[List[str], str]] = None,
-        threshold: Optional[int] = 10) -> 'Data':
+        threshold: Optional[int] = 10,
+        approximate: Optional[bool] = False) -> 'Data':
     """Converts appropriate columns to 'categorical' type.
 
     The function automatically assesses each column to determine if it has less
     than 'threshold' unique values and is not boolean. If so, that column is
-    converted to 'categorical' type.
+    converted to 'categorical' type. Cardinality is read from the cached
+    column profile of 'data', which may be a HyperLogLog estimate if
+    'approximate' is True.
 
     Args:
         data ('Data'): instance storing a pandas DataFrame.
@@ -43,6 +52,8 @@ def auto_categorize(
             Defaults to None. If not passed, all columns are checked.
         threshold (Optional[int]): number of unique values under which the
             column will be converted to 'categorical'. Defaults to 10.
+        approximate (Optional[bool]): whether estimated cardinalities may be
+            used. Defaults to False.
 
     Raises:
         KeyError: if a column in 'columns' is not in 'data'.
@@ -50,23 +61,28 @@ def auto_categorize(
     """
     if not columns:
         columns = list(data.datatypes.keys())
-    for column in columns:
-        try:
-            if not column in data.booleans:
-                if data[column].nunique() < threshold:
-                    data[column] = data[column].astype('category')
-                    data.datatypes[column] = 'categorical'
-        except KeyError:
-            raise KeyError(' '.join([column, 'is not in data']))
+    profiles = data.profile(columns = columns, approximate = approximate)
+    booleans = data.booleans
+    for column in utilities.listify(columns):
+        if (column not in booleans
+                and profiles[column]['unique'] < threshold):
+            data[column] = data[column].astype('category')
+            data.datatypes[column] = 'categorical'
     return data
 
 def combine_rare(
         data: 'Data',
         columns: Optional[Union[List[str], str]] = None,
-        threshold: Optional[float] = 0) -> 'Data':
+        threshold: Optional[float] = 0,
+        approximate: Optional[bool] = False) -> 'Data':
     """Converts rare categories to a single category.
 
-    The threshold is defined as the percentage of total rows.
+    The threshold is defined as the percentage of total rows. Value counts are
+    read from the cached column profile of 'data' when they are available. If
+    'approximate' is True, frequent categories are found with the heavy
+    hitter sketch of each column, which never misses a frequent category but
+    may keep categories just under 'threshold'. Exact counts are used if the
+    sketch has too few counters for 'threshold'.
 
     Args:
         data ('Data'): instance storing a pandas DataFrame.
@@ -76,32 +92,143 @@ def combine_rare(
         threshold (Optional[float]): indicates the percentage of values in rows
             below which the categories are collapsed into a single category.
             Defaults to 0, meaning no categories are eliminated.
+        approximate (Optional[bool]): whether sketched frequencies may be
+            used. Defaults to False.
 
     Raises:
         KeyError: if a column in 'columns' is not in 'data'.
 
     """
     if not columns:
-        columns = sdata.categoricals
-    for column in columns:
-        try:
-            counts = data[column].value_counts()
-            frequencies = (counts/counts.sum() * 100).lt(1)
-            rare = frequencies[frequencies <= threshold].index
-            data[column].replace(rare , 'rare', inplace = True)
-        except KeyError:
-            raise KeyError(' '.join([column, 'is not in data']))
+        columns = data.categoricals
+    profiles = data.profile(columns = columns, approximate = approximate)
+    for column in utilities.listify(columns):
+        frequent = None
+        if profiles[column]['sketch'] is not None:
+            frequent = profiles[column]['sketch'].frequent(
+                fraction = threshold / 100)
+        if frequent is None:
+            counts = profiles[column]['counts']
+            if counts is None or profiles[column]['approximate']:
+                counts = data[column].value_counts()
+            percentages = counts / counts.sum() * 100
+            frequent = percentages[percentages >= threshold].index
+        values = data[column]
+        rare = values.notna() & ~values.isin(frequent)
+        if rare.any():
+            if (isinstance(values.dtype, pd.CategoricalDtype)
+                    and 'rare' not in values.cat.categories):
+                values = values.cat.add_categories('rare')
+            data[column] = values.mask(rare, 'rare')
     return data
 
+def _standardize_columns(
+        df: pd.DataFrame,
+        rows: Optional[np.ndarray] = None,
+        projection_size: Optional[int] = None,
+        generator: Optional[np.random.Generator] = None,
+        block_size: Optional[int] = 1024,
+        chunk_size: Optional[int] = 65_536) -> np.ndarray:
+    """Returns float32 columns of 'df' centered and scaled to unit length.
+
+    Columns are converted one block at a time so that a float64 copy of the
+    whole frame is never made. Missing values are set to the column mean,
+    and constant columns are left as zeros so that they correlate with
+    nothing. Rows may be randomly projected to fewer dimensions with a
+    Gaussian matrix, which is generated 'chunk_size' rows at a time so that
+    the whole matrix never exists.
+
+    Args:
+        df (pd.DataFrame): numeric and boolean columns to standardize.
+        rows (Optional[np.ndarray]): positions of sampled rows. Defaults to
+            None, meaning all rows are used.
+        projection_size (Optional[int]): number of random projections of the
+            rows. Defaults to None, meaning rows are not projected.
+        generator (Optional[np.random.Generator]): source of the random
+            projection. Defaults to None, meaning an unseeded generator.
+        block_size (Optional[int]): number of columns converted at a time.
+        chunk_size (Optional[int]): number of rows projected at a time.
+
+    Returns:
+        np.ndarray: column-major float32 array with a column for each column
+            in 'df'.
+
+    """
+    if rows is None:
+        rows = slice(None)
+        length = len(df)
+    else:
+        length = len(rows)
+    columns = range(0, df.shape[1], block_size)
+
+    def _center(row_positions: Union[slice, np.ndarray],
+                start: int,
+                means: Optional[np.ndarray] = None) -> np.ndarray:
+        """Returns a block of 'df' minus 'means' with missing values at 0."""
+        block = df.iloc[row_positions, start:start + block_size].to_numpy(
+            dtype = np.float32, na_value = np.nan)
+        if means is None:
+            means = np.nanmean(block, axis = 0)
+        block = block - means
+        block[np.isnan(block)] = 0
+        return block
+
+    if projection_size is None:
+        standardized = np.empty(
+            (length, df.shape[1]), dtype = np.float32, order = 'F')
+        for start in columns:
+            standardized[:, start:start + block_size] = _center(
+                row_positions = rows,
+                start = start)
+    else:
+        generator = generator or np.random.default_rng()
+        means = np.concatenate([
+            np.nanmean(df.iloc[rows, start:start + block_size].to_numpy(
+                dtype = np.float32, na_value = np.nan), axis = 0)
+            for start in columns])
+        standardized = np.zeros(
+            (projection_size, df.shape[1]), dtype = np.float32, order = 'F')
+        for row_start in range(0, length, chunk_size):
+            if isinstance(rows, slice):
+                chunk = slice(row_start, min(row_start + chunk_size, length))
+                chunk_length = chunk.stop - chunk.start
+            else:
+                chunk = rows[row_start:row_start + chunk_size]
+                chunk_length = len(chunk)
+            projection = generator.standard_normal(
+                (projection_size, chunk_length), dtype = np.float32)
+            for start in columns:
+                standardized[:, start:start + block_size] += (
+                    projection @ _center(
+                        row_positions = chunk,
+                        start = start,
+                        means = means[start:start + block_size]))
+    norms = np.linalg.norm(standardized, axis = 0)
+    norms[norms == 0] = np.inf
+    standardized /= norms
+    return standardized
+
 def decorrelate(
         data: 'Data',
         columns: Optional[Union[List[str], str]] = None,
-        threshold: Optional[float] = 0.95) -> 'Data':
+        threshold: Optional[float] = 0.95,
+        block_size: Optional[int] = 1024,
+        sample_size: Optional[int] = None,
+        projection_size: Optional[int] = None,
+        seed: Optional[int] = None) -> 'Data':
     """Drops all but one column from highly correlated groups of columns.
 
-    The threshold is based upon the .corr() method in pandas. 'columns' can
-    include any datatype accepted by .corr(). If 'columns' is None, all
-    columns in the DataFrame are tested.
+    Columns are visited in order and a column is dropped if its absolute
+    Pearson correlation with a column that has already been kept is above
+    'threshold'. Correlations are computed from standardized float32 data in
+    tiles of 'block_size' columns against the kept columns, so only one tile
+    of the correlation matrix exists at a time. Kept columns are moved into a
+    contiguous prefix of the standardized data, so tiles are computed without
+    gathering them. Columns which are not numeric or boolean are ignored.
+
+    For very wide or long data, rows may be randomly sampled ('sample_size')
+    or randomly projected to fewer dimensions ('projection_size'), which
+    approximates the correlations at a lower cost.
 
     Args:
         data ('Data'): instance storing a pandas DataFrame.
@@ -111,17 +238,58 @@ def decorrelate(
             method above which a column is dropped. The default threshold is
             0.95, consistent with a common p-value threshold used in social
             science research.
+        block_size (Optional[int]): number of columns in each tile of the
+            correlation matrix. Defaults to 1024.
+        sample_size (Optional[int]): number of rows randomly sampled to
+            estimate correlations. Defaults to None, meaning all rows are used.
+        projection_size (Optional[int]): number of random projections of the
+            rows used to estimate correlations. Defaults to None, meaning rows
+            are not projected.
+        seed (Optional[int]): seed for sampling and projecting rows.
 
     """
     if not columns:
         columns = list(data.datatypes.keys())
-    try:
-        corr_matrix = data[columns].corr().abs()
-    except TypeError:
-        corr_matrix = data.corr().abs()
-    upper = corr_matrix.where(
-        np.triu(np.ones(corr_matrix.shape), k = 1).astype(np.bool))
-    corrs = [col for col in upper.corrs if any(upper[col] > threshold)]
+    df = data[utilities.listify(columns)]
+    df = df.select_dtypes(include = ['number', 'bool'])
+    generator = np.random.default_rng(seed)
+    rows = None
+    if sample_size and sample_size < len(df):
+        rows = np.sort(generator.choice(
+            len(df), size = sample_size, replace = False))
+    length = len(rows) if rows is not None else len(df)
+    if not projection_size or projection_size >= length:
+        projection_size = None
+    standardized = _standardize_columns(
+        df = df,
+        rows = rows,
+        projection_size = projection_size,
+        generator = generator,
+        block_size = block_size)
+    kept = []
+    for start in range(0, standardized.shape[1], block_size):
+        block = standardized[:, start:start + block_size]
+        candidates = np.ones(block.shape[1], dtype = bool)
+        if kept:
+            # Kept columns are a contiguous prefix, so slicing copies nothing.
+            tile = np.abs(standardized[:, :len(kept)].T @ block)
+            candidates = ~(tile > threshold).any(axis = 0)
+        tile = np.abs(block.T @ block)
+        selected = []
+        for position in range(block.shape[1]):
+            if not candidates[position]:
+                continue
+            selected.append(position)
+            candidates[position + 1:] &= ~(
+                tile[position, position + 1:] > threshold)
+        # Moves kept columns left, over columns already dropped or visited.
+        standardized[:, len(kept):len(kept) + len(selected)] = block[
+            :, selected]
+        kept.extend(start + position for position in selected)
+    kept = set(kept)
+    corrs = [
+        column for position, column in enumerate(df.columns)
+        if position not in kept]
     data.drop_columns(columns = corrs)
     return data
 
@@ -135,7 +303,8 @@ def drop_infrequently_true(
     concerned with rare instances of True and not False. This enables
     users to set a different variance threshold for rarely appearing
     information. 'threshold' is defined as the percentage of total rows (and
-    not the typical variance formulas used in sklearn).
+    not the typical variance formulas used in sklearn). The rate of True values
+    is read from the cached column profile of 'data'.
 
     Args:
         data ('Data'): instance storing a pandas DataFrame.
@@ -145,13 +314,11 @@ def drop_infrequently_true(
     """
     if columns is None:
         columns = data.booleans
-    infrequents = []
-    for column in utilities.listify(columns):
-        try:
-            if data[column].mean() < threshold:
-                infrequents.append(column)
-        except KeyError:
-            raise KeyError(' '.join([column, 'is not in data']))
+    profiles = data.profile(columns = columns)
+    infrequents = [
+        column for column in utilities.listify(columns)
+        if profiles[column]['mean'] is not None
+        and profiles[column]['mean'] < threshold]
     data.drop_columns(columns = infrequents)
     return data
 
@@ -161,6 +328,9 @@ def smart_fill(
     """Fills na values in a DataFrame with defaults based upon the datatype
     listed in 'all_datatypes'.
 
+    Columns which the cached column profile of 'data' shows have no missing
+    values are skipped.
+
     Args:
         data ('Data'): instance storing a pandas DataFrame.
         columns (list): list of columns to fill missing values in. If no
@@ -170,13 +340,15 @@ def smart_fill(
         KeyError: if column in 'columns' is not in 'data'.
 
     """
-    for column in self._check_columns(columns):
-        try:
-            default_value = self.all_datatypes.default_values[
-                    self.columns[column]]
-            data[column].fillna(default_value, inplace = True)
-        except KeyError:
-            raise KeyError(' '.join([column, 'is not in data']))
+    columns = data._check_columns(columns)
+    profiles = data.profile(columns = columns)
+    for column in columns:
+        if profiles[column]['nulls']:
+            try:
+                default_value = data.types.defaults[data.datatypes[column]]
+            except KeyError:
+                raise KeyError(' '.join([column, 'is not in data']))
+            data[column] = data[column].fillna(default_value)
     return data
 
 
@@ -665,6 +837,209 @@ class Recipe(Chapter):
 
 
 
+@dataclasses.dataclass
+class ToolCache(object):
+    """Content-addressed disk cache for fitted algorithms and transformed data.
+
+    Entries are keyed by a hash of a 'Tool' instance's module, algorithm, and
+    parameters along with a fingerprint of the data passed to it. When the
+    total size of stored entries exceeds 'max_size', the least recently used
+    entries are deleted. Entries are written to a temporary file and then
+    renamed, so an interrupted write never leaves a partial entry.
+
+    Args:
+        folder (Union[str, pathlib.Path]): folder where entries are stored.
+        max_size (Optional[int]): maximum total size in bytes of stored
+            entries. Defaults to 1 gigabyte.
+        hits (Optional[int]): number of successful lookups. Defaults to 0.
+        misses (Optional[int]): number of failed lookups. Defaults to 0.
+
+    """
+    folder: Union[str, pathlib.Path]
+    max_size: Optional[int] = 1_000_000_000
+    hits: Optional[int] = 0
+    misses: Optional[int] = 0
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.folder = pathlib.Path(self.folder)
+        self.folder.mkdir(parents = True, exist_ok = True)
+        return self
+
+    """ Factory Method """
+
+    @classmethod
+    def create(cls,
+            clerk: 'Clerk',
+            max_size: Optional[int] = 1_000_000_000) -> ToolCache:
+        """Creates a 'ToolCache' in the results folder of 'clerk'.
+
+        Args:
+            clerk ('Clerk'): shared 'Clerk' instance with project file
+                management settings.
+            max_size (Optional[int]): maximum total size in bytes of stored
+                entries. Defaults to 1 gigabyte.
+
+        Returns:
+            ToolCache: instance, properly configured.
+
+        """
+        return cls(
+            folder = clerk['results'].joinpath('cache'),
+            max_size = int(max_size))
+
+    """ Public Methods """
+
+    @staticmethod
+    def fingerprint(data: Union[pd.DataFrame, pd.Series, np.ndarray]) -> str:
+        """Returns a hash of the contents, labels, and dtypes of 'data'.
+
+        Args:
+            data (Union[pd.DataFrame, pd.Series, np.ndarray]): data to hash.
+
+        Returns:
+            str: hexadecimal digest of 'data'.
+
+        """
+        digest = hashlib.sha256()
+        if data is None:
+            digest.update(b'None')
+        elif isinstance(data, (pd.DataFrame, pd.Series)):
+            digest.update(
+                pd.util.hash_pandas_object(data, index = True).values.tobytes())
+            if isinstance(data, pd.DataFrame):
+                digest.update(str(list(data.columns)).encode())
+                digest.update(str(list(data.dtypes)).encode())
+            else:
+                digest.update(str((data.name, data.dtype)).encode())
+        else:
+            data = np.ascontiguousarray(data)
+            digest.update(str((data.shape, data.dtype)).encode())
+            digest.update(data.tobytes())
+        return digest.hexdigest()
+
+    def make_key(self, tool: Tool, *parts: str) -> str:
+        """Returns key for 'tool' combined with other hashed 'parts'.
+
+        Args:
+            tool (Tool): instance with 'module', 'algorithm', and 'parameters'.
+            parts (str): other strings, usually data fingerprints, which
+                identify the entry.
+
+        Returns:
+            str: hexadecimal key for an entry.
+
+        """
+        try:
+            parameters = tool.algorithm.get_params()
+        except AttributeError:
+            parameters = tool.parameters
+        algorithm = getattr(
+            tool.algorithm, '__name__', type(tool.algorithm).__name__)
+        digest = hashlib.sha256()
+        for part in [
+                str(tool.module),
+                str(algorithm),
+                repr(sorted(parameters.items(), key = lambda item: item[0])),
+                *parts]:
+            digest.update(part.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Returns stored entry for 'key' or None if it does not exist.
+
+        Args:
+            key (str): key for an entry.
+
+        An entry which cannot be loaded, such as one written by an
+        incompatible version of a library, is treated as missing and deleted.
+
+        Returns:
+            Any: stored object or None.
+
+        """
+        path = self._make_path(key = key)
+        try:
+            stored = joblib.load(path)
+            # Updates access time so that eviction is least recently used.
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            self.misses += 1
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            return None
+        self.hits += 1
+        return stored
+
+    def put(self, key: str, value: Any) -> None:
+        """Stores 'value' under 'key' and evicts old entries if needed.
+
+        Args:
+            key (str): key for an entry.
+            value (Any): object to store.
+
+        """
+        path = self._make_path(key = key)
+        descriptor, temporary = tempfile.mkstemp(
+            dir = self.folder,
+            prefix = '.'.join([key, '']),
+            suffix = '.tmp')
+        os.close(descriptor)
+        try:
+            joblib.dump(value, temporary)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self._evict()
+        return self
+
+    def clear(self) -> None:
+        """Deletes all stored entries."""
+        for path in self.folder.glob('*.joblib'):
+            path.unlink()
+        return self
+
+    def report(self) -> Dict[str, int]:
+        """Returns counters and current size of the cache.
+
+        Returns:
+            Dict[str, int]: hits, misses, number of entries, and total bytes.
+
+        """
+        paths = list(self.folder.glob('*.joblib'))
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(paths),
+            'size': sum(path.stat().st_size for path in paths)}
+
+    """ Private Methods """
+
+    def _make_path(self, key: str) -> pathlib.Path:
+        """Returns file path for 'key'."""
+        return self.folder.joinpath('.'.join([key, 'joblib']))
+
+    def _evict(self) -> None:
+        """Deletes least recently used entries until under 'max_size'."""
+        entries = sorted(
+            ((path.stat().st_mtime, path.stat().st_size, path)
+             for path in self.folder.glob('*.joblib')),
+            key = lambda entry: entry[0])
+        total = sum(entry[1] for entry in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            path.unlink()
+            total -= size
+        return self
+
+
 @dataclasses.dataclass
 class Tool(Technique):
     """Base method wrapper for applying algorithms to data.
@@ -689,6 +1064,8 @@ class Tool(Technique):
         parameters (Optional[Dict[str, Any]]): parameters to be attached to
             'algorithm' when 'algorithm' is instanced. Defaults to an empty
             dictionary.
+        cache (Optional[ToolCache]): disk cache for fitted algorithms and
+            transformed data. Defaults to None, which disables caching.
 
     """
     name: Optional[str] = None
@@ -706,6 +1083,7 @@ class Tool(Technique):
     fit_method: Optional[str] = dataclasses.field(default_factory = lambda: 'fit')
     transform_method: Optional[str] = dataclasses.field(
         default_factory = lambda: 'transform')
+    cache: Optional[ToolCache] = None
 
     """ Core siMpLify Methods """
 
@@ -740,10 +1118,22 @@ class Tool(Technique):
         """
         x, y = check_X_y(X = x, y = y, accept_sparse = True)
         if self.fit_method is not None:
+            if self.cache is not None:
+                self._fit_key = self.cache.make_key(
+                    self,
+                    'fit',
+                    self.cache.fingerprint(x),
+                    self.cache.fingerprint(y))
+                fitted = self.cache.get(key = self._fit_key)
+                if fitted is not None:
+                    self.algorithm = fitted
+                    return self
             if y is None:
                 getattr(self.algorithm, self.fit_method)(x)
             else:
                 self.algorithm = self.algorithm.fit(x, y)
+            if self.cache is not None:
+                self.cache.put(key = self._fit_key, value = self.algorithm)
         return self
 
     @numpy_shield
@@ -768,10 +1158,23 @@ class Tool(Technique):
 
         """
         if self.transform_method is not None:
+            if self.cache is not None:
+                # The fit key identifies the fitted state of 'algorithm'.
+                key = self.cache.make_key(
+                    self,
+                    self.transform_method,
+                    getattr(self, '_fit_key', ''),
+                    self.cache.fingerprint(x))
+                transformed = self.cache.get(key = key)
+                if transformed is not None:
+                    return transformed
             try:
-                return getattr(self.algorithm, self.transform_method)(x)
+                transformed = getattr(self.algorithm, self.transform_method)(x)
             except AttributeError:
                 return x
+            if self.cache is not None:
+                self.cache.put(key = key, value = transformed)
+            return transformed
         else:
             return x
 
@@ -825,10 +1228,17 @@ class AnalystScholar(Scholar):
         worker ('Worker'): instance with information needed to apply a 'Book'
             instance.
         idea (Optional[Idea]): instance with project settings.
+        cache_tools (Optional[bool]): whether fitted algorithms and transformed
+            data should be cached on disk and reused when the same 'Tool' is
+            applied to the same data. Defaults to False.
+        cache_size (Optional[int]): maximum size in bytes of the cache.
+            Defaults to 1 gigabyte.
 
     """
     worker: 'Worker'
     idea: Optional[core.Idea] = None
+    cache_tools: Optional[bool] = False
+    cache_size: Optional[int] = 1_000_000_000
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
@@ -837,15 +1247,114 @@ class AnalystScholar(Scholar):
         # Creates 'Finisher' instance to finalize 'Technique' instances.
         self.finisher = AnalystFinisher(worker = self.worker)
         # Creates 'Specialist' instance to apply 'Technique' instances.
-        self.specialist = AnalystSpecialist(worker = self.worker)
+        self.specialist = AnalystSpecialist(
+            worker = self.worker,
+            idea = self.idea)
         # Creates 'Parallelizer' instance to apply 'Chapter' instances, if the
         # option to parallelize has been selected.
         if self.parallelize:
             self.parallelizer = Parallelizer(idea = self.idea)
         return self
 
+    """ Core siMpLify Methods """
+
+    def apply(self, book: 'Cookbook', data: 'Dataset') -> 'Cookbook':
+        """Applies 'book' to 'data', attaching a 'ToolCache' if selected.
+
+        If 'parallelize' is True, recipes are applied in worker processes.
+        If 'prefix_sharing' is also True, the techniques which begin every
+        recipe are applied once before the recipes are sent to the workers.
+
+        Args:
+            book ('Cookbook'): instance with stored 'Recipe' instances.
+            data ('Dataset'): primary instance used by 'project'.
+
+        Returns:
+            'Cookbook': with modifications made and/or 'data' incorporated.
+
+        """
+        if self.cache_tools:
+            self.cache = ToolCache.create(
+                clerk = data.clerk,
+                max_size = self.cache_size)
+            for chapter in book.chapters:
+                for technique in chapter.techniques:
+                    technique.cache = self.cache
+        if self.parallelize and book.chapters:
+            # Each worker applies recipes to 'x' and 'y' from shared memory,
+            # so they are created once here.
+            data.create_xy()
+            start = 0
+            if self.prefix_sharing:
+                start, data = self._apply_common_prefix(
+                    book = book,
+                    data = data)
+            book = self.parallelizer.apply_chapters(
+                book = book,
+                data = data,
+                method = functools.partial(
+                    self.specialist._apply_techniques,
+                    start = start))
+        else:
+            book = super().apply(book = book, data = data)
+        if self.cache_tools and self.verbose:
+            print('Tool cache', self.cache.report())
+        return book
+
     """ Private Methods """
 
+    def _apply_trie(self, book: 'Cookbook', data: 'Dataset') -> 'Cookbook':
+        """Applies 'recipes' in 'book' to 'data' sharing common prefixes.
+
+        Args:
+            book ('Cookbook'): instance with stored 'Recipe' instances.
+            data ('Dataset'): primary instance used by 'project'.
+
+        Returns:
+            'Cookbook': with modifications made and/or 'data' incorporated.
+
+        """
+        data.create_xy()
+        return super()._apply_trie(book = book, data = data)
+
+    def _apply_suffix(self,
+            manuscript: 'Recipe',
+            start: int,
+            data: 'Dataset') -> 'Recipe':
+        """Applies the techniques in 'manuscript' after a shared prefix.
+
+        Once a 'split' step is reached, the rest of 'manuscript' is applied to
+        each fold by the 'specialist'.
+
+        Args:
+            manuscript ('Recipe'): instance with stored 'techniques'.
+            start (int): index of the first technique not yet applied.
+            data ('Dataset'): instance with the shared prefix applied.
+
+        Returns:
+            'Recipe': with modifications made and 'data' incorporated.
+
+        """
+        for i, technique in enumerate(
+                manuscript.techniques[start:], start = start):
+            if technique.step in ['split']:
+                manuscript, data = self.specialist._split_loop(
+                    chapter = manuscript,
+                    index = i,
+                    data = data)
+                break
+            elif technique.step in ['search']:
+                manuscript = self.specialist._search_loop(
+                    chapter = manuscript,
+                    index = i,
+                    data = data)
+            elif not technique.name in ['none', None]:
+                if self.verbose:
+                    print('Applying', technique.name, 'to', data.name)
+                data = technique.apply(data = data)
+        setattr(manuscript, 'data', data)
+        return manuscript
+
     def _get_model_type(self, data: 'Dataset') -> str:
         """Infers 'model_type' from data type of 'label' column.
 
@@ -945,6 +1454,99 @@ class AnalystFinisher(Finisher):
         return self
 
 
+@dataclasses.dataclass
+class FoldResult(object):
+    """Fitted techniques and predictions for one cross-validation fold.
+
+    Args:
+        fold (int): number of the fold.
+        train_index (np.ndarray): positions of the training rows in 'x'.
+        test_index (np.ndarray): positions of the testing rows in 'x'.
+        techniques (List['Technique']): techniques applied after the split,
+            fitted on the training rows of the fold.
+        predictions (Optional[pd.Series]): predictions for the testing rows by
+            the last technique with a 'predict' method. Defaults to None.
+
+    """
+    fold: int
+    train_index: np.ndarray
+    test_index: np.ndarray
+    techniques: List['Technique']
+    predictions: Optional[pd.Series] = None
+
+
+def _search_fold(techniques: List['Technique'], data: 'Dataset') -> None:
+    """Searches hyperparameters for search steps in one fold of 'data'.
+
+    Each search only sees the training rows of the fold, so the testing rows
+    of the fold never help choose the hyperparameters that are scored on
+    them. Techniques between the split and a search are fitted inside the
+    search's own folds. The best parameters are written back into the
+    searched techniques before the fold is applied.
+
+    Args:
+        techniques (List['Technique']): techniques to apply after the split.
+        data ('Dataset'): instance with the training set of the fold created.
+
+    """
+    for i, technique in enumerate(techniques):
+        if technique.step in ['search']:
+            technique.algorithm.search(
+                techniques = techniques[i + 1:],
+                x = data.x_train,
+                y = data.y_train,
+                prefix = [
+                    t for t in techniques[:i] if not t.step in ['search']])
+    return
+
+
+def _apply_fold(
+        techniques: List['Technique'],
+        data: 'Dataset',
+        fold: int,
+        train_index: np.ndarray,
+        test_index: np.ndarray) -> FoldResult:
+    """Applies 'techniques' to one fold of 'data'.
+
+    Called in worker processes by 'AnalystSpecialist._split_loop'. 'data' is
+    sent with its arrays memory-mapped and the training and testing sets are
+    views of them, so each fold only copies rows that its techniques use.
+
+    Args:
+        techniques (List['Technique']): techniques to apply after the split.
+        data ('Dataset'): instance with 'x' and 'y' created.
+        fold (int): number of the fold.
+        train_index (np.ndarray): positions of the training rows in 'x'.
+        test_index (np.ndarray): positions of the testing rows in 'x'.
+
+    Returns:
+        FoldResult: with fitted 'techniques' and any predictions.
+
+    """
+    data.train = data.full_bunch.view(name = 'training', index = train_index)
+    data.test = data.full_bunch.view(name = 'testing', index = test_index)
+    _search_fold(techniques = techniques, data = data)
+    predictor = None
+    for technique in techniques:
+        if (not technique.name in ['none', None]
+                and not technique.step in ['search']):
+            data = technique.apply(data = data)
+            if hasattr(technique.algorithm, 'predict'):
+                predictor = technique.algorithm
+    if predictor is None:
+        predictions = None
+    else:
+        predictions = pd.Series(
+            predictor.predict(data.x_test),
+            index = data.x_test.index)
+    return FoldResult(
+        fold = fold,
+        train_index = train_index,
+        test_index = test_index,
+        techniques = techniques,
+        predictions = predictions)
+
+
 @dataclasses.dataclass
 class AnalystSpecialist(Specialist):
     """Base class for applying 'Technique' instances to data.
@@ -953,21 +1555,38 @@ class AnalystSpecialist(Specialist):
         worker ('Worker'): instance with information needed to apply a 'Book'
             instance.
         idea (Optional[Idea]): instance with project settings.
+        parallel_folds (Optional[bool]): whether cross-validation folds should
+            be applied in worker processes. Defaults to False.
+        fold_workers (Optional[int]): number of worker processes used when
+            'parallel_folds' is True. Defaults to -1, which uses all CPU
+            cores.
 
     """
     worker: 'Worker'
     idea: Optional[core.Idea] = None
+    parallel_folds: Optional[bool] = False
+    fold_workers: Optional[int] = -1
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        if self.idea is not None:
+            self = self.idea.apply(instance = self)
+        return self
 
     """ Private Methods """
 
     def _apply_techniques(self,
             manuscript: 'Chapter',
-            data: 'Dataset') -> 'Chapter':
+            data: 'Dataset',
+            start: Optional[int] = 0) -> 'Chapter':
         """Applies a 'chapter' of 'steps' to 'data'.
 
         Args:
             chapter ('Chapter'): instance with 'steps' to apply to 'data'.
             data (Union['Dataset', 'Book']): object for 'chapter' to be applied.
+            start (Optional[int]): index of the first technique to apply, if
+                earlier techniques were already applied to 'data'. Defaults
+                to 0.
 
         Return:
             'Chapter': with any changes made. Modified 'data' is added to the
@@ -975,8 +1594,10 @@ class AnalystSpecialist(Specialist):
                 attribute of 'data'.
 
         """
-        data.create_xy()
-        for i, technique in enumerate(manuscript.techniques):
+        if data.x is None:
+            data.create_xy()
+        for i, technique in enumerate(
+                manuscript.techniques[start:], start = start):
             if self.verbose:
                 print('Applying', technique.name, 'to', data.name)
             if technique.step in ['split']:
@@ -986,11 +1607,10 @@ class AnalystSpecialist(Specialist):
                     data = data)
                 break
             elif technique.step in ['search']:
-                remaining = self._search_loop(
-                    steps = remaining,
+                manuscript = self._search_loop(
+                    chapter = manuscript,
                     index = i,
                     data = data)
-                data = technique.apply(data = data)
             elif not technique.name in ['none', None]:
                 data = technique.apply(data = data)
         setattr(manuscript, 'data', data)
@@ -1015,27 +1635,93 @@ class AnalystSpecialist(Specialist):
         """
         data.stages.change('testing')
         split_algorithm = chapter.techniques[index].algorithm
+        if self.parallel_folds:
+            return self._split_parallel(
+                chapter = chapter,
+                index = index,
+                data = data)
         for i, (train_index, test_index) in enumerate(
             split_algorithm.split(data.x, data.y)):
             if self.verbose:
                 print('Testing data fold', str(i))
-            data.x_train = data.x.iloc[train_index]
-            data.x_test = data.x.iloc[test_index]
-            data.y_train = data.y[train_index]
-            data.y_test = data.y[test_index]
+            # Views only copy rows when a technique accesses them.
+            data.train = data.full_bunch.view(
+                name = 'training',
+                index = train_index)
+            data.test = data.full_bunch.view(
+                name = 'testing',
+                index = test_index)
+            _search_fold(
+                techniques = chapter.techniques[index + 1:],
+                data = data)
             for technique in chapter.techniques[index + 1:]:
                 if self.verbose:
                     print('Applying', technique.name, 'to', data.name)
-                if not technique.name in ['none', None]:
+                if (not technique.name in ['none', None]
+                        and not technique.step in ['search']):
                     data = technique.apply(data = data)
         return chapter, data
 
-    def _search_loop(self,
+    def _split_parallel(self,
             chapter: 'Chapter',
             index: int,
             data: 'DataSet') -> ('Chapter', 'Dataset'):
+        """Applies remaining steps in 'chapter' to each fold in parallel.
+
+        Folds are sent to a joblib process pool. Arrays in 'data' larger than
+        1 megabyte are memory-mapped once and shared by every fold instead of
+        each fold receiving its own copy. The results are stored in a 'folds'
+        attribute of 'chapter', in fold order.
+
+        Args:
+            chapter ('Chapter'): instance with 'steps' to apply to 'data'.
+            index (int): number of step in 'chapter' 'steps' where split method
+                is located.
+            data ('Dataset'): data object for 'chapter' to be applied.
+
+        Return:
+            'Chapter', 'Dataset': with 'folds' added to 'chapter'. The
+                training and testing sets in 'data' are views of the
+                untransformed rows of the last fold and the techniques in 'chapter' are
+                those fitted on it.
+
+        """
+        split_algorithm = chapter.techniques[index].algorithm
+        remaining = chapter.techniques[index + 1:]
+        if self.verbose:
+            print('Testing data folds in parallel')
+        folds = joblib.Parallel(
+            n_jobs = self.fold_workers,
+            max_nbytes = '1M',
+            mmap_mode = 'r')(
+                joblib.delayed(_apply_fold)(
+                    techniques = remaining,
+                    data = data,
+                    fold = i,
+                    train_index = train_index,
+                    test_index = test_index)
+                for i, (train_index, test_index) in enumerate(
+                    split_algorithm.split(data.x, data.y)))
+        chapter.folds = folds
+        if folds:
+            chapter.techniques[index + 1:] = folds[-1].techniques
+            data.train = data.full_bunch.view(
+                name = 'training',
+                index = folds[-1].train_index)
+            data.test = data.full_bunch.view(
+                name = 'testing',
+                index = folds[-1].test_index)
+        return chapter, data
+
+    def _search_loop(self,
+            chapter: 'Chapter',
+            index: int,
+            data: 'DataSet') -> 'Chapter':
         """Searches hyperparameters for a particular 'algorithm'.
 
+        The 'Searcher' at 'index' tunes the first later technique with a
+        'parameter_space' and writes the best parameters back into it.
+
         Args:
             chapter ('Chapter'): instance with 'steps' to apply to 'data'.
             index (int): number of step in 'chapter' 'steps' where the search
@@ -1047,6 +1733,15 @@ class AnalystSpecialist(Specialist):
                 hyperparameters.
 
         """
+        searcher = chapter.techniques[index].algorithm
+        if data.stages.current in ['full']:
+            x, y = data.x, data.y
+        else:
+            x, y = data.x_train, data.y_train
+        searcher.search(
+            techniques = chapter.techniques[index + 1:],
+            x = x,
+            y = y)
         return chapter
 
 
@@ -1427,6 +2122,46 @@ class Tools(SimpleRepository):
                     default = {'n_features_to_select': 10, 'step': 1},
                     runtime = {'estimator': 'algorithm'},
                     selected = True)}}
+        self.contents['search'] = {
+            'bayes': Tool(
+                name = 'bayes',
+                module = 'simplify.search',
+                algorithm = 'Searcher',
+                runtime = {'seed': 'seed'},
+                required = {'method': 'bayes'},
+                fit_method = None,
+                transform_method = None),
+            'grid': Tool(
+                name = 'grid',
+                module = 'simplify.search',
+                algorithm = 'Searcher',
+                required = {'method': 'grid'},
+                fit_method = None,
+                transform_method = None),
+            'halving': Tool(
+                name = 'halving',
+                module = 'simplify.search',
+                algorithm = 'Searcher',
+                runtime = {'seed': 'seed'},
+                required = {'method': 'halving'},
+                fit_method = None,
+                transform_method = None),
+            'hyperband': Tool(
+                name = 'hyperband',
+                module = 'simplify.search',
+                algorithm = 'Searcher',
+                runtime = {'seed': 'seed'},
+                required = {'method': 'hyperband'},
+                fit_method = None,
+                transform_method = None),
+            'random': Tool(
+                name = 'random',
+                module = 'simplify.search',
+                algorithm = 'Searcher',
+                runtime = {'seed': 'seed'},
+                required = {'method': 'random'},
+                fit_method = None,
+                transform_method = None)}
         model_options = {
             'classify': {
                 'adaboost': Tool(
@@ -0,0 +1,389 @@
+"""
+.. module:: columns
+:synopsis: column datatype indexes and cached column statistics
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+
+These classes only depend upon numpy and pandas, so they can be imported
+without the rest of siMpLify. They are also available from 'dataset'.
+
+"""
+
+import collections.abc
+import concurrent.futures
+import dataclasses
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from simplify import sketches
+
+
+def _listify(variable: Union[List[str], str]) -> List[str]:
+    """Returns 'variable' as a list, wrapping a single column name."""
+    if isinstance(variable, (list, pd.Index)):
+        return list(variable)
+    else:
+        return [variable]
+
+
+@dataclasses.dataclass
+class DatatypeIndex(collections.abc.MutableMapping):
+    """Proxy datatypes of columns with a reverse index by datatype.
+
+    Columns of each datatype are kept in the same order as the keys of
+    'contents' and the index is updated as items are set or deleted, so that
+    columns of a datatype are found without scanning every column.
+
+    Args:
+        contents (Optional[Dict[str, str]]): keys are column names and values
+            are siMpLify proxy datatypes. Defaults to an empty dictionary.
+
+    """
+    contents: Optional[Dict[str, str]] = dataclasses.field(
+        default_factory = dict)
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        contents = self.contents
+        self.contents = {}
+        # Insertion rank of each column, used to order columns of a datatype.
+        self._ranks = {}
+        self._next_rank = 0
+        # Columns of each datatype, with cached ordered lists.
+        self._groups = {}
+        self._ordered = {}
+        self.update(contents)
+        return self
+
+    """ Required ABC Methods """
+
+    def __getitem__(self, key: str) -> str:
+        """Returns proxy datatype of column 'key'."""
+        return self.contents[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        """Sets proxy datatype of column 'key' to 'value'."""
+        if key in self.contents:
+            if self.contents[key] == value:
+                return self
+            self._remove(key = key)
+        else:
+            self._ranks[key] = self._next_rank
+            self._next_rank += 1
+        self.contents[key] = value
+        group = self._groups.setdefault(value, {})
+        group[key] = None
+        ordered = self._ordered.get(value)
+        if ordered is not None and (
+                not ordered or self._ranks[ordered[-1]] < self._ranks[key]):
+            ordered.append(key)
+        else:
+            self._ordered[value] = None
+        return self
+
+    def __delitem__(self, key: str) -> None:
+        """Removes column 'key'."""
+        self._remove(key = key)
+        del self.contents[key]
+        del self._ranks[key]
+        return self
+
+    def __iter__(self) -> Iterable:
+        """Returns iterable of column names."""
+        return iter(self.contents)
+
+    def __len__(self) -> int:
+        """Returns number of columns."""
+        return len(self.contents)
+
+    """ Dunder Methods """
+
+    def __repr__(self) -> str:
+        return repr(self.contents)
+
+    """ Private Methods """
+
+    def _remove(self, key: str) -> None:
+        """Removes column 'key' from the index of its current datatype."""
+        datatype = self.contents[key]
+        del self._groups[datatype][key]
+        ordered = self._ordered.get(datatype)
+        if ordered is not None:
+            ordered.remove(key)
+        return self
+
+    """ Public Methods """
+
+    def columns(self, datatype: str) -> List[str]:
+        """Returns columns with proxy datatype 'datatype'.
+
+        Args:
+            datatype (str): proxy datatype.
+
+        Returns:
+            List[str]: column names in the order they were added.
+
+        """
+        ordered = self._ordered.get(datatype)
+        if ordered is None:
+            ordered = sorted(
+                self._groups.get(datatype, {}), key = self._ranks.__getitem__)
+            self._ordered[datatype] = ordered
+        return list(ordered)
+
+
+@dataclasses.dataclass
+class ColumnProfile(object):
+    """Cached statistics for each column of a pandas DataFrame.
+
+    Each column is profiled with a single 'value_counts' pass, from which its
+    cardinality, null count, minimum, maximum, and mean (the rate of True
+    values for boolean columns) are derived. Columns are profiled in blocks
+    of 'block_size' columns by a pool of threads. Statistics are cached by
+    column name until 'invalidate' is called for the column, or until its
+    dtype, length, or values no longer match the cached entry. Values are
+    compared by an order-independent checksum of their hashes, which is much
+    cheaper than profiling the column again and detects changes made to
+    'data' in place (such as 'data.loc[0, name] = 100').
+
+    In approximate mode, columns are instead sketched 'chunk_size' rows at a
+    time with a 'ColumnSketch', so 'unique' is a HyperLogLog estimate and
+    'counts' holds estimated counts of only the most frequent values, and
+    minimum, maximum, and mean are reduced chunk by chunk. Columns with few
+    enough distinct values for the sketch to count them exactly get exact
+    entries. The sketch itself is kept in the profile for decisions which
+    need its error bounds. Exact entries are also used for approximate
+    requests, but not the reverse.
+
+    Args:
+        block_size (Optional[int]): number of columns profiled by each task.
+            Defaults to 64.
+        max_workers (Optional[int]): number of threads profiling blocks.
+            Defaults to None, meaning the 'concurrent.futures' default.
+        max_counts (Optional[int]): largest cardinality for which value counts
+            are kept in the profile. Statistics are still computed for
+            columns with more unique values, but their 'counts' are None.
+            Defaults to 10,000.
+        chunk_size (Optional[int]): number of rows sketched at a time in
+            approximate mode. Defaults to 1,000,000.
+        sketch_options (Optional[Dict[str, Any]]): arguments passed to
+            'ColumnSketch' in approximate mode, which set its error bounds.
+            Defaults to an empty dictionary.
+
+    """
+    block_size: Optional[int] = 64
+    max_workers: Optional[int] = None
+    max_counts: Optional[int] = 10_000
+    chunk_size: Optional[int] = 1_000_000
+    sketch_options: Optional[Dict[str, Any]] = dataclasses.field(
+        default_factory = dict)
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.statistics = {}
+        return self
+
+    """ Dunder Methods """
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.statistics
+
+    def __getitem__(self, item: str) -> Dict[str, Any]:
+        return self.statistics[item]
+
+    """ Private Methods """
+
+    def _profile_column(self, column: pd.Series) -> Dict[str, Any]:
+        """Returns statistics of 'column' from one pass over its values."""
+        counts = column.value_counts(dropna = True, sort = False)
+        count = int(counts.sum())
+        statistics = {
+            'dtype': str(column.dtype),
+            'length': len(column),
+            'count': count,
+            'nulls': len(column) - count,
+            'unique': len(counts),
+            'minimum': None,
+            'maximum': None,
+            'mean': None,
+            'counts': counts if len(counts) <= self.max_counts else None,
+            'sketch': None,
+            'approximate': False}
+        if count and (pd.api.types.is_numeric_dtype(column.dtype)
+                or pd.api.types.is_bool_dtype(column.dtype)):
+            values = counts.index.to_numpy(dtype = 'float64')
+            statistics['minimum'] = values.min()
+            statistics['maximum'] = values.max()
+            statistics['mean'] = float(
+                np.dot(values, counts.to_numpy(dtype = 'float64')) / count)
+        elif count and column.dtype.kind in ['M', 'm']:
+            statistics['minimum'] = counts.index.min()
+            statistics['maximum'] = counts.index.max()
+        return statistics
+
+    def _sketch_column(self, column: pd.Series) -> Dict[str, Any]:
+        """Returns approximate statistics of 'column' from a sketch."""
+        sketch = sketches.ColumnSketch(**self.sketch_options)
+        numeric = (pd.api.types.is_numeric_dtype(column.dtype)
+                   or pd.api.types.is_bool_dtype(column.dtype))
+        ordered = numeric or column.dtype.kind in ['M', 'm']
+        extremes = []
+        total = 0.0
+        # Reduces each chunk in place rather than copying the whole column.
+        for start in range(0, len(column), self.chunk_size):
+            chunk = column.iloc[start:start + self.chunk_size]
+            sketch.update(column = chunk)
+            if ordered:
+                extremes.extend([chunk.min(), chunk.max()])
+            if numeric:
+                total += float(chunk.sum())
+        extremes = [value for value in extremes if not pd.isna(value)]
+        statistics = {
+            'dtype': str(column.dtype),
+            'length': len(column),
+            'count': sketch.count,
+            'nulls': sketch.nulls,
+            'unique': sketch.unique(),
+            'minimum': None,
+            'maximum': None,
+            'mean': None,
+            'counts': sketch.heavy_hitters(),
+            'sketch': sketch,
+            'approximate': sketch.approximate}
+        if sketch.count and numeric:
+            statistics['minimum'] = float(min(extremes))
+            statistics['maximum'] = float(max(extremes))
+            statistics['mean'] = total / sketch.count
+        elif sketch.count and ordered:
+            statistics['minimum'] = min(extremes)
+            statistics['maximum'] = max(extremes)
+        return statistics
+
+    def _get_version(self, column: pd.Series) -> int:
+        """Returns checksum of the values in 'column'.
+
+        Hashes are summed (modulo 2 ** 64), so reordering rows, which does not
+        change any statistic, does not change the checksum.
+
+        """
+        hashes = pd.util.hash_pandas_object(column, index = False).to_numpy()
+        return int(hashes.sum(dtype = np.uint64))
+
+    def _profile_block(self,
+            data: pd.DataFrame,
+            columns: List[str],
+            approximate: bool) -> Dict[str, Dict[str, Any]]:
+        """Returns statistics for 'columns' in 'data'."""
+        if approximate:
+            method = self._sketch_column
+        else:
+            method = self._profile_column
+        statistics = {}
+        for name in columns:
+            column = data[name]
+            statistics[name] = method(column = column)
+            statistics[name]['version'] = self._get_version(column = column)
+        return statistics
+
+    def _is_current(self,
+            name: str,
+            column: pd.Series,
+            approximate: bool) -> bool:
+        """Returns whether the cached entry for 'column' is still valid."""
+        try:
+            statistics = self.statistics[name]
+        except KeyError:
+            return False
+        version = statistics['version']
+        return (statistics['dtype'] == str(column.dtype)
+                and statistics['length'] == len(column)
+                and (approximate or not statistics['approximate'])
+                and version == self._get_version(column = column))
+
+    """ Public Methods """
+
+    def invalidate(self,
+            columns: Optional[Union[List[str], str]] = None) -> None:
+        """Removes cached statistics for 'columns'.
+
+        Args:
+            columns (Optional[Union[List[str], str]]): columns to remove.
+                Defaults to None, meaning every column is removed.
+
+        """
+        if columns is None:
+            self.statistics = {}
+        else:
+            for name in _listify(columns):
+                self.statistics.pop(name, None)
+        return self
+
+    def update(self,
+            data: pd.DataFrame,
+            columns: Optional[Union[List[str], str]] = None,
+            approximate: Optional[bool] = False) -> None:
+        """Profiles columns of 'data' which are not cached.
+
+        Args:
+            data (pd.DataFrame): data to profile.
+            columns (Optional[Union[List[str], str]]): columns to profile.
+                Defaults to None, meaning every column is profiled.
+            approximate (Optional[bool]): whether sketches may be used
+                instead of exact statistics. Defaults to False.
+
+        Raises:
+            KeyError: if a column in 'columns' is not in 'data'.
+
+        """
+        if columns is None:
+            columns = list(data.columns)
+        missing = []
+        for name in _listify(columns):
+            try:
+                if not self._is_current(
+                        name = name,
+                        column = data[name],
+                        approximate = approximate):
+                    missing.append(name)
+            except KeyError:
+                raise KeyError(' '.join([name, 'is not in data']))
+        blocks = [
+            missing[start:start + self.block_size]
+            for start in range(0, len(missing), self.block_size)]
+        if len(blocks) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers = self.max_workers) as executor:
+                for statistics in executor.map(
+                        lambda block: self._profile_block(
+                            data = data,
+                            columns = block,
+                            approximate = approximate),
+                        blocks):
+                    self.statistics.update(statistics)
+        elif blocks:
+            self.statistics.update(self._profile_block(
+                data = data,
+                columns = blocks[0],
+                approximate = approximate))
+        return self
+
+    def report(self,
+            columns: Optional[Union[List[str], str]] = None) -> pd.DataFrame:
+        """Returns cached scalar statistics indexed by column.
+
+        Args:
+            columns (Optional[Union[List[str], str]]): columns to include.
+                Defaults to None, meaning every cached column is included.
+
+        """
+        if columns is None:
+            columns = list(self.statistics.keys())
+        return pd.DataFrame.from_dict(
+            {name: {key: value
+                    for key, value in self.statistics[name].items()
+                    if key not in ['counts', 'sketch', 'version']}
+             for name in _listify(columns)},
+            orient = 'index')
@@ -8,6 +8,7 @@
 
 import abc
 import dataclasses
+import functools
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 try:
@@ -59,10 +60,13 @@ class SimpleParallel(SimpleHandler):
         gpu (Optional[bool]): whether to use GPU cores, when possible, to
             parallelize operations (True) or to solely use CPU cores (False).
             Defaults to False.
+        max_workers (Optional[int]): maximum number of worker processes.
+            Defaults to None, which uses the number of CPU cores.
 
     """
     name: Optional[str] = None
     gpu: Optional[bool] = False
+    max_workers: Optional[int] = None
 
     """ Private Methods """
 
@@ -76,15 +80,19 @@ class SimpleParallel(SimpleHandler):
             return self._apply_cpu(process = process, data = data, **kwargs)
 
     def _apply_cpu(self, process: Callable, data: object, **kwargs) -> object:
-        """
+        """Applies 'process' to each item in 'data' in worker processes.
+
+        Args:
+            process (Callable): picklable callable applied to each item.
+            data (object): iterable of items to pass to 'process'.
+            kwargs: additional parameters passed to each 'process' call.
+
+        Returns:
+            List[Any]: results in the same order as 'data'.
 
         """
-        results = []
-        arguments = data
-        arguments.update(kwargs)
-        with mp.Pool() as pool:
-            results.append(pool.starmap(method, arguments))
-        pool.close()
+        with mp.Pool(processes = self.max_workers) as pool:
+            results = pool.map(functools.partial(process, **kwargs), data)
         return results
 
     """ Core siMpLify Methods """
@@ -6,10 +6,7 @@
 :license: Apache-2.0
 """
 
-
-from simplify.critic.critic import Anthology
-from simplify.critic.critic import Critic
-from simplify.critic.critic import Evaluators
+from simplify.lazy import make_lazy
 
 __version__ = '0.1.1'
 
@@ -19,3 +16,12 @@ __all__ = [
     'Anthology',
     'Critic',
     'Evaluators']
+
+# Public object names and the modules where they are located.
+_LAZY_OBJECTS = {
+    'Anthology': 'simplify.critic.critic',
+    'Critic': 'simplify.critic.critic',
+    'Evaluators': 'simplify.critic.critic'}
+
+
+__getattr__, __dir__ = make_lazy(package = __name__, objects = _LAZY_OBJECTS)
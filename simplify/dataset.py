@@ -7,9 +7,11 @@
 """
 
 import ast
-import collections.abc
+import collections
+import copy
 import dataclasses
 import datetime
+import json
 import pathlib
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
@@ -18,9 +20,133 @@ import pandas as pd
 
 import simplify
 from simplify import core
+from simplify.columns import ColumnProfile, DatatypeIndex
 from simplify.core import utilities
 
 
+def _get_buffers(values: Any) -> Dict[Tuple[int, int], int]:
+    """Returns sizes of the memory buffers holding 'values'.
+
+    Views are traced to the array which owns their memory, so that the
+    columns of one block, or a block shared by forks of a 'Dataset', have
+    the same key.
+
+    Args:
+        values (Any): array of a pandas Series.
+
+    Returns:
+        Dict[Tuple[int, int], int]: bytes of each buffer, keyed by the address
+            and size of the buffer.
+
+    """
+    buffers = {}
+    if isinstance(values, np.ndarray):
+        arrays = [values]
+    else:
+        # Pandas extension arrays keep their numpy arrays in these attributes.
+        arrays = [
+            getattr(values, name) for name in ['_ndarray', '_data', '_mask']
+            if isinstance(getattr(values, name, None), np.ndarray)]
+    for array in arrays:
+        while isinstance(array.base, np.ndarray):
+            array = array.base
+        buffers[(array.__array_interface__['data'][0], array.nbytes)] = (
+            array.nbytes)
+    if not arrays and hasattr(values, '_pa_array'):
+        for chunk in values._pa_array.chunks:
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    buffers[(buffer.address, buffer.size)] = buffer.size
+    elif not arrays:
+        buffers[(id(values), values.nbytes)] = values.nbytes
+    return buffers
+
+
+def copy_on_write() -> bool:
+    """Returns whether pandas copies shared blocks before modifying them.
+
+    Copy-on-write is always enabled from pandas 3.0 and may be enabled with
+    the 'mode.copy_on_write' option in pandas 2.x. The 'warn' value of that
+    option in pandas 2.2 only warns where results would change, so shared
+    blocks are still modified in place.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        mode = pd.get_option('mode.copy_on_write')
+    except (AttributeError, KeyError):
+        return False
+    return not mode in ['warn'] and bool(mode)
+
+
+def enable_copy_on_write() -> bool:
+    """Enables pandas copy-on-write, which 'Dataset.fork' relies on.
+
+    Returns:
+        bool: whether copy-on-write is enabled.
+
+    """
+    if not copy_on_write():
+        try:
+            pd.set_option('mode.copy_on_write', True)
+        except (AttributeError, KeyError):
+            pass
+    return copy_on_write()
+
+
+# Forks share column blocks with their parent only under copy-on-write.
+enable_copy_on_write()
+
+
+def account_memory(
+        datasets: Union[Dict[str, 'Dataset'], List['Dataset']]) -> pd.DataFrame:
+    """Reports how much memory 'datasets' hold and how much is shared.
+
+    Args:
+        datasets (Union[Dict[str, Dataset], List[Dataset]]): instances, such
+            as forks made by 'Dataset.fork', keyed by name.
+
+    Returns:
+        pd.DataFrame: for each instance, 'logical_bytes' is the size of all
+            of its data, 'own_bytes' is the size of the buffers which only it
+            holds, and 'shared_bytes' is the size of the buffers which other
+            instances also hold. The 'total' row counts each shared buffer
+            once, so its 'own_bytes' plus 'shared_bytes' is the memory
+            actually used.
+
+    """
+    if not isinstance(datasets, dict):
+        named = {}
+        for dataset in datasets:
+            name = '_'.join(
+                [dataset.name] + dataset.__dict__.get('lineage', []))
+            # Numbers instances which have the same name and lineage.
+            if name in named:
+                name = '_'.join([name, str(len(named))])
+            named[name] = dataset
+        datasets = named
+    buffers = {name: dataset.buffers() for name, dataset in datasets.items()}
+    holders = collections.Counter(
+        key for held in buffers.values() for key in held)
+    sizes = {}
+    for held in buffers.values():
+        sizes.update(held)
+    report = pd.DataFrame.from_dict(
+        {name: {
+            'logical_bytes': sum(held.values()),
+            'own_bytes': sum(
+                size for key, size in held.items() if holders[key] == 1)}
+         for name, held in buffers.items()},
+        orient = 'index',
+        columns = ['logical_bytes', 'own_bytes'])
+    report['shared_bytes'] = report['logical_bytes'] - report['own_bytes']
+    report.loc['total'] = [
+        report['logical_bytes'].sum(),
+        report['own_bytes'].sum(),
+        sum(size for key, size in sizes.items() if holders[key] > 1)]
+    return report
+
+
 @dataclasses.dataclass
 class Dataset(object):
     """Collection of associated pandas data objects.
@@ -65,6 +191,8 @@ class Dataset(object):
         self.types = DataTypes()
         self._initialize_datatypes()
         self.stages = DataStages(parent = self)
+        self.profiles = ColumnProfile()
+        self.lineage = []
         return self
 
     """ Factory and Validation Class Methods """
@@ -208,6 +336,15 @@ class Dataset(object):
                     raise KeyError(' '.join(
                         [attribute, 'is not in', self.__class__.__name__]))
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns attributes for pickling without calling '__getattr__'."""
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores pickled attributes without calling '__setattr__'."""
+        self.__dict__.update(state)
+        return
+
     def __setattr__(self,
             attribute: str,
             value: Union['DataBunch', pd.DataFrame, pd.Series]) -> None:
@@ -232,17 +369,35 @@ class Dataset(object):
         elif attribute in ['y_val']:
             self.__dict__['val_bunch'].y = value
         else:
+            # Replacing 'data' makes every cached column profile stale.
+            if attribute in ['data'] and 'profiles' in self.__dict__:
+                self.__dict__['profiles'].invalidate()
+            # Keeps 'datatypes' indexed by datatype.
+            elif (attribute in ['datatypes']
+                    and not isinstance(value, DatatypeIndex)):
+                value = DatatypeIndex(contents = value or {})
             self.__dict__[attribute] = value
 
     def __getitem__(self, item: str) -> pd.Series:
         return self.data[item]
 
     def __setitem__(self, item: str, value: pd.Series) -> None:
+        indexed = self._is_indexed()
         self.data[item] = value
+        self.profiles.invalidate(columns = item)
+        if indexed:
+            # New columns are appended, so earlier positions are unchanged.
+            for name in utilities.listify(item):
+                if name not in self._positions:
+                    self._positions[name] = len(self._positions)
+            self._indexed_columns = self.data.columns
         return self
 
     def __delitem__(self, item: str) -> None:
+        indexed = self._is_indexed()
         self.data.drop(item, axis = 'columns', inplace = True)
+        self.profiles.invalidate(columns = item)
+        self._remove_columns(columns = item, indexed = indexed)
         return self
 
     def __len__(self) -> int:
@@ -347,8 +502,7 @@ class Dataset(object):
             list of columns matching the passed 'datatype'.
 
         """
-        return [
-            key for key, value in self.datatypes.items() if value == datatype]
+        return self.datatypes.columns(datatype = datatype)
 
     def _get_indices(self, columns: Union[List[str], str]) -> List[bool]:
         """Gets column indices for a list of column names.
@@ -360,9 +514,90 @@ class Dataset(object):
         Returns:
             bool mask for columns matching 'columns'.
 
+        Raises:
+            KeyError: if a column in 'columns' is not in 'data'.
+
+        """
+        positions = self._get_positions()
+        return [positions[column] for column in utilities.listify(columns)]
+
+    def _get_positions(self) -> Dict[str, int]:
+        """Returns positions of columns in 'data', keyed by column name.
+
+        The positions are rebuilt only when the columns of 'data' have been
+        replaced by something other than 'Dataset' methods.
+
         """
+        if not self._is_indexed():
+            self._index_positions()
+        return self._positions
+
+    def _index_positions(self) -> None:
+        """Indexes positions of the current columns of 'data'."""
+        self._positions = {
+            name: position for position, name in enumerate(self.data.columns)}
+        self._indexed_columns = self.data.columns
+        return self
+
+    def _remove_columns(self,
+            columns: Union[List[str], str],
+            indexed: Optional[bool] = False) -> None:
+        """Removes dropped 'columns' from 'datatypes' and column positions.
+
+        Args:
+            columns (Union[List[str], str]): columns dropped from 'data'.
+            indexed (Optional[bool]): whether column positions were current
+                before 'columns' were dropped. If so, only positions after the
+                first dropped column are updated. Otherwise, positions are
+                rebuilt when they are next needed. Defaults to False.
+
+        """
+        columns = utilities.listify(columns)
+        for name in columns:
+            if name in self.datatypes:
+                del self.datatypes[name]
+        if indexed:
+            dropped = [
+                self._positions.pop(name) for name in columns
+                if name in self._positions]
+            # Dropping only shifts the positions of later columns.
+            if dropped:
+                first = min(dropped)
+                for position, name in enumerate(
+                        self.data.columns[first:], start = first):
+                    self._positions[name] = position
+            self._indexed_columns = self.data.columns
+        return self
+
+    def _is_indexed(self) -> bool:
+        """Returns whether column positions match the columns of 'data'."""
+        return self.__dict__.get('_indexed_columns') is self.data.columns
+
+    def _get_bunches(self) -> List['DataBunch']:
+        """Returns stored 'DataBunch' instances."""
         return [
-            self.data.columns.get_loc(column) for column in utilities.listify(columns)]
+            self.__dict__[name] for name in [
+                'full_bunch', 'train_bunch', 'test_bunch', 'val_bunch']
+            if name in self.__dict__]
+
+    def _get_stored(self) -> List[Union[pd.DataFrame, pd.Series]]:
+        """Returns stored pandas objects without materializing views."""
+        stored = [self.__dict__.get('data')]
+        for bunch in self._get_bunches():
+            stored.extend(
+                bunch.__dict__.get(attribute) for attribute in ['x', 'y'])
+        unique = {}
+        for item in stored:
+            if isinstance(item, (pd.DataFrame, pd.Series)):
+                unique[id(item)] = item
+        return list(unique.values())
+
+    def _get_feature_store(self,
+            folder: Optional[Union[str, pathlib.Path]] = None) -> 'FeatureStore':
+        """Returns 'FeatureStore' in 'folder' or the default folder."""
+        if folder is None:
+            folder = pathlib.Path(self.clerk['processed']).joinpath('features')
+        return FeatureStore(folder = folder, name = self.name)
 
     def _initialize_datatypes(self) -> None:
         """Initializes datatypes for stored pandas data object."""
@@ -408,6 +643,7 @@ class Dataset(object):
                 proxy_type = datatype,
                 column = self.data[name])
             self.datatypes[name] = datatype
+        self.profiles.invalidate(columns = columns)
         return self
 
     def create_xy(self,
@@ -443,19 +679,36 @@ class Dataset(object):
         self.stages.change('full')
         return self
 
-    def downcast(self, columns: Optional[Union[List[str], str]] = None) -> None:
+    def downcast(self,
+            columns: Optional[Union[List[str], str]] = None,
+            categorical_ratio: Optional[float] = 0.5) -> None:
         """Decreases memory usage by downcasting datatypes.
 
-        If 'columns' is not passed, all columns are downcast.
+        If 'columns' is not passed, all columns are downcast. A report of
+        memory usage before and after, by column, is stored in
+        'memory_report'.
 
         Args:
             columns (Optional[Union[List[str], str]]): columns to downcast.
+            categorical_ratio (Optional[float]): maximum ratio of unique values
+                to rows for a string column to become categorical. Defaults to
+                0.5.
 
         """
-        for name in self._check_columns(columns):
-            self.data[name] = self.types.downcast(
-                proxy_type = self.datatypes[name],
-                column = self.data[name])
+        if columns:
+            columns = self._check_columns(columns)
+            downcast, self.memory_report = self.types.downcast_frame(
+                data = self.data[columns],
+                categorical_ratio = categorical_ratio)
+            for name in columns:
+                self.data[name] = downcast[name]
+            self.profiles.invalidate(columns = columns)
+        else:
+            self.data, self.memory_report = self.types.downcast_frame(
+                data = self.data,
+                categorical_ratio = categorical_ratio)
+        self.datatypes.update(self.types.infer_frame(
+            dtypes = self.data.dtypes[self.memory_report.index]))
         return self
 
     def drop_columns(self,
@@ -467,9 +720,12 @@ class Dataset(object):
 
         """
         try:
+            indexed = self._is_indexed()
             self.data.drop(columns, axis = 'columns', inplace = True)
+            self._remove_columns(columns = columns, indexed = indexed)
         except TypeError:
             self.data.drop(columns, inplace = True)
+        self.profiles.invalidate(columns = columns)
         return self
 
     def get_series(self,
@@ -505,8 +761,126 @@ class Dataset(object):
                 datatype for.
 
         """
-        for name in self._check_columns(columns):
-            self.datatypes[name] = self.types.infer(column = self.data[name])
+        self.datatypes.update(self.types.infer_frame(
+            dtypes = self.data.dtypes[self._check_columns(columns)]))
+        return self
+
+    def profile(self,
+            columns: Optional[Union[List[str], str]] = None,
+            approximate: Optional[bool] = False) -> 'ColumnProfile':
+        """Returns 'profiles' after profiling any uncached 'columns'.
+
+        Statistics are computed once and reused until a column is changed
+        through 'Dataset' methods or its values no longer match the checksum
+        stored with its statistics.
+
+        Args:
+            columns (Optional[Union[List[str], str]]): columns to profile.
+                Defaults to None, meaning every column is profiled.
+            approximate (Optional[bool]): whether sketched statistics may be
+                used instead of exact ones. Defaults to False.
+
+        Raises:
+            KeyError: if a column in 'columns' is not in 'data'.
+
+        """
+        return self.profiles.update(
+            data = self.data,
+            columns = self._check_columns(columns),
+            approximate = approximate)
+
+    def buffers(self) -> Dict[Tuple[int, int], int]:
+        """Returns sizes of the memory buffers holding stored pandas data.
+
+        Unmaterialized 'DataBunch' views hold no buffers of their own.
+
+        Returns:
+            Dict[Tuple[int, int], int]: bytes of each buffer, keyed by the
+                address and size of the buffer.
+
+        """
+        buffers = {}
+        for stored in self._get_stored():
+            if isinstance(stored, pd.Series):
+                stored = stored.to_frame()
+            for _, column in stored.items():
+                buffers.update(_get_buffers(values = column.array))
+        return buffers
+
+    def fork(self, label: Optional[str] = None) -> 'Dataset':
+        """Returns a copy-on-write fork of this instance.
+
+        With pandas copy-on-write enabled (as it is when this module is
+        imported), pandas objects in the fork are shallow copies which share column
+        blocks with this instance, while datatypes, stages, and other
+        attributes are copied. A block is copied only when a technique
+        replaces or modifies it, so that each fork costs little more than its
+        metadata. Without copy-on-write, techniques could modify shared
+        blocks in place, so pandas objects are copied in full instead.
+
+        Args:
+            label (Optional[str]): name of the fork added to 'lineage'.
+                Defaults to None, meaning the fork is numbered.
+
+        Returns:
+            Dataset: fork of this instance.
+
+        """
+        # Objects in 'memo' are used in the fork in place of a deep copy.
+        memo = {}
+        for shared in [self.idea, self.clerk, self.types]:
+            memo[id(shared)] = shared
+        deep = not copy_on_write()
+        for stored in self._get_stored():
+            memo[id(stored)] = stored.copy(deep = deep)
+        for bunch in self._get_bunches():
+            if bunch.index is not None:
+                memo[id(bunch.index)] = bunch.index
+            if '_taken' in bunch.__dict__:
+                # Rows are taken again from the forked 'parent'.
+                memo[id(bunch._taken)] = {}
+        memo[id(self.profiles.statistics)] = dict(self.profiles.statistics)
+        self.__dict__['forks'] = self.__dict__.get('forks', 0) + 1
+        forked = copy.deepcopy(self, memo)
+        forked.forks = 0
+        forked.lineage = self.__dict__.get('lineage', []) + [
+            label or '_'.join(['fork', str(self.forks)])]
+        return forked
+
+    def load_features(self,
+            folder: Optional[Union[str, pathlib.Path]] = None,
+            mmap_mode: Optional[str] = 'c') -> None:
+        """Loads 'x' and 'y' of 'full_bunch' from a 'FeatureStore'.
+
+        Args:
+            folder (Optional[Union[str, pathlib.Path]]): folder of the store.
+                Defaults to None. If not passed, a 'features' subfolder of
+                the 'processed' folder in 'clerk' is used.
+            mmap_mode (Optional[str]): mode passed to 'np.load'. Defaults to
+                'c', so that loaded columns may be changed in memory.
+
+        """
+        x, y, datatypes = self._get_feature_store(folder = folder).load(
+            mmap_mode = mmap_mode)
+        self.full_bunch.x = x
+        self.full_bunch.y = y
+        self.datatypes.update(datatypes)
+        self.stages.change('full')
+        return self
+
+    def save_features(self,
+            folder: Optional[Union[str, pathlib.Path]] = None) -> None:
+        """Saves 'x' and 'y' of 'full_bunch' to a 'FeatureStore'.
+
+        Args:
+            folder (Optional[Union[str, pathlib.Path]]): folder of the store.
+                Defaults to None. If not passed, a 'features' subfolder of
+                the 'processed' folder in 'clerk' is used.
+
+        """
+        self._get_feature_store(folder = folder).save(
+            bunch = self.full_bunch,
+            datatypes = self.datatypes)
         return self
 
     def uniquify(self,
@@ -529,6 +903,7 @@ class Dataset(object):
         try:
             self.data[name] = range(1, len(self.data.index) + 1)
             self.datatypes.update({name: 'integer'})
+            self.profiles.invalidate(columns = name)
             if assign_index:
                 self.data.set_index(name, inplace = True)
         except (TypeError, AttributeError):
@@ -540,26 +915,108 @@ class Dataset(object):
 class DataBunch(object):
     """Stores one set of features and label.
 
+    A 'DataBunch' may also be a lazy view of the rows of a 'parent' instance.
+    A view stores only the 'index' positions of its rows. Its 'x' and 'y' are
+    taken from 'parent' the first time they are accessed and reused until
+    'parent' data is replaced or they are assigned, at which point the
+    assigned objects are stored like any other instance.
+
     Args:
         name (str): name used for internal referencing. This should usually be
             'training', 'testing', 'validation', or 'full'.
         x (Optional[pd.DataFrame]): feature/independent variables. Defaults to
             None.
         y (Optional[pd.Series]): label/dependent variables. Defaults to None.
+        parent (Optional[DataBunch]): instance which a view takes its rows
+            from. Defaults to None.
+        index (Optional[np.ndarray]): positions of the rows of 'parent' in a
+            view. Defaults to None.
 
     """
     name: str
     x: Optional[pd.DataFrame] = None
     y: Optional[pd.Series] = None
+    parent: Optional['DataBunch'] = dataclasses.field(
+        default = None,
+        repr = False)
+    index: Optional[np.ndarray] = dataclasses.field(
+        default = None,
+        repr = False)
 
     def __post_init__(self) -> None:
         """Creates initial attributes."""
-        if self.x is not None:
+        if self.parent is not None:
+            # Removes unassigned data so that '__getattribute__' takes it from
+            # 'parent'.
+            for attribute in ['x', 'y']:
+                if self.__dict__[attribute] is None:
+                    del self.__dict__[attribute]
+            # Rows taken from 'parent', keyed by attribute, with the parent
+            # object they were taken from.
+            self._taken = {}
+            self._start_columns = []
+        elif self.x is not None:
             self._start_columns = self.x.columns.values
         else:
             self._start_columns = []
         return self
 
+    """ Factory Method """
+
+    def view(self, name: str, index: np.ndarray) -> 'DataBunch':
+        """Returns lazy view of the rows of this instance at 'index'.
+
+        Args:
+            name (str): name of the returned instance.
+            index (np.ndarray): positions of rows to include in the view.
+
+        Returns:
+            DataBunch: which does not copy any data until it is accessed.
+
+        """
+        return DataBunch(name = name, parent = self, index = np.asarray(index))
+
+    """ Dunder Methods """
+
+    def __getattribute__(self, attribute: str) -> Any:
+        """Takes 'x' or 'y' rows from 'parent' for a view.
+
+        Taken rows are reused while 'parent' holds the same object, so each
+        fold is materialized once however often a technique reads it.
+
+        Args:
+            attribute (str): name of attribute sought.
+
+        Returns:
+            Any: rows at 'index' in 'parent' for an unassigned 'x' or 'y' of
+                a view, or else the stored attribute.
+
+        """
+        if attribute in ['x', 'y']:
+            contents = object.__getattribute__(self, '__dict__')
+            if attribute not in contents and '_taken' in contents:
+                data = getattr(contents['parent'], attribute)
+                if data is None:
+                    return None
+                taken = contents['_taken']
+                if attribute not in taken or taken[attribute][0] is not data:
+                    taken[attribute] = (data, data.take(contents['index']))
+                return taken[attribute][1]
+        return object.__getattribute__(self, attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        """Stores 'value' and frees rows taken for 'attribute'."""
+        if attribute in ['x', 'y']:
+            self.__dict__.get('_taken', {}).pop(attribute, None)
+        object.__setattr__(self, attribute, value)
+        return
+
+    """ Public Methods """
+
+    def is_view(self) -> bool:
+        """Returns whether 'x' or 'y' is still taken from 'parent'."""
+        return 'x' not in self.__dict__ or 'y' not in self.__dict__
+
     @property
     def dropped_columns(self) -> List[str]:
         """Returns list of dropped columns for 'x'.
@@ -573,6 +1030,265 @@ class DataBunch(object):
             return []
 
 
+@dataclasses.dataclass
+class FeatureStore(object):
+    """Memory-mapped NumPy store for the 'x' and 'y' of a 'DataBunch'.
+
+    Columns of 'x' are grouped by dtype and each group is saved as a
+    column-major '.npy' file, so that each column is contiguous on disk.
+    String, object, and categorical columns are stored as integer codes and
+    nullable pandas columns are stored as NumPy values with a separate
+    boolean mask. Column names, dtypes, categories, and proxy datatypes are
+    stored in a JSON sidecar so that loaded columns have their saved dtypes.
+    Loaded arrays are opened with 'np.memmap', so processes which load the
+    same store share one physical copy through the operating system page
+    cache.
+
+    Args:
+        folder (Union[str, pathlib.Path]): folder where the store is saved.
+        name (Optional[str]): prefix of the stored files. Defaults to
+            'features'.
+
+    """
+    folder: Union[str, pathlib.Path]
+    name: Optional[str] = 'features'
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.folder = pathlib.Path(self.folder)
+        return self
+
+    """ Private Methods """
+
+    def _make_path(self, suffix: str, extension: str = '.npy') -> pathlib.Path:
+        """Returns path of a stored file."""
+        return self.folder.joinpath(
+            ''.join(['_'.join([self.name, suffix]), extension]))
+
+    def _encode(self, column: pd.Series) -> Tuple[
+            np.ndarray, Optional[np.ndarray], Dict[str, Any]]:
+        """Returns values, missing value mask (if any), and sidecar entry."""
+        entry = {'dtype': str(column.dtype)}
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            categorical = column.array
+        elif (isinstance(column.dtype, pd.StringDtype)
+                or column.dtype == object):
+            categorical = pd.Categorical(column)
+        else:
+            categorical = None
+        if categorical is not None:
+            entry['categories'] = categorical.categories.tolist()
+            entry['ordered'] = bool(categorical.ordered)
+            return categorical.codes, None, entry
+        elif hasattr(column.dtype, 'numpy_dtype'):
+            # Nullable integer, boolean, and float columns.
+            values = column.to_numpy(
+                dtype = column.dtype.numpy_dtype,
+                na_value = 0)
+            return values, column.isna().to_numpy(), entry
+        elif isinstance(column.dtype, pd.api.extensions.ExtensionDtype):
+            entry['dtype'] = 'float64'
+            values = column.to_numpy(dtype = 'float64', na_value = np.nan)
+            return values, None, entry
+        else:
+            return column.to_numpy(), None, entry
+
+    def _decode(self,
+            values: np.ndarray,
+            mask: Optional[np.ndarray],
+            entry: Dict[str, Any]) -> Union[
+                np.ndarray, pd.api.extensions.ExtensionArray]:
+        """Reverses '_encode'."""
+        if 'categories' in entry:
+            categorical = pd.Categorical.from_codes(
+                values,
+                categories = entry['categories'],
+                ordered = entry['ordered'])
+            if entry['dtype'] == 'category':
+                return categorical
+            values = categorical.astype(object)
+            if entry['dtype'] == 'object':
+                return values
+            else:
+                return pd.array(
+                    values,
+                    dtype = pd.api.types.pandas_dtype(entry['dtype']))
+        elif mask is not None:
+            dtype = pd.api.types.pandas_dtype(entry['dtype'])
+            return dtype.construct_array_type()(values, mask)
+        else:
+            return values
+
+    def _load_name(self, name: Any) -> Any:
+        """Returns column or label 'name' as it was before JSON encoding."""
+        return tuple(name) if isinstance(name, list) else name
+
+    """ Public Methods """
+
+    def exists(self) -> bool:
+        """Returns whether a saved store is in 'folder'."""
+        return self._make_path(suffix = 'sidecar', extension = '.json').exists()
+
+    def save(self,
+            bunch: 'DataBunch',
+            datatypes: Optional[Dict[str, str]] = None) -> None:
+        """Saves 'x' and 'y' of 'bunch'.
+
+        Args:
+            bunch (DataBunch): instance with 'x' and, optionally, 'y'.
+            datatypes (Optional[Dict[str, str]]): proxy datatypes of the
+                columns. Defaults to None.
+
+        """
+        self.folder.mkdir(parents = True, exist_ok = True)
+        blocks = {}
+        entries = []
+        encoded = []
+        masks = {}
+        for position in range(bunch.x.shape[1]):
+            values, mask, entry = self._encode(
+                column = bunch.x.iloc[:, position])
+            encoded.append(values)
+            entries.append(entry)
+            if mask is not None:
+                masks[position] = mask
+            blocks.setdefault(values.dtype.str, []).append(position)
+        for i, (dtype, positions) in enumerate(blocks.items()):
+            block = np.empty(
+                (len(bunch.x), len(positions)),
+                dtype = np.dtype(dtype),
+                order = 'F')
+            for j, position in enumerate(positions):
+                block[:, j] = encoded[position]
+            np.save(self._make_path(suffix = ''.join(['x', str(i)])), block)
+        if masks:
+            np.save(
+                self._make_path(suffix = 'mask'),
+                np.column_stack(list(masks.values())))
+        sidecar = {
+            'columns': list(bunch.x.columns),
+            'blocks': list(blocks.values()),
+            'entries': entries,
+            'masks': list(masks.keys()),
+            'datatypes': [[k, v] for k, v in (datatypes or {}).items()],
+            'label': None,
+            'label_entry': None}
+        if bunch.y is not None:
+            values, mask, entry = self._encode(column = bunch.y)
+            np.save(self._make_path(suffix = 'y'), values)
+            if mask is not None:
+                np.save(self._make_path(suffix = 'y_mask'), mask)
+            sidecar['label'] = bunch.y.name
+            sidecar['label_entry'] = entry
+        if isinstance(bunch.x.index, pd.RangeIndex):
+            sidecar['index'] = [
+                bunch.x.index.start, bunch.x.index.stop, bunch.x.index.step]
+        else:
+            sidecar['index'] = None
+            np.save(
+                self._make_path(suffix = 'index'),
+                bunch.x.index.to_numpy(),
+                allow_pickle = False)
+        with open(self._make_path(suffix = 'sidecar', extension = '.json'),
+                  'w') as sidecar_file:
+            json.dump(sidecar, sidecar_file, default = str)
+        return self
+
+    def load(self,
+            mmap_mode: Optional[str] = 'c') -> Tuple[
+                pd.DataFrame, Optional[pd.Series], Dict[str, str]]:
+        """Opens the saved store.
+
+        If all columns of 'x' share a dtype and none are categorical, string,
+        or nullable, the returned DataFrame is backed directly by the memory
+        map. Otherwise, each block is memory-mapped and then combined.
+
+        Args:
+            mmap_mode (Optional[str]): mode passed to 'np.load'. Defaults to
+                'c', which shares pages between processes until a page is
+                written and keeps writes in memory instead of in the store.
+                Use 'r' to make the loaded arrays read-only.
+
+        Returns:
+            Tuple[pd.DataFrame, Optional[pd.Series], Dict[str, str]]: 'x',
+                'y', and proxy datatypes.
+
+        Raises:
+            FileNotFoundError: if no store has been saved in 'folder'.
+
+        """
+        if not self.exists():
+            raise FileNotFoundError(' '.join(
+                ['No feature store named', self.name, 'in', str(self.folder)]))
+        with open(self._make_path(suffix = 'sidecar', extension = '.json'),
+                  'r') as sidecar_file:
+            sidecar = json.load(sidecar_file)
+        if sidecar['index'] is None:
+            index = pd.Index(np.load(self._make_path(suffix = 'index')))
+        else:
+            index = pd.RangeIndex(*sidecar['index'])
+        if sidecar['masks']:
+            mask_block = np.load(
+                self._make_path(suffix = 'mask'),
+                mmap_mode = mmap_mode)
+            masks = {
+                position: mask_block[:, j]
+                for j, position in enumerate(sidecar['masks'])}
+        else:
+            masks = {}
+        entries = sidecar['entries']
+        frames = []
+        for i, positions in enumerate(sidecar['blocks']):
+            block = np.load(
+                self._make_path(suffix = ''.join(['x', str(i)])),
+                mmap_mode = mmap_mode)
+            if any('categories' in entries[p] or p in masks
+                   for p in positions):
+                frames.append(pd.DataFrame(
+                    {p: self._decode(
+                        values = block[:, j],
+                        mask = masks.get(p),
+                        entry = entries[p])
+                     for j, p in enumerate(positions)},
+                    index = index))
+            else:
+                frames.append(pd.DataFrame(
+                    block,
+                    index = index,
+                    columns = positions,
+                    copy = False))
+        if len(frames) == 1:
+            x = frames[0]
+        elif copy_on_write():
+            x = pd.concat(frames, axis = 'columns')
+        else:
+            x = pd.concat(frames, axis = 'columns', copy = False)
+        if list(x.columns) != list(range(len(entries))):
+            x = x[list(range(len(entries)))]
+        x.columns = pd.Index(
+            [self._load_name(name = c) for c in sidecar['columns']],
+            tupleize_cols = False)
+        if sidecar['label'] is None and not self._make_path(
+                suffix = 'y').exists():
+            y = None
+        else:
+            mask_path = self._make_path(suffix = 'y_mask')
+            y = pd.Series(
+                self._decode(
+                    values = np.load(
+                        self._make_path(suffix = 'y'),
+                        mmap_mode = mmap_mode),
+                    mask = (np.load(mask_path, mmap_mode = mmap_mode)
+                            if mask_path.exists() else None),
+                    entry = sidecar['label_entry']),
+                index = index,
+                name = self._load_name(name = sidecar['label']),
+                copy = False)
+        datatypes = {
+            self._load_name(name = k): v for k, v in sidecar['datatypes']}
+        return x, y, datatypes
+
+
 @dataclasses.dataclass
 class DataTypes(Container):
 
@@ -603,16 +1319,29 @@ class DataTypes(Container):
             'DatetimeTZDtype', 'IntervalDtype']
         self.proxies = {
             'float': ['float16', 'float32', 'float64', 'floating',
-                'complexfloating', 'complex64', 'complex128'],
+                'complexfloating', 'complex64', 'complex128', 'Float32',
+                'Float64'],
             'integer': ['int8', 'int16', 'int32', 'int64', 'Int64Dtype',
                 'uint8', 'uint16', 'uint32', 'uint64', 'integer',
-                'signedinteger', 'unsignedinteger', 'longlong', 'ulonglong'],
-            'boolean': ['BooleanDtype', bool, 'bool'],
-            'string': ['StringDtype', object, 'object_', 'object'],
-            'categorical': ['CategoricalDtype'],
+                'signedinteger', 'unsignedinteger', 'longlong', 'ulonglong',
+                'Int8', 'Int16', 'Int32', 'Int64', 'UInt8', 'UInt16',
+                'UInt32', 'UInt64'],
+            'boolean': ['BooleanDtype', bool, 'bool', 'boolean'],
+            'string': ['StringDtype', object, 'object_', 'object', 'string'],
+            'categorical': ['CategoricalDtype', 'category'],
             'list': [list],
-            'datetime': ['DatetimeTZDtype', 'datetime64', datetime],
-            'timedelta': ['IntervalDtype', 'timedelta64', timedelta]}
+            'datetime': ['DatetimeTZDtype', 'datetime64', datetime.datetime],
+            'timedelta': ['IntervalDtype', 'timedelta64',
+                datetime.timedelta]}
+        # Fallbacks for dtypes not named in 'proxies', by numpy 'kind'.
+        self._kinds = {
+            'b': 'boolean', 'i': 'integer', 'u': 'integer', 'f': 'float',
+            'c': 'float', 'O': 'string', 'U': 'string', 'S': 'string',
+            'M': 'datetime', 'm': 'timedelta'}
+        # Integer dtypes in the order they are tried when downcasting.
+        self._integer_widths = [
+            'uint8', 'int8', 'uint16', 'int16', 'uint32', 'int32', 'int64',
+            'uint64']
         return self
 
     def _create_inferables(self) -> None:
@@ -626,6 +1355,63 @@ class DataTypes(Container):
         self.defaults = {}
         return self
 
+    def _infer_dtype(self, dtype: Any) -> str:
+        """Returns proxy datatype for a numpy or pandas 'dtype'."""
+        try:
+            return self.inferables[dtype.name]
+        except (KeyError, AttributeError):
+            try:
+                return self._kinds[dtype.kind]
+            except (KeyError, AttributeError):
+                return 'string'
+
+    def _integer_dtype(self,
+            minimum: Union[int, float],
+            maximum: Union[int, float],
+            nullable: bool) -> Optional[str]:
+        """Returns smallest integer dtype holding 'minimum' to 'maximum'.
+
+        Args:
+            minimum (Union[int, float]): minimum of a column.
+            maximum (Union[int, float]): maximum of a column.
+            nullable (bool): whether the column has missing values, in which
+                case the nullable pandas dtype is used.
+
+        Returns:
+            Optional[str]: dtype name or None if no integer dtype holds both
+                'minimum' and 'maximum'.
+
+        """
+        for name in self._integer_widths:
+            info = np.iinfo(name)
+            # Python compares ints and floats exactly, unlike numpy.
+            if info.min <= minimum and maximum <= info.max:
+                if nullable:
+                    return name.replace('uint', 'UInt').replace('int', 'Int')
+                return name
+        return None
+
+    def _get_ranges(self,
+            data: pd.DataFrame) -> Dict[Any, Tuple[Any, Any]]:
+        """Returns minimum and maximum of each column as Python scalars.
+
+        Columns are reduced in groups of the same dtype so that uint64 and
+        int64 values are not rounded through a shared float64 result.
+
+        """
+        ranges = {}
+        for dtype in set(data.dtypes):
+            group = data.loc[:, data.dtypes == dtype]
+            minimums = group.min()
+            maximums = group.max()
+            for name in group.columns:
+                ranges[name] = (
+                    minimums[name].item() if hasattr(minimums[name], 'item')
+                    else minimums[name],
+                    maximums[name].item() if hasattr(maximums[name], 'item')
+                    else maximums[name])
+        return ranges
+
     """ Public Methods """
 
     def convert(self,
@@ -641,30 +1427,162 @@ class DataTypes(Container):
             proxy_type: str,
             column: pd.Series,
             raise_errors: Optional[bool] = False) -> pd.Series:
-        if raise_errors:
-            raise_errors = 'raise'
-        else:
-            raise_errors = 'ignore'
-        if proxy_type in ['list']:
-            return column.apply(lambda x: literal_eval(str(x)))
-        else:
-            for raw_type in self.proxies[proxy_type]:
-                if raw_type in self._numpy_types:
-                    raw_type = getattr(np, raw_type)
-                elif raw_type in self._pandas_types:
-                    raw_type = getattr(pd, raw_type)
-                try:
-                    column.astype(raw_type, copy = False, errors = raise_errors)
-                    break
-                except (ValueError, TypeError):
-                    pass
+        """Converts 'column' to the smallest dtype matching 'proxy_type'.
+
+        Args:
+            proxy_type (str): siMpLify proxy datatype.
+            column (pd.Series): data to convert.
+            raise_errors (Optional[bool]): whether to raise an error if
+                'column' cannot be converted (True) or return it unchanged
+                (False). Defaults to False.
+
+        Returns:
+            pd.Series: converted 'column'.
+
+        """
+        try:
+            if proxy_type in ['list']:
+                return column.apply(lambda x: ast.literal_eval(str(x)))
+            elif proxy_type in ['integer', 'float']:
+                column = pd.to_numeric(column)
+                if proxy_type in ['float']:
+                    column = column.astype('float64')
+                frame, _ = self.downcast_frame(
+                    data = column.to_frame(),
+                    integral_floats = proxy_type in ['integer'])
+                return frame.iloc[:, 0]
+            else:
+                for raw_type in self.proxies[proxy_type]:
+                    if raw_type in self._numpy_types:
+                        raw_type = getattr(np, raw_type)
+                    elif raw_type in self._pandas_types:
+                        raw_type = getattr(pd, raw_type)()
+                    try:
+                        return column.astype(raw_type)
+                    except (ValueError, TypeError):
+                        pass
+                raise TypeError(' '.join(
+                    ['column cannot be converted to', proxy_type]))
+        except (ValueError, TypeError):
+            if raise_errors:
+                raise
             return column
 
+    def downcast_frame(self,
+            data: pd.DataFrame,
+            categorical_ratio: Optional[float] = 0.5,
+            integral_floats: Optional[bool] = True,
+            lossy_floats: Optional[bool] = False) -> Tuple[
+                pd.DataFrame, pd.DataFrame]:
+        """Converts every column in 'data' to its smallest safe dtype.
+
+        Integer columns get the smallest integer width which holds both their
+        minimum and maximum, and keep their dtype if none does. Floats which
+        only hold whole numbers become integers if an integer dtype holds
+        their range, using nullable pandas dtypes if they have missing values.
+        Other float64 columns become float32 only if every value survives the
+        round trip, unless 'lossy_floats' is True. Strings become categories
+        if their share of unique values is below 'categorical_ratio' and
+        strings which are only True and False become nullable booleans.
+
+        Args:
+            data (pd.DataFrame): data to downcast.
+            categorical_ratio (Optional[float]): maximum ratio of unique values
+                to rows for a string column to become categorical. Defaults to
+                0.5.
+            integral_floats (Optional[bool]): whether floats which only hold
+                whole numbers should become integers. Defaults to True.
+            lossy_floats (Optional[bool]): whether float64 columns within the
+                float32 range should become float32 even if values lose
+                precision. Defaults to False.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: the downcast data and a report
+                indexed by column with dtypes and bytes before and after.
+
+        """
+        before = data.memory_usage(deep = True, index = False)
+        before_dtypes = data.dtypes
+        dtypes = {}
+        numeric = data.select_dtypes(include = ['number'])
+        numeric = numeric.loc[:, numeric.notna().any()]
+        if not numeric.empty:
+            ranges = self._get_ranges(data = numeric)
+            missing = numeric.isna().any()
+            floats = numeric.columns[[
+                self._infer_dtype(d) == 'float' for d in numeric.dtypes]]
+            integral = pd.Series(False, index = numeric.columns)
+            if integral_floats and len(floats):
+                integral[floats] = (
+                    (numeric[floats] % 1 == 0) | numeric[floats].isna()).all()
+            for name in numeric.columns[
+                    integral.to_numpy() | ~numeric.columns.isin(floats)]:
+                dtype = self._integer_dtype(
+                    minimum = ranges[name][0],
+                    maximum = ranges[name][1],
+                    nullable = bool(missing[name]))
+                if dtype is not None:
+                    dtypes[name] = dtype
+            wide = [
+                name for name in floats
+                if name not in dtypes and before_dtypes[name] == 'float64']
+            if wide:
+                limit = float(np.finfo('float32').max)
+                if lossy_floats:
+                    narrow = [
+                        name for name in wide
+                        if -limit <= ranges[name][0]
+                        and ranges[name][1] <= limit]
+                else:
+                    values = numeric[wide]
+                    lossless = (
+                        (values.astype('float32').astype('float64') == values)
+                        | values.isna()).all()
+                    narrow = list(lossless.index[lossless.to_numpy()])
+                dtypes.update({name: 'float32' for name in narrow})
+        strings = [
+            name for name, dtype in before_dtypes.items()
+            if pd.api.types.is_string_dtype(dtype)
+            and not isinstance(dtype, pd.CategoricalDtype)]
+        if strings:
+            unique = data[strings].nunique(dropna = True)
+            for name in strings:
+                if (0 < unique[name] <= 2 and data[name].dropna().isin(
+                        [True, False]).all()):
+                    dtypes[name] = 'boolean'
+                elif unique[name] <= categorical_ratio * len(data):
+                    dtypes[name] = 'category'
+        dtypes = {
+            k: v for k, v in dtypes.items() if str(before_dtypes[k]) != v}
+        if dtypes:
+            data = data.astype(dtypes)
+        after = data.memory_usage(deep = True, index = False)
+        report = pd.DataFrame({
+            'dtype_before': before_dtypes.astype(str),
+            'dtype_after': data.dtypes.astype(str),
+            'bytes_before': before,
+            'bytes_after': after})
+        report['reduction'] = 1 - report['bytes_after'] / report[
+            'bytes_before'].where(report['bytes_before'] > 0)
+        return data, report
+
     def infer(self, column: pd.Series) -> str:
-        try:
-            return self.inferables[column.dtype]
-        except KeyError:
-            return self.inferables[str(column.dtype)]
+        return self._infer_dtype(column.dtype)
+
+    def infer_frame(self, dtypes: pd.Series) -> Dict[str, str]:
+        """Returns proxy datatypes for a Series of dtypes.
+
+        Args:
+            dtypes (pd.Series): dtypes indexed by column, usually the 'dtypes'
+                attribute of a pandas DataFrame.
+
+        Returns:
+            Dict[str, str]: keys are column names and values are proxy
+                datatypes.
+
+        """
+        proxies = {dtype: self._infer_dtype(dtype) for dtype in set(dtypes)}
+        return {name: proxies[dtype] for name, dtype in dtypes.items()}
 
     def infer_and_downcast(self, column: pd.Series) -> Tuple[str, pd.Series]:
         proxy_type = self.infer(column = column)
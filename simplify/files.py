@@ -7,16 +7,24 @@
 """
 
 import collections.abc
+from concurrent import futures
+import contextlib
 import csv
 import dataclasses
 import datetime
 import pathlib
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import queue
+import threading
+import time
+from typing import (Any, Callable, ContextManager, Dict, Iterable, List,
+                    Optional, Tuple, Union)
+import warnings
 
 import pandas as pd
 
 from simplify.core import base
 from simplify.core import utilities
+from simplify.dataset import copy_on_write
 
 
 @dataclasses.dataclass
@@ -71,6 +79,17 @@ class Clerk(collections.abc.MutableMapping):
         # Injects attributes from 'idea'.
         self.idea_sections = ['files']
         self = self.idea.apply(instance = self)
+        # Uses columnar formats after the source stage unless 'idea' sets
+        # other formats.
+        for state_format, default in {
+                'source_format': 'csv',
+                'interim_format': 'parquet',
+                'final_format': 'parquet',
+                'compression': 'snappy',
+                'asynchronous_export': False,
+                'export_queue_size': 8}.items():
+            if not hasattr(self, state_format):
+                setattr(self, state_format, default)
         # Initializes internal 'folders' dictionary to which dunder access
         # methods are directed.
         self.folders = {}
@@ -194,8 +213,8 @@ class Clerk(collections.abc.MutableMapping):
             self.data_folder)
         self._write_folder(folder = self.folders['data'])
         for folder in self.data_subfolders:
-            self.folders['folder'] = self.folders['data'].joinpath(folder)
-            self._write_folder(folder = self.folders['folder'])
+            self.folders[folder] = self.folders['data'].joinpath(folder)
+            self._write_folder(folder = self.folders[folder])
         return self
 
     def _draft_file_formats(self) -> None:
@@ -213,7 +232,10 @@ class Clerk(collections.abc.MutableMapping):
                     'header',
                     'usecols',
                     'low_memory'],
-                test_size_parameter = 'nrows'),
+                test_size_parameter = 'nrows',
+                chunk_size_parameter = 'chunksize',
+                columns_parameter = 'usecols',
+                dtype_parameter = 'dtype'),
             'excel': FileFormat(
                 name = 'excel',
                 module = 'pandas',
@@ -221,14 +243,17 @@ class Clerk(collections.abc.MutableMapping):
                 import_method = 'read_excel',
                 export_method = 'to_excel',
                 additional_kwargs = ['index_col', 'header', 'usecols'],
-                test_size_parameter = 'nrows'),
+                test_size_parameter = 'nrows',
+                columns_parameter = 'usecols',
+                dtype_parameter = 'dtype'),
             'feather': FileFormat(
                 name = 'feather',
                 module = 'pandas',
                 extension = '.feather',
                 import_method = 'read_feather',
                 export_method = 'to_feather',
-                required = {'nthreads': -1}),
+                required = {'nthreads': -1},
+                columns_parameter = 'columns'),
             'hdf': FileFormat(
                 name = 'hdf',
                 module = 'pandas',
@@ -236,7 +261,9 @@ class Clerk(collections.abc.MutableMapping):
                 import_method = 'read_hdf',
                 export_method = 'to_hdf',
                 additional_kwargs = ['columns'],
-                test_size_parameter = 'chunksize'),
+                test_size_parameter = 'chunksize',
+                chunk_size_parameter = 'chunksize',
+                columns_parameter = 'columns'),
             'json': FileFormat(
                 name = 'json',
                 module = 'pandas',
@@ -244,14 +271,27 @@ class Clerk(collections.abc.MutableMapping):
                 import_method = 'read_json',
                 export_method = 'to_json',
                 additional_kwargs = ['encoding', 'columns'],
-                test_size_parameter = 'nrows'),
+                test_size_parameter = 'nrows',
+                dtype_parameter = 'dtype'),
+            'parquet': FileFormat(
+                name = 'parquet',
+                module = 'pandas',
+                extension = '.parquet',
+                import_method = 'read_parquet',
+                export_method = 'to_parquet',
+                required = {'engine': 'pyarrow'},
+                columns_parameter = 'columns',
+                dictionary_parameter = 'read_dictionary',
+                import_kwargs = ['columns', 'filters'],
+                export_kwargs = ['compression']),
             'stata': FileFormat(
                 name = 'stata',
                 module = 'pandas',
                 extension = '.dta',
                 import_method = 'read_stata',
                 export_method = 'to_stata',
-                test_size_parameter = 'chunksize'),
+                test_size_parameter = 'chunksize',
+                chunk_size_parameter = 'chunksize'),
             'text': FileFormat(
                 name = 'text',
                 module = None,
@@ -417,11 +457,37 @@ class Clerk(collections.abc.MutableMapping):
 
     """ File Input/Output Methods """
 
+    def close(self) -> None:
+        """Writes pending asynchronous exports and stops background writers.
+
+        Every exporter is closed even if another fails, and the first failure
+        is raised afterwards.
+
+        """
+        failure = None
+        for exporter in ['data_exporter', 'results_exporter']:
+            if hasattr(self, exporter):
+                try:
+                    getattr(self, exporter).close()
+                except OSError as error:
+                    failure = failure or error
+        if failure is not None:
+            raise failure
+        return self
+
+    def flush(self) -> None:
+        """Blocks until pending asynchronous exports have been written."""
+        for exporter in ['data_exporter', 'results_exporter']:
+            if hasattr(self, exporter):
+                getattr(self, exporter).flush()
+        return self
+
     def load(self,
             file_path: Optional[Union[str, pathlib.Path]] = None,
             folder: Optional[Union[str, pathlib.Path]] = None,
             file_name: Optional[str] = None,
             file_format: Optional[Union[str, 'FileFormat']] = None,
+            sample_size: Optional[int] = None,
             **kwargs) -> Any:
         """Imports file by calling appropriate method based on file_format.
 
@@ -438,6 +504,8 @@ class Clerk(collections.abc.MutableMapping):
             file_format (Optional[Union[str, 'FileFormat']]): object with
                 information about how the file should be loaded or the key to
                 such an object stored in 'clerk'. Defaults to None
+            sample_size (Optional[int]): number of rows to import, if only a
+                sample is wanted. Defaults to None.
             **kwargs: can be passed if additional options are desired specific
                 to the pandas or python method used internally.
 
@@ -455,6 +523,7 @@ class Clerk(collections.abc.MutableMapping):
                 folder = folder,
                 file_name = file_name,
                 file_format = file_format,
+                sample_size = sample_size,
                 **kwargs)
 
     def save(self,
@@ -560,13 +629,17 @@ class Clerk(collections.abc.MutableMapping):
             root_folder = self.data_folder,
             folders = self.export_folders,
             file_format_states = self.export_format_states,
-            file_names = self.export_file_names)
+            file_names = self.export_file_names,
+            asynchronous = self.asynchronous_export,
+            queue_size = self.export_queue_size)
         self.results_importer = Importer(
             clerk = self,
             root_folder = self.data_folder)
         self.results_exporter = Exporter(
             clerk = self,
-            root_folder = self.results_folder)
+            root_folder = self.results_folder,
+            asynchronous = self.asynchronous_export,
+            queue_size = self.export_queue_size)
         return self
 
 
@@ -583,8 +656,8 @@ class SimpleDistributor(ABC):
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
-        # Creates 'pathlib.Pathifier' instance for dynamic path creation.
-        self.pathifier = pathlib.Pathifier(
+        # Creates 'Pathifier' instance for dynamic path creation.
+        self.pathifier = Pathifier(
             clerk = self.clerk,
             distributor = self)
         return self
@@ -593,27 +666,31 @@ class SimpleDistributor(ABC):
 
     def _check_kwargs(self,
             file_format: 'FileFormat',
-            passed_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            passed_kwargs: Dict[str, Any],
+            variables: Optional[List[str]] = None) -> Dict[str, Any]:
         """Selects kwargs for particular methods.
 
-        If a needed argument was not passed, default values are used.
+        If a needed argument was not passed, the matching attribute of
+        'clerk' (usually set from 'idea') is used, if it exists.
 
         Args:
             file_format ('FileFormat'): an instance with information about
                 additional kwargs to search for.
             passed_kwargs (Dict[str, Any]): kwargs passed to method.
+            variables (Optional[List[str]]): names of kwargs to search for.
+                Defaults to None. If not passed, 'additional_kwargs' of
+                'file_format' is used.
 
         Returns:
             Dict[str, Any]: kwargs with only relevant parameters.
 
         """
         new_kwargs = passed_kwargs
-        for variable in file_format.addtional_kwargs:
+        if variables is None:
+            variables = file_format.additional_kwargs or []
+        for variable in variables:
             if not variable in passed_kwargs:
-                if variable in self.clerk.default_kwargs:
-                    new_kwargs.update(
-                        {variable: self.clerk.default_kwargs[variable]})
-                elif hasattr(self.clerk, variable):
+                if hasattr(self.clerk, variable):
                     new_kwargs.update(
                         {variable: getattr(self.clerk, variable)})
         return new_kwargs
@@ -664,6 +741,63 @@ class SimpleDistributor(ABC):
         return parameters
 
 
+def _open_reader(reader: Iterable) -> ContextManager:
+    """Returns a context manager which closes chunked 'reader' on exit.
+
+    Readers which are not context managers are closed with their 'close'
+    method.
+
+    Args:
+        reader (Iterable): object returned by an import method in chunks.
+
+    Returns:
+        ContextManager: which returns 'reader' on entry.
+
+    """
+    if hasattr(reader, '__enter__'):
+        return reader
+    else:
+        return contextlib.closing(reader)
+
+
+def _import_file(
+        tool: Callable,
+        file_path: pathlib.Path,
+        parameters: Dict[str, Any],
+        dtypes: Dict[str, str]) -> Dict[str, Any]:
+    """Imports one file of a batch, recording its timing or failure.
+
+    This is a module-level function so that it can be sent to process pools.
+
+    Args:
+        tool (Callable): import method.
+        file_path (pathlib.Path): path of file to import.
+        parameters (Dict[str, Any]): parameters passed to 'tool'.
+        dtypes (Dict[str, str]): pandas dtypes applied after import.
+
+    Returns:
+        Dict[str, Any]: with the imported 'data' (or None), 'rows', 'seconds',
+            and any 'error' message.
+
+    """
+    start = time.perf_counter()
+    try:
+        data = tool(file_path, **parameters)
+        dtypes = {k: v for k, v in dtypes.items() if k in data.columns}
+        if dtypes:
+            data = data.astype(dtypes)
+        error = None
+    except Exception as exception:
+        data = None
+        error = ': '.join([exception.__class__.__name__, str(exception)])
+    return {
+        'file_path': str(file_path),
+        'data': data,
+        'rows': 0 if data is None else len(data),
+        'seconds': time.perf_counter() - start,
+        'error': error}
+
+
 @dataclasses.dataclass
 class Importer(SimpleDistributor):
     """Manages file importing for siMpLify.
@@ -685,6 +819,9 @@ class Importer(SimpleDistributor):
         file_names (Optional[Dict[str, str]]): mapping with keys of Project
             states and values of default file names. Defaults to an empty
             dictionary.
+        memory_budget (Optional[int]): approximate maximum bytes of each
+            chunk when importing in chunks without a 'chunk_size'. Defaults to
+            256 megabytes.
 
     """
     clerk: 'Clerk'
@@ -695,9 +832,446 @@ class Importer(SimpleDistributor):
         default_factory = dict)
     file_names: Optional[Dict[str, str]] = dataclasses.field(
         default_factory = dict)
+    memory_budget: Optional[int] = 256_000_000
+
+    """ Private Methods """
+
+    def _make_dtypes(self,
+            datatypes: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Converts siMpLify proxy datatypes to pandas dtypes.
+
+        Values which are not proxy datatypes are assumed to already be pandas
+        dtypes and are used as passed.
+
+        Args:
+            datatypes (Optional[Dict[str, str]]): keys are column names and
+                values are proxy datatypes or pandas dtypes.
+
+        Returns:
+            Dict[str, str]: keys are column names and values are pandas
+                dtypes.
+
+        """
+        proxies = {
+            'boolean': 'boolean',
+            'float': 'float64',
+            'integer': 'Int64',
+            'categorical': 'category',
+            'string': 'object',
+            'datetime': 'datetime64[ns]',
+            'timedelta': 'timedelta64[ns]'}
+        dtypes = {}
+        for column, datatype in (datatypes or {}).items():
+            if datatype in ['list']:
+                continue
+            dtypes[column] = proxies.get(datatype, datatype)
+        return dtypes
+
+    def _make_chunk_size(self,
+            tool: Callable,
+            file_path: pathlib.Path,
+            file_format: 'FileFormat',
+            parameters: Dict[str, Any],
+            dtypes: Dict[str, str],
+            sample_size: Optional[int] = 1000) -> int:
+        """Estimates the rows per chunk which fit in 'memory_budget'.
+
+        Args:
+            tool (Callable): import method.
+            file_path (pathlib.Path): path of file to import.
+            file_format ('FileFormat'): instance with information about the
+                file format.
+            parameters (Dict[str, Any]): parameters passed to 'tool', with any
+                parser dtypes already added.
+            dtypes (Dict[str, str]): pandas dtypes applied to each chunk after
+                it is parsed.
+            sample_size (Optional[int]): rows read to measure the memory used
+                per row. Defaults to 1000.
+
+        Returns:
+            int: number of rows per chunk. If the file has no rows,
+                'sample_size' is returned.
+
+        """
+        sample = dict(parameters)
+        sample[file_format.chunk_size_parameter] = sample_size
+        with _open_reader(tool(file_path, **sample)) as reader:
+            chunk = next(iter(reader), None)
+        if chunk is None:
+            return sample_size
+        chunk = self._apply_dtypes(data = chunk, dtypes = dtypes)
+        row_bytes = chunk.memory_usage(deep = True).sum() / max(len(chunk), 1)
+        return max(1, int(self.memory_budget // max(row_bytes, 1)))
+
+    def _make_parameters(self,
+            file_format: 'FileFormat',
+            **kwargs) -> Dict[str, Any]:
+        """Creates complete parameters for an import method.
+
+        Args:
+            file_format ('FileFormat'): an instance with information about the
+                needed and optional parameters.
+            kwargs: additional parameters to pass to an import method.
+
+        Returns:
+            Dict[str, Any]: parameters, including 'import_kwargs' of
+                'file_format', to be passed to an import method.
+
+        """
+        parameters = super()._make_parameters(
+            file_format = file_format,
+            **kwargs)
+        if file_format.import_kwargs:
+            parameters = self._check_kwargs(
+                file_format = file_format,
+                passed_kwargs = parameters,
+                variables = file_format.import_kwargs)
+        return parameters
+
+    def _project_columns(self,
+            file_format: 'FileFormat',
+            parameters: Dict[str, Any],
+            datatypes: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Limits import to the columns in 'datatypes'.
+
+        If 'file_format' supports it, columns with a 'categorical' datatype
+        are also imported as dictionary-encoded categoricals.
+
+        Args:
+            file_format ('FileFormat'): instance with information about the
+                file format.
+            parameters (Dict[str, Any]): parameters for the import method.
+            datatypes (Optional[Dict[str, str]]): keys are column names and
+                values are proxy datatypes or pandas dtypes.
+
+        Returns:
+            Dict[str, Any]: 'parameters' with any projection added.
+
+        """
+        if datatypes:
+            if (file_format.columns_parameter
+                    and file_format.columns_parameter not in parameters):
+                parameters[file_format.columns_parameter] = list(
+                    datatypes.keys())
+            if (file_format.dictionary_parameter
+                    and file_format.dictionary_parameter not in parameters):
+                categoricals = [
+                    k for k, v in datatypes.items()
+                    if v in ['categorical', 'category']]
+                if categoricals:
+                    parameters[file_format.dictionary_parameter] = categoricals
+        return parameters
+
+    def _parse_dtypes(self,
+            file_format: 'FileFormat',
+            parameters: Dict[str, Any],
+            dtypes: Dict[str, str]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Moves 'dtypes' which the parser can set into 'parameters'.
+
+        Columns parsed directly into their dtypes avoid a second conversion
+        of every column after import. Datetime and timedelta dtypes cannot be
+        set by pandas parsers and are left to be converted after import.
+
+        Args:
+            file_format ('FileFormat'): instance with information about the
+                file format.
+            parameters (Dict[str, Any]): parameters for the import method.
+                Dtypes already passed in them take precedence.
+            dtypes (Dict[str, str]): keys are column names and values are
+                pandas dtypes.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, str]]: 'parameters' with parser
+                dtypes added and the dtypes to convert after import.
+
+        """
+        if not file_format.dtype_parameter or not dtypes:
+            return parameters, dtypes
+        parsed = {
+            k: v for k, v in dtypes.items()
+            if not str(v).startswith(('datetime', 'timedelta'))}
+        parameters = dict(parameters)
+        parameters[file_format.dtype_parameter] = dict(
+            parsed,
+            **(parameters.get(file_format.dtype_parameter) or {}))
+        return parameters, {k: v for k, v in dtypes.items() if k not in parsed}
+
+    def _apply_dtypes(self,
+            data: pd.DataFrame,
+            dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Converts columns in 'data' which are in 'dtypes'."""
+        dtypes = {k: v for k, v in dtypes.items() if k in data.columns}
+        if dtypes:
+            return data.astype(dtypes)
+        else:
+            return data
+
+    def _share_categories(self,
+            data: pd.DataFrame,
+            categories: Dict[str, pd.Index]) -> pd.DataFrame:
+        """Recodes categorical columns in 'data' to categories seen so far.
+
+        New categories are appended to 'categories' in order of first
+        appearance, so the categories of each chunk extend those of earlier
+        chunks and a category has the same code in every chunk.
+
+        Args:
+            data (pd.DataFrame): chunk with categorical columns.
+            categories (Dict[str, pd.Index]): keys are column names and values
+                are categories seen in earlier chunks, or None if no chunk has
+                been seen. It is updated in place.
+
+        Returns:
+            pd.DataFrame: with categorical columns recoded.
+
+        """
+        for column in [c for c in categories if c in data.columns]:
+            values = data[column].astype('category')
+            seen = categories[column]
+            if seen is None:
+                seen = values.cat.categories
+            else:
+                seen = seen.append(values.cat.categories.difference(
+                    seen,
+                    sort = False))
+            categories[column] = seen
+            data[column] = values.cat.set_categories(seen)
+        return data
+
+    def _take_sample(self,
+            imported: Any,
+            sample_size: int) -> Any:
+        """Returns the first 'sample_size' rows of 'imported'.
+
+        Formats without a parameter for the number of rows are imported in
+        full and sliced. Formats which sample with their chunk size parameter
+        return a reader, so its first chunk is read and the reader is closed.
+
+        Args:
+            imported (Any): object returned by an import method.
+            sample_size (int): number of rows to keep.
+
+        Returns:
+            Any: the first rows of 'imported', or an empty DataFrame if a
+                reader has no rows.
+
+        """
+        if isinstance(imported, (pd.DataFrame, pd.Series)):
+            return imported.iloc[:sample_size]
+        elif hasattr(imported, '__enter__') or hasattr(imported, 'close'):
+            with _open_reader(imported) as reader:
+                return next(iter(reader), pd.DataFrame())
+        else:
+            return imported
 
     """ Public Methods """
 
+    def feed(self,
+            consumers: List[Callable],
+            **kwargs) -> int:
+        """Passes each chunk from 'stream' to every item in 'consumers'.
+
+        Consumers are called with each chunk in order and can be anything
+        which updates incrementally, such as a summary's 'update' method, a
+        model's 'partial_fit' wrapped in a function, or an exporter.
+
+        Args:
+            consumers (List[Callable]): callables which accept a chunk.
+            kwargs: passed to 'stream'.
+
+        Returns:
+            int: total number of rows imported.
+
+        """
+        rows = 0
+        for chunk in self.stream(**kwargs):
+            for consumer in consumers:
+                consumer(chunk)
+            rows += len(chunk)
+        return rows
+
+    def stream(self,
+            file_path: Optional[Union[str, pathlib.Path]] = None,
+            folder: Optional[Union[str, pathlib.Path]] = None,
+            file_name: Optional[str] = None,
+            file_format: Optional[Union[str, 'FileFormat']] = None,
+            chunk_size: Optional[int] = None,
+            datatypes: Optional[Dict[str, str]] = None,
+            **kwargs) -> Iterable[pd.DataFrame]:
+        """Yields typed chunks of a file without importing the whole file.
+
+        If 'chunk_size' is not passed, it is estimated from a sample so that
+        each chunk uses about 'memory_budget' bytes after 'datatypes' are
+        applied. Only the current chunk is held in memory. Dtypes are set by
+        the parser when 'file_format' supports it. Categorical columns share
+        categories across chunks, with categories in order of first
+        appearance, so a category has the same code in every chunk.
+
+        Args:
+            file_path (Optional[Union[str, pathlib.Path]]): a complete file
+                path. Defaults to None.
+            folder (Optional[Union[str, pathlib.Path]]): a complete folder path
+                or the name of a folder stored in 'clerk'. Defaults to None.
+            file_name (Optional[str]): file name without extension. Defaults to
+                None.
+            file_format (Optional[Union[str, 'FileFormat']]): object with
+                information about how the file should be loaded or the key to
+                such an object stored in 'clerk'. Defaults to None
+            chunk_size (Optional[int]): number of rows in each chunk. Defaults
+                to None.
+            datatypes (Optional[Dict[str, str]]): keys are column names and
+                values are proxy datatypes (as in 'Dataset.datatypes') or
+                pandas dtypes applied to each chunk. If passed, only these
+                columns are imported. Defaults to None.
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas method used internally.
+
+        Yields:
+            pd.DataFrame: each chunk of the file.
+
+        Raises:
+            TypeError: if 'file_format' does not support chunked import.
+
+        """
+        file_format = self._check_file_format(file_format = file_format)
+        if not file_format.chunk_size_parameter:
+            raise TypeError(' '.join(
+                [file_format.name, 'does not support chunked import']))
+        file_path = self.pathifier.apply(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            file_format = file_format)
+        tool = file_format.load('import_method')
+        parameters = self._make_parameters(file_format = file_format, **kwargs)
+        parameters = self._project_columns(
+            file_format = file_format,
+            parameters = parameters,
+            datatypes = datatypes)
+        dtypes = self._make_dtypes(datatypes = datatypes)
+        categories = {k: None for k, v in dtypes.items() if v in ['category']}
+        parameters, dtypes = self._parse_dtypes(
+            file_format = file_format,
+            parameters = parameters,
+            dtypes = dtypes)
+        if chunk_size is None:
+            chunk_size = self._make_chunk_size(
+                tool = tool,
+                file_path = file_path,
+                file_format = file_format,
+                parameters = parameters,
+                dtypes = dtypes)
+        parameters[file_format.chunk_size_parameter] = chunk_size
+        with _open_reader(tool(file_path, **parameters)) as reader:
+            for chunk in reader:
+                chunk = self._apply_dtypes(data = chunk, dtypes = dtypes)
+                yield self._share_categories(
+                    data = chunk,
+                    categories = categories)
+
+    def import_batch(self,
+            folder: Optional[Union[str, pathlib.Path]] = None,
+            file_format: Optional[Union[str, 'FileFormat']] = None,
+            include_subfolders: Optional[bool] = True,
+            datatypes: Optional[Dict[str, str]] = None,
+            max_workers: Optional[int] = None,
+            use_processes: Optional[bool] = False,
+            raise_errors: Optional[bool] = False,
+            **kwargs) -> pd.DataFrame:
+        """Imports and combines every matching file in 'folder' in parallel.
+
+        Files are read by a thread pool (or a process pool if
+        'use_processes' is True) and one dtype schema from 'datatypes' is
+        applied to each. Categorical columns are converted once, after the
+        files are combined, so that their categories are shared. The files are
+        combined in path order with a single concatenation. A report of rows,
+        seconds, and errors for each file is stored in 'batch_report'.
+
+        Args:
+            folder (Optional[Union[str, pathlib.Path]]): path of folder or
+                string corresponding to class attribute with path. Defaults to
+                None.
+            file_format (Optional[Union[str, 'FileFormat']]): file format name
+                or a FileFormat instance. Defeaults to None.
+            include_subfolders (Optional[bool]): whether to include files in
+                subfolders. Defaults to True
+            datatypes (Optional[Dict[str, str]]): keys are column names and
+                values are proxy datatypes (as in 'Dataset.datatypes') or
+                pandas dtypes. Defaults to None.
+            max_workers (Optional[int]): maximum number of threads or
+                processes. Defaults to None, which uses the 'concurrent'
+                default.
+            use_processes (Optional[bool]): whether to use processes instead of
+                threads. Threads work well for pandas parsers which release
+                the GIL. Defaults to False.
+            raise_errors (Optional[bool]): whether to raise an error if any
+                file fails to import (True) or to drop it with a warning and
+                record it in 'batch_report' (False). Defaults to False.
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas method used internally.
+
+        Returns:
+            pd.DataFrame: combined data from every imported file.
+
+        Raises:
+            ValueError: if 'raise_errors' is True and a file fails to import.
+
+        """
+        file_format = self._check_file_format(file_format = file_format)
+        file_paths = sorted(self.make_batch(
+            folder = folder,
+            file_format = file_format,
+            include_subfolders = include_subfolders))
+        tool = file_format.load('import_method')
+        parameters = self._make_parameters(file_format = file_format, **kwargs)
+        parameters = self._project_columns(
+            file_format = file_format,
+            parameters = parameters,
+            datatypes = datatypes)
+        dtypes = self._make_dtypes(datatypes = datatypes)
+        # Categoricals are converted after files are combined, so that every
+        # file shares the same categories.
+        categoricals = {k: v for k, v in dtypes.items() if v in ['category']}
+        dtypes = {k: v for k, v in dtypes.items() if k not in categoricals}
+        parameters, dtypes = self._parse_dtypes(
+            file_format = file_format,
+            parameters = parameters,
+            dtypes = dtypes)
+        if use_processes:
+            executor = futures.ProcessPoolExecutor(max_workers = max_workers)
+        else:
+            executor = futures.ThreadPoolExecutor(max_workers = max_workers)
+        with executor:
+            results = list(executor.map(
+                _import_file,
+                [tool] * len(file_paths),
+                file_paths,
+                [parameters] * len(file_paths),
+                [dtypes] * len(file_paths)))
+        self.batch_report = pd.DataFrame(
+            [{k: v for k, v in r.items() if k != 'data'} for r in results],
+            columns = ['file_path', 'rows', 'seconds', 'error'])
+        failures = self.batch_report[self.batch_report['error'].notna()]
+        if not failures.empty:
+            message = ' '.join(
+                [str(len(failures)), 'of', str(len(results)),
+                 'files failed to import, first:',
+                 failures['file_path'].iloc[0], failures['error'].iloc[0]])
+            if raise_errors:
+                raise ValueError(message)
+            else:
+                warnings.warn(' '.join(
+                    [message, '(dropped, see batch_report)']))
+        frames = [r['data'] for r in results if r['data'] is not None]
+        if not frames:
+            return pd.DataFrame()
+        data = pd.concat(frames, ignore_index = True)
+        categoricals = {
+            k: v for k, v in categoricals.items() if k in data.columns}
+        if categoricals:
+            data = data.astype(categoricals)
+        return data
+
     def load(self, **kwargs):
         """Calls 'apply' method with **kwergs."""
         return self.apply(**kwargs)
@@ -726,10 +1300,10 @@ class Importer(SimpleDistributor):
         folder = folder or self.clerk[self.folders[self.clerk.stage]]
         file_format = self._check_file_format(file_format = file_format)
         if include_subfolders:
-            return pathlib.Path(folder).rglob('.'.join(
+            return pathlib.Path(folder).rglob(''.join(
                 ['*', file_format.extension]))
         else:
-            return pathlib.Path(folder).glob('.'.join(
+            return pathlib.Path(folder).glob(''.join(
                 ['*', file_format.extension]))
 
     # def iterate_batch(self,
@@ -769,6 +1343,8 @@ class Importer(SimpleDistributor):
             folder: Optional[Union[str, pathlib.Path]] = None,
             file_name: Optional[str] = None,
             file_format: Optional[Union[str, 'FileFormat']] = None,
+            sample_size: Optional[int] = None,
+            datatypes: Optional[Dict[str, str]] = None,
             **kwargs) -> Any:
         """Imports file by calling appropriate method based on file_format.
 
@@ -785,6 +1361,15 @@ class Importer(SimpleDistributor):
             file_format (Optional[Union[str, 'FileFormat']]): object with
                 information about how the file should be loaded or the key to
                 such an object stored in 'clerk'. Defaults to None
+            sample_size (Optional[int]): number of rows to import, if only a
+                sample is wanted. Formats without a parameter for the number
+                of rows, such as parquet and feather, are imported in full and
+                sliced. Defaults to None.
+            datatypes (Optional[Dict[str, str]]): keys are column names and
+                values are proxy datatypes (as in 'Dataset.datatypes') or
+                pandas dtypes. If passed and 'file_format' supports it, only
+                these columns are imported and they are parsed into matching
+                dtypes. Defaults to None.
             **kwargs: can be passed if additional options are desired specific
                 to the pandas or python method used internally.
 
@@ -804,9 +1389,24 @@ class Importer(SimpleDistributor):
         else:
             tool = getattr(self, file_format.import_method)
         parameters = self._make_parameters(file_format = file_format, **kwargs)
+        if sample_size and file_format.test_size_parameter:
+            parameters[file_format.test_size_parameter] = sample_size
+        parameters = self._project_columns(
+            file_format = file_format,
+            parameters = parameters,
+            datatypes = datatypes)
+        parameters, dtypes = self._parse_dtypes(
+            file_format = file_format,
+            parameters = parameters,
+            dtypes = self._make_dtypes(datatypes = datatypes))
+        imported = tool(file_path, **parameters)
         if sample_size:
-            parameters[file_format.sample_size_parameter] = sample_size
-        return tool(file_path, **parameters)
+            imported = self._take_sample(
+                imported = imported,
+                sample_size = sample_size)
+        if isinstance(imported, pd.DataFrame):
+            imported = self._apply_dtypes(data = imported, dtypes = dtypes)
+        return imported
 
 
 @dataclasses.dataclass
@@ -830,6 +1430,12 @@ class Exporter(SimpleDistributor):
         file_names (Optional[Dict[str, str]]): mapping with keys of Project
             states and values of default file names. Defaults to an empty
             dictionary.
+        asynchronous (Optional[bool]): whether 'apply' should hand objects to
+            a background writer and return immediately (True) or write them
+            before returning (False). Defaults to False.
+        queue_size (Optional[int]): maximum number of objects waiting to be
+            written when 'asynchronous' is True. 'apply' blocks while the
+            queue is full. Defaults to 8.
 
     """
     clerk: 'Clerk' = None
@@ -840,6 +1446,34 @@ class Exporter(SimpleDistributor):
         default_factory = dict)
     file_names: Optional[Dict[str, str]] = dataclasses.field(
         default_factory = dict)
+    asynchronous: Optional[bool] = False
+    queue_size: Optional[int] = 8
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        super().__post_init__()
+        self.errors = []
+        self._queue = None
+        self._writer = None
+        return self
+
+    """ Dunder Methods """
+
+    def __enter__(self) -> 'Exporter':
+        """Returns self so that pending writes are flushed on exit."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Writes every pending object and stops the background writer."""
+        self.close()
+        return
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns picklable state without the background writer."""
+        state = self.__dict__.copy()
+        state['_queue'] = None
+        state['_writer'] = None
+        return state
 
     """ Private Methods """
 
@@ -858,11 +1492,64 @@ class Exporter(SimpleDistributor):
 
         """
         # Checks whether True/False should be exported in data files. If
-        # 'boolean_out' is set to False, 1/0 are used instead.
+        # 'boolean_out' is set to False, 1/0 are used instead. Only boolean
+        # columns are converted and the passed object is not modified.
         if not self.clerk.boolean_out:
-            data.replace({True: 1, False: 0}, inplace = True)
+            if isinstance(data, pd.Series):
+                if pd.api.types.is_bool_dtype(data.dtype):
+                    data = data.astype(self._integer_for(data.dtype))
+            elif isinstance(data, pd.DataFrame):
+                booleans = data.select_dtypes(include = ['bool', 'boolean'])
+                if not booleans.empty:
+                    data = data.astype({
+                        c: self._integer_for(d)
+                        for c, d in booleans.dtypes.items()})
         return data
 
+    def _integer_for(self, dtype: Any) -> str:
+        """Returns integer dtype for a numpy or nullable boolean 'dtype'."""
+        if dtype == bool:
+            return 'int8'
+        else:
+            return 'Int8'
+
+    def _start_writer(self) -> None:
+        """Starts background writer thread, if it is not running."""
+        if self._writer is None or not self._writer.is_alive():
+            self._queue = queue.Queue(maxsize = self.queue_size)
+            self._writer = threading.Thread(
+                target = self._write_queue,
+                name = 'simplify-exporter',
+                daemon = True)
+            self._writer.start()
+        return self
+
+    def _write(self,
+            tool: Callable,
+            variable: Any,
+            file_path: pathlib.Path,
+            file_format: 'FileFormat',
+            parameters: Dict[str, Any]) -> None:
+        """Writes 'variable' to 'file_path' with 'tool'."""
+        # Changes boolean values to 1/0 if 'boolean_out' is False.
+        if file_format.module in ['pandas']:
+            variable = self._check_boolean_out(data = variable)
+        tool(variable, file_path, **parameters)
+        return self
+
+    def _write_queue(self) -> None:
+        """Writes queued objects until a None sentinel is received."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(**item)
+            except Exception as exception:
+                self.errors.append((item['file_path'], exception))
+            finally:
+                self._queue.task_done()
+
     """ Public Methods """
 
     # def initialize_writer(self,
@@ -893,6 +1580,34 @@ class Exporter(SimpleDistributor):
     # def iterate_writer(self):
     #     return self
 
+    def close(self) -> None:
+        """Flushes pending writes and stops the background writer."""
+        try:
+            self.flush()
+        finally:
+            if self._writer is not None and self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join()
+            self._writer = None
+        return self
+
+    def flush(self) -> None:
+        """Blocks until every queued object has been written.
+
+        Raises:
+            OSError: if any queued object failed to be written. The failures
+                are listed in the message and 'errors' is cleared.
+
+        """
+        if self._queue is not None:
+            self._queue.join()
+        if self.errors:
+            errors, self.errors = self.errors, []
+            raise OSError(' '.join(
+                [str(len(errors)), 'exports failed:', '; '.join(
+                    ': '.join([str(p), repr(e)]) for p, e in errors)]))
+        return self
+
     def save(self, **kwargs):
         """Calls 'apply' method with **kwargs."""
         return self.apply(**kwargs)
@@ -911,6 +1626,13 @@ class Exporter(SimpleDistributor):
         If needed arguments are not passed, default values are used. If
         file_path is passed, folder and file_name are ignored.
 
+        If 'asynchronous' is True, the path and parameters are resolved now
+        but 'variable' is written by a background thread. pandas objects are
+        snapshotted first (a copy-on-write reference where pandas supports it
+        and a deep copy otherwise), so later changes to 'variable' are not
+        written. Other objects should not be modified afterwards. 'flush' or
+        'close' should be called before the written file is needed.
+
         Args:
             variable (Any): object to be save to disk.
             file_path (Optional[Union[str, pathlib.Path]]): a complete file
@@ -932,15 +1654,30 @@ class Exporter(SimpleDistributor):
             folder = folder,
             file_name = file_name,
             file_format = file_format)
-        # Changes boolean values to 1/0 if 'boolean_out' is False.
-        if file_format.module in ['pandas']:
-            variable = self._check_boolean_out(data = variable)
         if file_format.module:
             tool = file_format.load('export_method')
         else:
             tool = getattr(self, file_format.export_method)
         parameters = self._make_parameters(file_format = file_format, **kwargs)
-        tool(variable, file_path, **parameters)
+        if file_format.export_kwargs:
+            parameters = self._check_kwargs(
+                file_format = file_format,
+                passed_kwargs = parameters,
+                variables = file_format.export_kwargs)
+        item = {
+            'tool': tool,
+            'variable': variable,
+            'file_path': file_path,
+            'file_format': file_format,
+            'parameters': parameters}
+        if self.asynchronous:
+            if isinstance(variable, (pd.DataFrame, pd.Series)):
+                item['variable'] = variable.copy(deep = not copy_on_write())
+            # Blocks while the queue is full, which bounds pending memory.
+            self._start_writer()
+            self._queue.put(item)
+        else:
+            self._write(**item)
         return self
 
 
@@ -1078,6 +1815,23 @@ class FileFormat(SimpleComponent):
         test_size_parameter (Optional[str]): the name of the parameter for
             loading a sample of data for the particular import method. Defaults
             to None.
+        chunk_size_parameter (Optional[str]): the name of the parameter for
+            importing data in chunks with the particular import method.
+            Defaults to None, which means chunked import is not supported.
+        columns_parameter (Optional[str]): the name of the parameter for
+            importing only some columns with the particular import method.
+            Defaults to None.
+        dictionary_parameter (Optional[str]): the name of the parameter for
+            importing columns as dictionary-encoded categoricals with the
+            particular import method. Defaults to None.
+        dtype_parameter (Optional[str]): the name of the parameter for
+            setting column dtypes while parsing with the particular import
+            method. Defaults to None, which means dtypes are converted after
+            import.
+        import_kwargs (Optional[List[str]]): names of commonly used kwargs
+            only for the import method. Defaults to None.
+        export_kwargs (Optional[List[str]]): names of commonly used kwargs
+            only for the export method. Defaults to None.
 
     """
 
@@ -1090,4 +1844,10 @@ class FileFormat(SimpleComponent):
     additional_kwargs: Optional[List[str]] = None
     required: Optional[Dict[str, Any]] = None
     test_size_parameter: Optional[str] = None
+    chunk_size_parameter: Optional[str] = None
+    columns_parameter: Optional[str] = None
+    dictionary_parameter: Optional[str] = None
+    dtype_parameter: Optional[str] = None
+    import_kwargs: Optional[List[str]] = None
+    export_kwargs: Optional[List[str]] = None
 
@@ -0,0 +1,60 @@
+"""
+.. module:: lazy
+:synopsis: deferred imports of public package attributes
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def make_lazy(
+        package: str,
+        objects: Dict[str, str],
+        subpackages: Optional[List[str]] = None) -> Tuple[
+            Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns module '__getattr__' and '__dir__' functions for 'package'.
+
+    Public objects and subpackages are imported the first time they are
+    accessed (PEP 562) and then stored in the package namespace, so later
+    access does not call '__getattr__' again.
+
+    Args:
+        package (str): '__name__' of the package.
+        objects (Dict[str, str]): keys are public object names and values are
+            absolute module names or module names relative to 'package'.
+        subpackages (Optional[List[str]]): names of subpackages which are
+            imported when accessed as attributes. Defaults to None.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: '__getattr__'
+            and '__dir__' for the package module.
+
+    """
+    subpackages = subpackages or []
+
+    def __getattr__(name: str) -> Any:
+        """Imports and returns public object or subpackage 'name'.
+
+        Raises:
+            AttributeError: if 'name' is not a public object or subpackage.
+
+        """
+        if name in objects:
+            value = getattr(
+                importlib.import_module(objects[name], package), name)
+        elif name in subpackages:
+            value = importlib.import_module('.'.join([package, name]))
+        else:
+            raise AttributeError(f'module {package} has no attribute {name}')
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        """Returns module attributes including those not yet imported."""
+        namespace = vars(importlib.import_module(package))
+        return sorted(set(namespace) | set(objects) | set(subpackages))
+
+    return __getattr__, __dir__
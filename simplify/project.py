@@ -6,9 +6,14 @@
 :license: Apache-2.0
 """
 
+import copy
 import dataclasses
+import hashlib
 import importlib
+import json
+import os
 import pathlib
+import pickle
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import warnings
 
@@ -68,6 +73,10 @@ class Project(core.SimpleProject):
         auto_apply (Optional[bool]): whether to call the 'apply' method when
             instanced. For auto_apply to have an effect, 'dataset' must also
             be passed. Defaults to False.
+        checkpoint (Optional[bool]): whether to save the products of each
+            worker in 'apply' and resume from the last stage whose settings
+            and inputs are unchanged (True) or to always apply every worker
+            (False). Defaults to False.
 
     """
     idea: Optional[simplify.Idea] = None
@@ -93,6 +102,7 @@ class Project(core.SimpleProject):
     auto_draft: Optional[bool] = True
     auto_publish: Optional[bool] = True
     auto_apply: Optional[bool] = False
+    checkpoint: Optional[bool] = False
 
     def __post_init__(self) -> None:
         """Initializes class attributes and calls selected methods."""
@@ -238,15 +248,52 @@ class Project(core.SimpleProject):
             kwargs: any other parameters to pass to the 'apply' method of a
                 'Scholar' instance.
 
+        If 'checkpoint' is True, the 'Dataset', 'Book', and results of each
+        worker are saved after it is applied. On later calls, workers are
+        skipped up to the last stage whose settings, 'kwargs', input data,
+        siMpLify version, and siMpLify source code match a saved checkpoint.
+
         """
         # Assigns 'data' to 'dataset' attribute and validates it.
         if data:
             self.dataset = simplify.Dataset(data = data, idea = self.idea)
-        for name, worker in self.workers.items():
-            self.results[name] = worker.apply(
+        names = list(self.workers.keys())
+        start = 0
+        if self.checkpoint:
+            checkpoints = Checkpoints(
+                folder = pathlib.Path(self.clerk['interim']).joinpath(
+                    'checkpoints', self.name))
+            keys = checkpoints.chain(
                 data = self.dataset,
-                library = self.library,
+                stages = [self._stage_settings(name = n) for n in names],
                 **kwargs)
+            start = checkpoints.resume(names = names, keys = keys)
+            if start:
+                for name, key in zip(names[:start], keys[:start]):
+                    self.library[name], self.results[name] = checkpoints.load(
+                        name = name, key = key)
+                self.dataset = checkpoints.load_dataset(
+                    name = names[start - 1],
+                    key = keys[start - 1],
+                    idea = self.idea,
+                    clerk = self.clerk)
+        try:
+            for index, name in enumerate(names[start:], start = start):
+                self.results[name] = self.workers[name].apply(
+                    data = self.dataset,
+                    library = self.library,
+                    **kwargs)
+                if self.checkpoint:
+                    checkpoints.save(
+                        name = name,
+                        key = keys[index],
+                        dataset = self.dataset,
+                        book = self.library[name],
+                        results = self.results[name])
+        finally:
+            # Writes any asynchronous exports, even if a worker failed, so
+            # that output files are complete and writer threads are stopped.
+            self.clerk.close()
         return self
 
     def load(self,
@@ -356,6 +403,51 @@ class Project(core.SimpleProject):
 
     """ Private Methods """
 
+    def _stage_settings(self, name: str) -> Dict[str, Dict[str, Any]]:
+        """Returns sections of 'idea' which affect worker 'name'.
+
+        The 'general' section and the section named 'name' are always
+        included. A '_parameters' section is included if its prefix is the
+        name of a step or technique selected in the section named 'name'
+        (the values of its '_steps' and '_techniques' options and the steps
+        named in its '_techniques' options). Sections which match no worker
+        are assigned to the first worker so that changing them invalidates
+        every stage.
+
+        Args:
+            name (str): key of a worker in 'workers'.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: keys are section names and values are
+                the settings in those sections.
+
+        """
+        names = list(self.workers.keys())
+        sections = {
+            section: dict(values) for section, values in self.idea.items()}
+        options = {}
+        for worker in names:
+            selected = set()
+            for key, value in sections.get(worker, {}).items():
+                key = str(key)
+                if key.endswith('_techniques'):
+                    selected.add(key[:-len('_techniques')])
+                if key.endswith(('_steps', '_techniques')):
+                    values = value if isinstance(value, list) else str(
+                        value).split(',')
+                    selected.update(str(v).strip() for v in values)
+            options[worker] = selected
+        selected = {'general': sections.get('general', {}),
+                    name: sections.get(name, {})}
+        for section, values in sections.items():
+            if section.endswith('_parameters'):
+                prefix = section[:-len('_parameters')]
+                owners = [w for w in names if prefix in options[w]]
+                if (name in owners
+                        or (not owners and names and name == names[0])):
+                    selected[section] = values
+        return selected
+
     def _validate_options(self,
                 workers: Optional[List[str]]) -> core.SimpleRepository:
         """Creates 'options' either from 'workers' or default options.
@@ -447,6 +539,212 @@ class Package(core.SimpleLoader):
             return super().load(attribute = 'instructions')
 
 
+@dataclasses.dataclass
+class Checkpoints(object):
+    """Saved products of each stage of 'Project.apply'.
+
+    Each stage is keyed by a hash of its settings chained to the key of the
+    prior stage, so a changed setting invalidates its stage and every later
+    stage while earlier stages can still be loaded. The first key also
+    includes 'version', so upgrading or editing siMpLify invalidates every
+    stage. Objects are stored with pickle and a 'manifest.json' file maps
+    stage names to keys. The shared 'idea' and 'clerk' of a 'Dataset' are
+    not stored.
+
+    Args:
+        folder (Union[str, pathlib.Path]): folder where checkpoints are
+            stored.
+        version (Optional[str]): identifies the code which produced the
+            checkpoints. Defaults to None. If not passed, a hash of the
+            siMpLify version and the source files of the siMpLify package is
+            used.
+
+    """
+    folder: Union[str, pathlib.Path]
+    version: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.folder = pathlib.Path(self.folder)
+        self.folder.mkdir(parents = True, exist_ok = True)
+        self.manifest_path = self.folder.joinpath('manifest.json')
+        if self.version is None:
+            self.version = self._code_version()
+        try:
+            with open(self.manifest_path, 'r') as manifest:
+                self.manifest = json.load(manifest)
+        except (FileNotFoundError, ValueError):
+            self.manifest = {}
+        return self
+
+    """ Private Methods """
+
+    def _code_version(self) -> str:
+        """Returns hash of the siMpLify version and package source files."""
+        digest = hashlib.sha256(simplify.__version__.encode())
+        package = pathlib.Path(simplify.__file__).parent
+        for file_path in sorted(package.rglob('*.py')):
+            digest.update(file_path.relative_to(package).as_posix().encode())
+            digest.update(file_path.read_bytes())
+        return digest.hexdigest()
+
+    def _fingerprint(self, data: Any) -> str:
+        """Returns hash of the pandas objects or file path in 'data'."""
+        digest = hashlib.sha256()
+        if isinstance(data, simplify.Dataset):
+            objects = [data.data]
+            if data.data is None:
+                objects.extend([
+                    getattr(data, 'x', None), getattr(data, 'y', None)])
+        else:
+            objects = [data]
+        for item in objects:
+            if isinstance(item, (pd.DataFrame, pd.Series)):
+                digest.update(pd.util.hash_pandas_object(
+                    item, index = True).values.tobytes())
+                digest.update(str(getattr(
+                    item, 'dtypes', getattr(item, 'dtype', None))).encode())
+            elif isinstance(item, np.ndarray):
+                digest.update(str((item.shape, item.dtype)).encode())
+                digest.update(np.ascontiguousarray(item).tobytes())
+            else:
+                digest.update(str(item).encode())
+        return digest.hexdigest()
+
+    def _paths(self, name: str) -> Tuple[pathlib.Path, pathlib.Path]:
+        """Returns paths of stored book/results and dataset for 'name'."""
+        return (self.folder.joinpath(f'{name}.pickle'),
+                self.folder.joinpath(f'{name}_dataset.pickle'))
+
+    def _write(self, item: Any, file_path: pathlib.Path) -> None:
+        """Pickles 'item' to a temporary file and moves it to 'file_path'."""
+        temporary = file_path.with_suffix('.tmp')
+        with open(temporary, 'wb') as stored:
+            pickle.dump(item, stored, protocol = pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, file_path)
+        return self
+
+    """ Public Methods """
+
+    def chain(self,
+            data: Any,
+            stages: List[Dict[str, Any]],
+            **kwargs) -> List[str]:
+        """Returns a key for each stage chained to the keys before it.
+
+        Args:
+            data (Any): input data for the first stage.
+            stages (List[Dict[str, Any]]): settings for each stage.
+            kwargs: parameters passed to every stage.
+
+        Returns:
+            List[str]: hexadecimal keys in the order of 'stages'.
+
+        """
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(self._fingerprint(data = data).encode())
+        key = digest.hexdigest()
+        keys = []
+        for settings in stages:
+            digest = hashlib.sha256(key.encode())
+            digest.update(json.dumps(
+                [settings, kwargs], sort_keys = True, default = str).encode())
+            key = digest.hexdigest()
+            keys.append(key)
+        return keys
+
+    def resume(self, names: List[str], keys: List[str]) -> int:
+        """Returns number of leading stages with valid checkpoints.
+
+        Args:
+            names (List[str]): names of the stages in order.
+            keys (List[str]): keys returned by 'chain'.
+
+        Returns:
+            int: index of the first stage which must be applied.
+
+        """
+        count = 0
+        for name, key in zip(names, keys):
+            if (self.manifest.get(name) == key
+                    and all(p.exists() for p in self._paths(name = name))):
+                count += 1
+            else:
+                break
+        return count
+
+    def load(self, name: str, key: str) -> Tuple[Any, Any]:
+        """Returns stored book and results for stage 'name'.
+
+        Raises:
+            KeyError: if 'key' does not match the stored key for 'name'.
+
+        """
+        if self.manifest.get(name) != key:
+            raise KeyError(f'no valid checkpoint for {name}')
+        with open(self._paths(name = name)[0], 'rb') as stored:
+            return pickle.load(stored)
+
+    def load_dataset(self,
+            name: str,
+            key: str,
+            idea: Optional['Idea'] = None,
+            clerk: Optional['Clerk'] = None) -> 'Dataset':
+        """Returns stored 'Dataset' after stage 'name'.
+
+        Args:
+            name (str): name of the stage.
+            key (str): key of the stage returned by 'chain'.
+            idea (Optional['Idea']): shared 'Idea' instance of the current
+                project to attach to the 'Dataset'. Defaults to None.
+            clerk (Optional['Clerk']): shared 'Clerk' instance of the current
+                project to attach to the 'Dataset'. Defaults to None.
+
+        Raises:
+            KeyError: if 'key' does not match the stored key for 'name'.
+
+        """
+        if self.manifest.get(name) != key:
+            raise KeyError(f'no valid checkpoint for {name}')
+        with open(self._paths(name = name)[1], 'rb') as stored:
+            dataset = pickle.load(stored)
+        dataset.__dict__.update({'idea': idea, 'clerk': clerk})
+        return dataset
+
+    def save(self,
+            name: str,
+            key: str,
+            dataset: 'Dataset',
+            book: Any,
+            results: Any) -> None:
+        """Stores products of stage 'name' and drops later stages.
+
+        Args:
+            name (str): name of the stage.
+            key (str): key of the stage returned by 'chain'.
+            dataset ('Dataset'): data after the stage was applied.
+            book (Any): 'Book' for the stage in the project 'library'.
+            results (Any): value returned by the stage.
+
+        """
+        names = list(self.manifest.keys())
+        if name in names:
+            names = names[:names.index(name)]
+        self.manifest = {n: self.manifest[n] for n in names}
+        book_path, dataset_path = self._paths(name = name)
+        self._write(item = (book, results), file_path = book_path)
+        # Shared project objects are reattached by 'load_dataset'.
+        dataset = copy.copy(dataset)
+        dataset.__dict__.update({'idea': None, 'clerk': None})
+        self._write(item = dataset, file_path = dataset_path)
+        self.manifest[name] = key
+        temporary = self.manifest_path.with_suffix('.tmp')
+        with open(temporary, 'w') as manifest:
+            json.dump(self.manifest, manifest, indent = 2)
+        os.replace(temporary, self.manifest_path)
+        return self
+
+
 DEFAULT_PACKAGES = core.SimpleRepository(
     name = 'default_packages',
     contents = {
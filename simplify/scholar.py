@@ -7,8 +7,12 @@
 """
 
 import collections.abc
+from concurrent import futures
+import copy
 import dataclasses
 import importlib
+from multiprocessing import shared_memory
+import random
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 try:
@@ -23,18 +27,405 @@ from simplify.core import base
 from simplify.core import utilities
 
 
+""" Process Worker Functions """
+
+# State stored in each worker process by '_initialize_worker'.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _initialize_worker(
+        method: Callable,
+        template: 'Dataset',
+        x: 'SharedFrame',
+        y: Optional['SharedFrame'],
+        seed: Optional[int]) -> None:
+    """Stores shared objects in a worker process once, when it starts.
+
+    Args:
+        method (Callable): method which applies a 'Chapter' to a 'Dataset'.
+        template ('Dataset'): instance without 'x' and 'y'.
+        x ('SharedFrame'): shared features.
+        y (Optional['SharedFrame']): shared label.
+        seed (Optional[int]): base random seed.
+
+    """
+    template.x = x.attach()
+    if y is not None:
+        template.y = y.attach()
+    _WORKER_STATE['method'] = method
+    _WORKER_STATE['template'] = template
+    # Returned data refers to unchanged shared columns instead of copying.
+    _WORKER_STATE['sources'] = {'x': template.x, 'y': template.y}
+    _WORKER_STATE['seed'] = seed
+    # Keeps handles so that the shared blocks stay mapped.
+    _WORKER_STATE['shared'] = (x, y)
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+    return
+
+
+def _apply_chapter(index: int, chapter: 'Chapter') -> 'Chapter':
+    """Applies 'chapter' to a copy-on-write fork of the shared data.
+
+    The random state is reseeded from the base seed and 'index' so that
+    results do not depend upon which worker applies which chapter. Columns of
+    the returned data which are still the shared columns are replaced with
+    references, so only changed columns and fitted techniques are pickled
+    back to the parent process.
+
+    Args:
+        index (int): position of 'chapter' in its book.
+        chapter ('Chapter'): instance to apply.
+
+    Returns:
+        'Chapter': with modifications made and 'data' incorporated.
+
+    """
+    seed = _WORKER_STATE['seed']
+    if seed is not None:
+        random.seed(seed + index)
+        np.random.seed(seed + index)
+    # The fork shares the blocks attached from shared memory until a
+    # technique modifies them. Importing the 'Dataset' module enables pandas
+    # copy-on-write in the worker.
+    data = _WORKER_STATE['template'].fork(
+        label = '_'.join(['chapter', str(index)]))
+    chapter = _WORKER_STATE['method'](manuscript = chapter, data = data)
+    if hasattr(getattr(chapter, 'data', None), '_get_bunches'):
+        _compact_data(data = chapter.data, sources = _WORKER_STATE['sources'])
+    return chapter
+
+
+@dataclasses.dataclass
+class SharedColumns(object):
+    """Reference to columns of a shared 'x' or 'y' in returned data.
+
+    Args:
+        source (str): 'x' or 'y', the shared object holding the columns.
+        columns (List[Any]): column order of the referenced object.
+        changed (pd.DataFrame): columns which are not in 'source' and are
+            pickled normally.
+        name (Optional[Any]): name of the referenced pandas Series, if it was
+            a Series. Defaults to None.
+        series (Optional[bool]): whether the referenced object was a pandas
+            Series. Defaults to False.
+
+    """
+    source: str
+    columns: List[Any]
+    changed: pd.DataFrame
+    name: Optional[Any] = None
+    series: Optional[bool] = False
+
+    """ Factory Method """
+
+    @classmethod
+    def create(cls,
+            data: Union[pd.DataFrame, pd.Series],
+            sources: Dict[str, Union[pd.DataFrame, pd.Series]]) -> Union[
+                'SharedColumns', pd.DataFrame, pd.Series]:
+        """Returns reference to the columns of 'data' in 'sources'.
+
+        A column is referenced only if it still holds the same array as the
+        column with its name in a source, which cannot have been modified
+        because shared arrays are read-only.
+
+        Args:
+            data (Union[pd.DataFrame, pd.Series]): pandas object to reference.
+            sources (Dict[str, Union[pd.DataFrame, pd.Series]]): shared
+                objects keyed by 'x' or 'y'.
+
+        Returns:
+            Union[SharedColumns, pd.DataFrame, pd.Series]: reference or, if no
+                column of 'data' is shared, 'data' itself.
+
+        """
+        series = isinstance(data, pd.Series)
+        frame = data.to_frame() if series else data
+        for source, shared in sources.items():
+            if shared is None:
+                continue
+            if isinstance(shared, pd.Series):
+                shared = shared.to_frame()
+            if not frame.index.equals(shared.index):
+                continue
+            unchanged = [
+                column for column in frame.columns
+                if column in shared.columns
+                and _same_array(frame[column], shared[column])]
+            if unchanged:
+                return cls(
+                    source = source,
+                    columns = list(frame.columns),
+                    changed = frame.drop(columns = unchanged),
+                    name = data.name if series else None,
+                    series = series)
+        return data
+
+    """ Public Methods """
+
+    def restore(self,
+            sources: Dict[str, Union[pd.DataFrame, pd.Series]]) -> Union[
+                pd.DataFrame, pd.Series]:
+        """Returns referenced pandas object using columns in 'sources'.
+
+        Args:
+            sources (Dict[str, Union[pd.DataFrame, pd.Series]]): objects which
+                were shared, keyed by 'x' or 'y'.
+
+        Returns:
+            Union[pd.DataFrame, pd.Series]: matching the referenced object.
+
+        """
+        shared = sources[self.source]
+        if isinstance(shared, pd.Series):
+            shared = shared.to_frame()
+        unchanged = [c for c in self.columns if c not in self.changed.columns]
+        frame = pd.concat(
+            [shared[unchanged], self.changed],
+            axis = 'columns')[self.columns]
+        if self.series:
+            return frame.iloc[:, 0].rename(self.name)
+        else:
+            return frame
+
+
+def _same_array(first: pd.Series, second: pd.Series) -> bool:
+    """Returns whether 'first' and 'second' hold the same numpy array."""
+    if not (isinstance(first.dtype, np.dtype) and first.dtype == second.dtype):
+        return False
+    first = first.to_numpy(copy = False).__array_interface__
+    second = second.to_numpy(copy = False).__array_interface__
+    return (first['data'][0] == second['data'][0]
+            and first['shape'] == second['shape']
+            and first['strides'] == second['strides'])
+
+
+def _compact_data(
+        data: 'Dataset',
+        sources: Dict[str, Union[pd.DataFrame, pd.Series]]) -> 'Dataset':
+    """Replaces shared columns in 'data' with 'SharedColumns' references.
+
+    Rows taken by lazy 'DataBunch' views are dropped as well, since they are
+    taken again when next accessed.
+
+    Args:
+        data ('Dataset'): instance returned by a worker process.
+        sources (Dict[str, Union[pd.DataFrame, pd.Series]]): objects attached
+            from shared memory, keyed by 'x' or 'y'.
+
+    Returns:
+        'Dataset': with shared columns referenced instead of stored.
+
+    """
+    holders = [data] + data._get_bunches()
+    for holder in holders:
+        for attribute in ['data', 'x', 'y']:
+            stored = holder.__dict__.get(attribute)
+            if isinstance(stored, (pd.DataFrame, pd.Series)):
+                holder.__dict__[attribute] = SharedColumns.create(
+                    data = stored,
+                    sources = sources)
+        if '_taken' in holder.__dict__:
+            holder.__dict__['_taken'] = {}
+    return data
+
+
+def _restore_data(
+        data: 'Dataset',
+        sources: Dict[str, Union[pd.DataFrame, pd.Series]]) -> 'Dataset':
+    """Replaces 'SharedColumns' references in 'data' with pandas objects.
+
+    Args:
+        data ('Dataset'): instance returned by a worker process.
+        sources (Dict[str, Union[pd.DataFrame, pd.Series]]): objects which
+            were shared, keyed by 'x' or 'y'.
+
+    Returns:
+        'Dataset': with referenced columns restored.
+
+    """
+    holders = [data] + data._get_bunches()
+    for holder in holders:
+        for attribute in ['data', 'x', 'y']:
+            stored = holder.__dict__.get(attribute)
+            if isinstance(stored, SharedColumns):
+                holder.__dict__[attribute] = stored.restore(sources = sources)
+    return data
+
+
+@dataclasses.dataclass
+class SharedFrame(object):
+    """Pandas data object stored in shared memory blocks.
+
+    Numeric and boolean columns are grouped by dtype and each group is copied
+    once into a 'multiprocessing.shared_memory' block. Worker processes attach
+    to the blocks by name instead of receiving a pickled copy. Any other
+    columns are stored in 'extras' and pickled normally. Attached blocks are
+    read-only, so a technique which modifies them in place raises an error
+    instead of changing the data seen by every other worker.
+
+    Args:
+        blocks (Optional[Dict[str, Tuple[str, Tuple[int, int], List[Any]]]]):
+            keys are numpy dtype strings and values are the shared memory name,
+            array shape, and columns of each block. Defaults to an empty
+            dictionary.
+        extras (Optional[pd.DataFrame]): columns which cannot be shared.
+            Defaults to None.
+        columns (Optional[List[Any]]): original column order. Defaults to an
+            empty list.
+        index (Optional[pd.Index]): original index. Defaults to None.
+        name (Optional[Any]): name of the original pandas Series, if a Series
+            was shared. Defaults to None.
+        series (Optional[bool]): whether a pandas Series was shared. Defaults
+            to False.
+
+    """
+    blocks: Optional[Dict[str, Tuple[str, Tuple[int, int], List[Any]]]] = (
+        dataclasses.field(default_factory = dict))
+    extras: Optional[pd.DataFrame] = None
+    columns: Optional[List[Any]] = dataclasses.field(default_factory = list)
+    index: Optional[pd.Index] = None
+    name: Optional[Any] = None
+    series: Optional[bool] = False
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self._memories = []
+        return self
+
+    """ Factory Method """
+
+    @classmethod
+    def create(cls, data: Union[pd.DataFrame, pd.Series]) -> 'SharedFrame':
+        """Copies 'data' into shared memory.
+
+        Args:
+            data (Union[pd.DataFrame, pd.Series]): pandas object to share.
+
+        Returns:
+            SharedFrame: with shared blocks created.
+
+        """
+        series = isinstance(data, pd.Series)
+        frame = data.to_frame() if series else data
+        shared = cls(
+            columns = list(frame.columns),
+            index = frame.index,
+            name = data.name if series else None,
+            series = series)
+        groups = {}
+        for column, dtype in frame.dtypes.items():
+            if (isinstance(dtype, np.dtype)
+                    and (np.issubdtype(dtype, np.number)
+                         or np.issubdtype(dtype, np.bool_))):
+                groups.setdefault(dtype.str, []).append(column)
+        shared_columns = []
+        for dtype, columns in groups.items():
+            values = frame[columns].to_numpy(dtype = np.dtype(dtype))
+            memory = shared_memory.SharedMemory(
+                create = True,
+                size = max(values.nbytes, 1))
+            array = np.ndarray(
+                values.shape,
+                dtype = values.dtype,
+                buffer = memory.buf)
+            array[:] = values
+            shared._memories.append(memory)
+            shared.blocks[dtype] = (memory.name, values.shape, columns)
+            shared_columns.extend(columns)
+        others = [c for c in frame.columns if c not in set(shared_columns)]
+        if others:
+            shared.extras = frame[others]
+        return shared
+
+    """ Dunder Methods """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Excludes open shared memory handles when pickled."""
+        state = self.__dict__.copy()
+        state['_memories'] = []
+        return state
+
+    """ Public Methods """
+
+    def attach(self) -> Union[pd.DataFrame, pd.Series]:
+        """Returns pandas object backed by the shared blocks.
+
+        Returns:
+            Union[pd.DataFrame, pd.Series]: matching the original object and
+                backed by read-only arrays. If the original had more than one
+                block, the blocks are combined into a local DataFrame.
+
+        """
+        frames = []
+        for dtype, (name, shape, columns) in self.blocks.items():
+            try:
+                memory = shared_memory.SharedMemory(name = name, track = False)
+            except TypeError:
+                memory = shared_memory.SharedMemory(name = name)
+            self._memories.append(memory)
+            array = np.ndarray(shape, dtype = np.dtype(dtype), buffer = memory.buf)
+            array.setflags(write = False)
+            frames.append(pd.DataFrame(
+                array,
+                index = self.index,
+                columns = columns,
+                copy = False))
+        if self.extras is not None:
+            frames.append(self.extras)
+        if len(frames) == 1:
+            frame = frames[0]
+        else:
+            frame = pd.concat(frames, axis = 'columns')
+        if list(frame.columns) != self.columns:
+            frame = frame[self.columns]
+        if self.series:
+            return frame.iloc[:, 0].rename(self.name)
+        else:
+            return frame
+
+    def close(self) -> None:
+        """Closes this process's handles to the shared blocks."""
+        for memory in self._memories:
+            memory.close()
+        return self
+
+    def unlink(self) -> None:
+        """Frees the shared blocks. Only the creating process should call."""
+        for memory in self._memories:
+            memory.unlink()
+        self._memories = []
+        return self
+
+
 @dataclasses.dataclass
 class Parallelizer(SimpleHandler):
     """Applies techniques using one or more CPU or GPU cores.
 
     Args:
         idea ('Idea'): shared 'Idea' instance with project settings.
+        max_workers (Optional[int]): maximum number of worker processes.
+            Defaults to None. If not passed, 'max_workers' in the 'general'
+            section of 'idea' is used and, if it is absent, the number of
+            CPU cores.
 
     """
     idea: 'Idea'
+    max_workers: Optional[int] = None
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
+        try:
+            self.seed = int(self.idea['general']['seed'])
+        except (KeyError, TypeError):
+            self.seed = None
+        if self.max_workers is None:
+            try:
+                self.max_workers = int(self.idea['general']['max_workers'])
+            except (KeyError, TypeError):
+                self.max_workers = None
         return self
 
     """ Private Methods """
@@ -78,41 +469,78 @@ class Parallelizer(SimpleHandler):
             'Book': with its iterable applied to data.
 
         """
-        with mp.Pool() as pool:
-            pool.starmap(method, arguments)
-        pool.close()
-        return self
+        return self.apply_chapters(book = book, data = data, method = method)
+
+    def _make_template(self, data: 'Dataset') -> 'Dataset':
+        """Returns shallow copy of 'data' without its stored pandas objects.
+
+        Args:
+            data ('Dataset'): instance to copy.
+
+        Returns:
+            'Dataset': sent once to each worker process.
+
+        """
+        template = copy.copy(data)
+        template.__dict__['data'] = None
+        template.__dict__['full_bunch'] = type(data.full_bunch)(
+            name = data.full_bunch.name)
+        return template
 
     """ Core siMpLify Methods """
 
     def apply_chapters(self,
             book: 'Book',
-            data: Union['Dataset', 'Book'],
+            data: 'Dataset',
             method: Callable) -> 'Book':
-        """Applies 'method' to 'data'.
+        """Applies 'method' to each chapter in 'book' in worker processes.
+
+        'x' and 'y' of 'data' are placed in shared memory once and each worker
+        attaches to them when it starts. Workers return only the columns of
+        their data which changed, and the others are restored from 'data'.
+        Chapters are returned in their original order regardless of which
+        finishes first.
 
         Args:
             book ('Book'): siMpLify class instance with Chapter instances to
                 parallelize.
-            data (Union['Dataset', 'Book']): an instance containing data to
-                be modified.
-            method (Callable): method to parallelize.
+            data ('Dataset'): an instance with 'x' and 'y' created.
+            method (Callable): method with 'manuscript' and 'data' parameters
+                which applies a chapter. It is pickled once per worker.
 
         Returns:
             'Book': with its iterable applied to data.
 
         """
-        arguments = []
-        for key, chapter in book.chapters.items():
-            arguments.append((chapter, data))
-        results = []
-        chapters_keys = list(book.chapters.keys())
-        with mp.Pool() as pool:
-            results.append[pool.map(method, arguments)]
-        pool.close()
-        pool.join()
-        pool.clear()
-        book.chapters = dict(zip(chapters_keys, results))
+        shared_x = SharedFrame.create(data = data.x)
+        if data.y is None:
+            shared_y = None
+        else:
+            shared_y = SharedFrame.create(data = data.y)
+        try:
+            with futures.ProcessPoolExecutor(
+                    max_workers = self.max_workers,
+                    initializer = _initialize_worker,
+                    initargs = (
+                        method,
+                        self._make_template(data = data),
+                        shared_x,
+                        shared_y,
+                        self.seed)) as executor:
+                chapters = list(executor.map(
+                    _apply_chapter,
+                    range(len(book.chapters)),
+                    book.chapters))
+        finally:
+            for shared in [shared_x, shared_y]:
+                if shared is not None:
+                    shared.close()
+                    shared.unlink()
+        sources = {'x': data.x, 'y': data.y}
+        for chapter in chapters:
+            if hasattr(getattr(chapter, 'data', None), '_get_bunches'):
+                _restore_data(data = chapter.data, sources = sources)
+        book.chapters = chapters
         return book
 
     def apply_data(self,
@@ -0,0 +1,492 @@
+"""
+.. module:: search
+:synopsis: hyperparameter search made simple
+:publisher: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import copy
+import dataclasses
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn.base
+import sklearn.metrics
+import sklearn.model_selection
+
+
+""" Candidate Evaluation """
+
+@dataclasses.dataclass
+class Candidate(object):
+    """Cross-validated scores for one set of hyperparameters.
+
+    Args:
+        parameters (Dict[str, Any]): hyperparameters evaluated.
+        scores (Optional[List[float]]): score for each evaluated fold.
+            Defaults to an empty list.
+        resource (Optional[int]): number of training rows used in each fold.
+            Defaults to None, which means all rows were used.
+        stopped (Optional[bool]): whether evaluation stopped early because
+            the candidate was dominated. Defaults to False.
+
+    """
+    parameters: Dict[str, Any]
+    scores: Optional[List[float]] = dataclasses.field(default_factory = list)
+    resource: Optional[int] = None
+    stopped: Optional[bool] = False
+
+    @property
+    def score(self) -> float:
+        """Returns mean score or negative infinity if there are no scores."""
+        if self.scores:
+            return float(np.mean(self.scores))
+        else:
+            return -np.inf
+
+
+def _evaluate_candidate(
+        estimator: object,
+        candidate: Candidate,
+        folds: List[Tuple[Any, Any, Any, Any]],
+        scorer: Callable,
+        threshold: Optional[float],
+        tolerance: float,
+        min_folds: int,
+        seed: Optional[int]) -> Candidate:
+    """Scores 'candidate' on each of 'folds', stopping early if dominated.
+
+    After 'min_folds' folds, evaluation stops if the mean score plus
+    'tolerance' standard errors is still below 'threshold'.
+
+    Args:
+        estimator (object): unfitted scikit-learn compatible estimator.
+        candidate (Candidate): instance with 'parameters' to evaluate.
+        folds (List[Tuple[Any, Any, Any, Any]]): training features, training
+            labels, testing features, and testing labels for each fold, with
+            any preprocessing already applied.
+        scorer (Callable): scikit-learn scorer.
+        threshold (Optional[float]): best score found so far.
+        tolerance (float): number of standard errors used for early stopping.
+        min_folds (int): minimum folds evaluated before early stopping.
+        seed (Optional[int]): random seed used to subsample training rows.
+
+    Returns:
+        Candidate: with 'scores' added.
+
+    """
+    for x_train, y_train, x_test, y_test in folds:
+        if (candidate.resource is not None
+                and candidate.resource < len(x_train)):
+            rows = np.random.RandomState(seed).permutation(
+                len(x_train))[:candidate.resource]
+            x_train = _take(x_train, rows)
+            y_train = _take(y_train, rows)
+        fitted = sklearn.base.clone(estimator)
+        fitted.set_params(**candidate.parameters)
+        fitted.fit(x_train, y_train)
+        candidate.scores.append(scorer(fitted, x_test, y_test))
+        count = len(candidate.scores)
+        if threshold is not None and count >= min_folds:
+            error = np.std(candidate.scores, ddof = 1) / math.sqrt(count)
+            if candidate.score + tolerance * error < threshold:
+                candidate.stopped = True
+                break
+    return candidate
+
+
+def _take(data: Any, rows: np.ndarray) -> Any:
+    """Returns 'rows' positions of a pandas or numpy object."""
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[rows]
+    else:
+        return np.asarray(data)[rows]
+
+
+@dataclasses.dataclass
+class Searcher(object):
+    """Searches hyperparameters for the model 'Tool' following a search step.
+
+    Techniques between the search step and the searched 'Tool' are fitted
+    once per fold, and the transformed folds are reused by every candidate.
+    Candidates are evaluated in parallel batches. A candidate stops early
+    once it is clearly dominated by the best candidate of earlier batches.
+
+    Args:
+        method (Optional[str]): search method. Options are 'grid', 'random',
+            'halving' (successive halving), 'hyperband', and 'bayes'
+            (scikit-optimize). Defaults to 'random'.
+        n_iter (Optional[int]): number of candidates sampled for 'random',
+            'halving', and 'bayes'. Defaults to 50.
+        cv (Optional[Union[int, object]]): number of folds or scikit-learn
+            cross-validator. Defaults to 5.
+        scoring (Optional[Union[str, List[str]]]): scikit-learn scoring name.
+            If a list is passed, the first item is used to rank candidates.
+            Defaults to None, which uses the estimator's 'score' method.
+        n_jobs (Optional[int]): number of worker processes. Defaults to -1,
+            which uses all CPU cores.
+        seed (Optional[int]): random seed. Defaults to None.
+        factor (Optional[int]): proportion of candidates dropped in each
+            round of 'halving' and 'hyperband'. Defaults to 3.
+        grid_points (Optional[int]): number of values taken from each range
+            or distribution for 'grid'. Defaults to 5.
+        tolerance (Optional[float]): standard errors below the best score at
+            which a candidate is dominated. Defaults to 2.0.
+        min_folds (Optional[int]): folds evaluated before a candidate can be
+            stopped early. Defaults to 2.
+        refit (Optional[bool]): whether the best parameters are written back
+            into the searched 'Tool'. Defaults to True.
+        verbose (Optional[bool]): whether to print search progress. Defaults
+            to False.
+
+    """
+    method: Optional[str] = 'random'
+    n_iter: Optional[int] = 50
+    cv: Optional[Union[int, object]] = 5
+    scoring: Optional[Union[str, List[str]]] = None
+    n_jobs: Optional[int] = -1
+    seed: Optional[int] = None
+    factor: Optional[int] = 3
+    grid_points: Optional[int] = 5
+    tolerance: Optional[float] = 2.0
+    min_folds: Optional[int] = 2
+    refit: Optional[bool] = True
+    verbose: Optional[bool] = False
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.candidates = []
+        self.best = None
+        self._random = np.random.RandomState(self.seed)
+        return self
+
+    """ Private Methods """
+
+    def _find_target(self, techniques: List['Technique']) -> int:
+        """Returns index of the first technique with a 'parameter_space'.
+
+        Raises:
+            ValueError: if no technique has a 'parameter_space'.
+
+        """
+        for i, technique in enumerate(techniques):
+            if (not technique.name in ['none', None]
+                    and getattr(technique, 'parameter_space', None)):
+                return i
+        raise ValueError(' '.join(
+            ['No technique after the search step has a parameter_space']))
+
+    def _make_folds(self,
+            prefix: List['Technique'],
+            estimator: object,
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Union[pd.Series, np.ndarray]) -> List[Tuple[Any, Any, Any, Any]]:
+        """Splits 'x' and 'y' and applies 'prefix' once to each fold.
+
+        Args:
+            prefix (List['Technique']): techniques between the search step and
+                the searched 'Tool'.
+            estimator (object): estimator being searched.
+            x (Union[pd.DataFrame, np.ndarray]): features.
+            y (Union[pd.Series, np.ndarray]): label.
+
+        Returns:
+            List[Tuple[Any, Any, Any, Any]]: training features, training
+                labels, testing features, and testing labels for each fold.
+
+        """
+        splitter = sklearn.model_selection.check_cv(
+            self.cv,
+            y,
+            classifier = sklearn.base.is_classifier(estimator))
+        folds = []
+        for train_index, test_index in splitter.split(x, y):
+            x_train, y_train = _take(x, train_index), _take(y, train_index)
+            x_test, y_test = _take(x, test_index), _take(y, test_index)
+            for technique in prefix:
+                if not technique.name in ['none', None]:
+                    fitted = copy.deepcopy(technique)
+                    fitted.fit(x = x_train, y = y_train)
+                    x_train = fitted.transform(x = x_train, y = y_train)
+                    x_test = fitted.transform(x = x_test, y = y_test)
+            folds.append((x_train, y_train, x_test, y_test))
+        return folds
+
+    def _make_scorer(self, estimator: object) -> Callable:
+        """Returns scikit-learn scorer for 'scoring'."""
+        scoring = self.scoring
+        if isinstance(scoring, (list, tuple)):
+            scoring = scoring[0]
+        return sklearn.metrics.check_scoring(estimator, scoring = scoring)
+
+    def _evaluate(self,
+            candidates: List[Candidate],
+            estimator: object,
+            folds: List[Tuple[Any, Any, Any, Any]],
+            scorer: Callable) -> List[Candidate]:
+        """Evaluates 'candidates' in parallel batches.
+
+        The best score of earlier batches is passed to later batches so that
+        dominated candidates stop early.
+
+        Returns:
+            List[Candidate]: evaluated, in the same order as 'candidates'.
+
+        """
+        size = joblib.effective_n_jobs(self.n_jobs)
+        evaluated = []
+        with joblib.Parallel(n_jobs = self.n_jobs) as parallel:
+            for start in range(0, len(candidates), size):
+                threshold = max(
+                    (c.score for c in evaluated if not c.stopped),
+                    default = None)
+                evaluated.extend(parallel(
+                    joblib.delayed(_evaluate_candidate)(
+                        estimator = estimator,
+                        candidate = candidate,
+                        folds = folds,
+                        scorer = scorer,
+                        threshold = threshold,
+                        tolerance = self.tolerance,
+                        min_folds = self.min_folds,
+                        seed = self.seed)
+                    for candidate in candidates[start:start + size]))
+        self.candidates.extend(evaluated)
+        if self.verbose:
+            print('Evaluated', len(evaluated), 'candidates,',
+                  sum(c.stopped for c in evaluated), 'stopped early')
+        return evaluated
+
+    def _sample(self, space: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns one random set of parameters from 'space'."""
+        parameters = {}
+        for name, values in space.items():
+            if hasattr(values, 'rvs'):
+                value = values.rvs(random_state = self._random)
+            elif isinstance(values, tuple):
+                if all(isinstance(v, int) for v in values):
+                    value = self._random.randint(values[0], values[1] + 1)
+                else:
+                    value = self._random.uniform(values[0], values[1])
+            elif isinstance(values, list):
+                value = values[self._random.randint(len(values))]
+            else:
+                value = values
+            parameters[name] = value.item() if hasattr(value, 'item') else value
+        return parameters
+
+    def _grid_values(self, values: Any) -> List[Any]:
+        """Returns list of grid values for one item in a parameter space."""
+        if isinstance(values, list):
+            return values
+        elif hasattr(values, 'ppf'):
+            quantiles = np.linspace(0.05, 0.95, self.grid_points)
+            return sorted(set(values.ppf(quantiles).tolist()))
+        elif isinstance(values, tuple):
+            grid = np.linspace(values[0], values[1], self.grid_points)
+            if all(isinstance(v, int) for v in values):
+                return sorted(set(int(round(v)) for v in grid))
+            return grid.tolist()
+        else:
+            return [values]
+
+    def _to_dimension(self, values: Any) -> object:
+        """Converts one item in a parameter space to a skopt dimension."""
+        import skopt.space
+        if isinstance(values, list):
+            return skopt.space.Categorical(values)
+        elif hasattr(values, 'support'):
+            low, high = values.support()
+            if values.dist.name in ['randint']:
+                return skopt.space.Integer(int(low), int(high))
+            return skopt.space.Real(float(low), float(high))
+        elif all(isinstance(v, int) for v in values):
+            return skopt.space.Integer(values[0], values[1])
+        else:
+            return skopt.space.Real(float(values[0]), float(values[1]))
+
+    def _search_grid(self, space, estimator, folds, scorer) -> None:
+        """Evaluates every combination of grid values in 'space'."""
+        grid = sklearn.model_selection.ParameterGrid(
+            {k: self._grid_values(v) for k, v in space.items()})
+        self._evaluate(
+            candidates = [Candidate(parameters = p) for p in grid],
+            estimator = estimator,
+            folds = folds,
+            scorer = scorer)
+        return self
+
+    def _search_random(self, space, estimator, folds, scorer) -> None:
+        """Evaluates 'n_iter' random samples from 'space'."""
+        self._evaluate(
+            candidates = [
+                Candidate(parameters = self._sample(space))
+                for _ in range(self.n_iter)],
+            estimator = estimator,
+            folds = folds,
+            scorer = scorer)
+        return self
+
+    def _successive_halving(self,
+            candidates: List[Candidate],
+            resource: int,
+            maximum: int,
+            estimator, folds, scorer) -> None:
+        """Keeps the best 1/'factor' of 'candidates' as 'resource' grows."""
+        while candidates:
+            for candidate in candidates:
+                candidate.resource = min(resource, maximum)
+            evaluated = self._evaluate(
+                candidates = candidates,
+                estimator = estimator,
+                folds = folds,
+                scorer = scorer)
+            if resource >= maximum:
+                break
+            evaluated = sorted(
+                [c for c in evaluated if not c.stopped],
+                key = lambda c: c.score,
+                reverse = True)
+            candidates = [
+                Candidate(parameters = c.parameters)
+                for c in evaluated[:max(1, len(evaluated) // self.factor)]]
+            # A lone survivor goes straight to the full resource.
+            if len(candidates) == 1:
+                resource = maximum
+            else:
+                resource = resource * self.factor
+        return self
+
+    def _search_halving(self, space, estimator, folds, scorer) -> None:
+        """Applies one round of successive halving to 'n_iter' samples."""
+        maximum = min(len(fold[0]) for fold in folds)
+        rounds = int(math.log(max(self.n_iter, 1), self.factor))
+        self._successive_halving(
+            candidates = [
+                Candidate(parameters = self._sample(space))
+                for _ in range(self.n_iter)],
+            resource = max(1, maximum // self.factor ** rounds),
+            maximum = maximum,
+            estimator = estimator,
+            folds = folds,
+            scorer = scorer)
+        return self
+
+    def _search_hyperband(self, space, estimator, folds, scorer) -> None:
+        """Applies successive halving over Hyperband brackets."""
+        maximum = min(len(fold[0]) for fold in folds)
+        brackets = int(math.log(max(self.n_iter, 1), self.factor))
+        for bracket in range(brackets, -1, -1):
+            number = int(math.ceil(
+                (brackets + 1) / (bracket + 1) * self.factor ** bracket))
+            self._successive_halving(
+                candidates = [
+                    Candidate(parameters = self._sample(space))
+                    for _ in range(number)],
+                resource = max(1, maximum // self.factor ** bracket),
+                maximum = maximum,
+                estimator = estimator,
+                folds = folds,
+                scorer = scorer)
+        return self
+
+    def _search_bayes(self, space, estimator, folds, scorer) -> None:
+        """Evaluates batches of candidates proposed by skopt."""
+        import skopt
+        names = list(space.keys())
+        optimizer = skopt.Optimizer(
+            dimensions = [self._to_dimension(space[n]) for n in names],
+            random_state = self.seed)
+        size = joblib.effective_n_jobs(self.n_jobs)
+        remaining = self.n_iter
+        while remaining > 0:
+            points = optimizer.ask(n_points = min(size, remaining))
+            evaluated = self._evaluate(
+                candidates = [
+                    Candidate(parameters = {
+                        n: v.item() if hasattr(v, 'item') else v
+                        for n, v in zip(names, point)})
+                    for point in points],
+                estimator = estimator,
+                folds = folds,
+                scorer = scorer)
+            # skopt minimizes, so scores are negated. Stopped candidates are
+            # given their partial mean, which is already dominated.
+            optimizer.tell(points, [-c.score for c in evaluated])
+            remaining -= len(points)
+        return self
+
+    def _choose_best(self) -> Candidate:
+        """Returns best of 'candidates' evaluated with the most rows.
+
+        Candidates which stopped early are only chosen if every candidate
+        evaluated with the most rows stopped early.
+
+        Raises:
+            ValueError: if no candidates were evaluated.
+
+        """
+        if not self.candidates:
+            raise ValueError(' '.join(
+                ['No candidates were evaluated by the', self.method,
+                 'search']))
+        full = max(c.resource or 0 for c in self.candidates)
+        largest = [c for c in self.candidates if (c.resource or 0) == full]
+        finished = [c for c in largest if not c.stopped] or largest
+        return max(finished, key = lambda c: c.score)
+
+    """ Core siMpLify Methods """
+
+    def search(self,
+            techniques: List['Technique'],
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Union[pd.Series, np.ndarray],
+            prefix: Optional[List['Technique']] = None) -> Dict[str, Any]:
+        """Searches hyperparameters of the first technique with a space.
+
+        Args:
+            techniques (List['Technique']): techniques after the search step.
+            x (Union[pd.DataFrame, np.ndarray]): features.
+            y (Union[pd.Series, np.ndarray]): label.
+            prefix (Optional[List['Technique']]): techniques before the search
+                step which are fitted to each fold, such as those after a
+                'split' step. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: best parameters found.
+
+        Raises:
+            KeyError: if 'method' is not a recognized search method.
+
+        """
+        try:
+            method = getattr(self, '_'.join(['_search', self.method]))
+        except AttributeError:
+            raise KeyError(' '.join([self.method, 'is not a search method']))
+        # Candidates from earlier searches may belong to another estimator.
+        self.candidates = []
+        self.best = None
+        index = self._find_target(techniques = techniques)
+        target = techniques[index]
+        folds = self._make_folds(
+            prefix = list(prefix or []) + techniques[:index],
+            estimator = target.algorithm,
+            x = x,
+            y = y)
+        method(
+            space = target.parameter_space,
+            estimator = target.algorithm,
+            folds = folds,
+            scorer = self._make_scorer(estimator = target.algorithm))
+        self.best = self._choose_best()
+        if self.verbose:
+            print('Best', target.name, 'parameters', self.best.parameters,
+                  'score', self.best.score)
+        if self.refit:
+            target.parameters.update(self.best.parameters)
+            target.algorithm.set_params(**self.best.parameters)
+        return self.best.parameters
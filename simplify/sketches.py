@@ -0,0 +1,468 @@
+"""
+.. module:: sketches
+:synopsis: approximate column statistics made simple
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+
+Every sketch can be updated one chunk of rows at a time and merged with a
+sketch of the same configuration built from other chunks, including chunks
+sketched in other processes, so that statistics for very large tables are
+estimated without holding all distinct values in memory.
+
+"""
+
+import concurrent.futures
+import dataclasses
+import math
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+def _hash_values(
+        values: Union[pd.Series, pd.Index, np.ndarray],
+        unique: bool = False) -> np.ndarray:
+    """Returns a deterministic 64-bit hash for each of 'values'.
+
+    pandas objects are hashed by value, so a column and an index holding the
+    same values (such as the index of its 'value_counts') have equal hashes
+    regardless of whether they are stored as categoricals. If 'unique' is
+    True, objects are hashed without first being factorized.
+
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        return pd.util.hash_pandas_object(
+            values,
+            index = False,
+            categorize = not unique).to_numpy()
+    else:
+        return pd.util.hash_array(np.asarray(values), categorize = not unique)
+
+
+@dataclasses.dataclass
+class HyperLogLog(object):
+    """Estimates the number of distinct values seen.
+
+    Args:
+        error (Optional[float]): desired relative standard error of the
+            estimate, which sets the number of registers to about
+            (1.04 / error) ** 2. Defaults to 0.01.
+
+    """
+    error: Optional[float] = 0.01
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.precision = int(min(18, max(
+            4, math.ceil(math.log2((1.04 / self.error) ** 2)))))
+        self.registers = np.zeros(2 ** self.precision, dtype = np.uint8)
+        return self
+
+    """ Properties """
+
+    @property
+    def relative_error(self) -> float:
+        """Returns relative standard error of 'estimate'."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    """ Public Methods """
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Adds 64-bit 'hashes' of values to the sketch.
+
+        Args:
+            hashes (np.ndarray): uint64 hashes of values.
+
+        """
+        hashes = np.asarray(hashes, dtype = np.uint64)
+        width = 64 - self.precision
+        indices = (hashes >> np.uint64(width)).astype(np.intp)
+        remainders = hashes & np.uint64((1 << width) - 1)
+        # The exponent from 'frexp' is the bit length of each remainder.
+        lengths = np.frexp(remainders.astype(np.float64))[1]
+        ranks = (width - lengths + 1).astype(np.uint8)
+        np.maximum.at(self.registers, indices, ranks)
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Adds values seen by 'other' to the sketch.
+
+        Raises:
+            ValueError: if 'other' has a different precision.
+
+        """
+        if other.precision != self.precision:
+            raise ValueError('sketches must have the same precision')
+        np.maximum(self.registers, other.registers, out = self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """Returns estimated number of distinct values seen."""
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size ** 2 / np.sum(
+            np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = size * math.log(size / zeros)
+        return float(estimate)
+
+
+@dataclasses.dataclass
+class CountMinSketch(object):
+    """Estimates how often each value was seen.
+
+    Estimates never undercount. With probability 'confidence', each estimate
+    overcounts by at most 'error' times the number of values seen.
+
+    Args:
+        error (Optional[float]): maximum overcount as a fraction of the
+            number of values seen. The table width is rounded up to a power
+            of two, so the actual bound may be tighter. Defaults to 0.001.
+        confidence (Optional[float]): probability that an estimate is within
+            the 'error' bound. Defaults to 0.99.
+
+    """
+    error: Optional[float] = 0.001
+    confidence: Optional[float] = 0.99
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.width = 2 ** int(math.ceil(math.log2(math.e / self.error)))
+        self.depth = int(math.ceil(math.log(1 / (1 - self.confidence))))
+        self.table = np.zeros((self.depth, self.width), dtype = np.int64)
+        self.total = 0
+        return self
+
+    """ Private Methods """
+
+    def _get_columns(self, hashes: np.ndarray) -> np.ndarray:
+        """Returns the table column of 'hashes' for each row of 'table'."""
+        hashes = np.asarray(hashes, dtype = np.uint64)
+        # 32-bit double hashing with a power of two width avoids slow 64-bit
+        # division.
+        first = (hashes & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        second = ((hashes >> np.uint64(32)) | np.uint64(1)).astype(np.uint32)
+        mask = np.uint32(self.width - 1)
+        columns = np.empty((self.depth, len(hashes)), dtype = np.intp)
+        for row in range(self.depth):
+            columns[row] = (first + np.uint32(row) * second) & mask
+        return columns
+
+    """ Public Methods """
+
+    def update(self,
+            hashes: np.ndarray,
+            counts: Optional[np.ndarray] = None) -> None:
+        """Adds 'counts' occurrences of values with 'hashes'.
+
+        Args:
+            hashes (np.ndarray): uint64 hashes of values.
+            counts (Optional[np.ndarray]): number of occurrences of each
+                value. Defaults to None, meaning each hash is one occurrence.
+
+        """
+        columns = self._get_columns(hashes = hashes)
+        for row in range(self.depth):
+            self.table[row] += np.bincount(
+                columns[row],
+                weights = counts,
+                minlength = self.width).astype(np.int64)
+        if counts is None:
+            self.total += len(columns[0])
+        else:
+            self.total += int(np.sum(counts))
+        return self
+
+    def merge(self, other: 'CountMinSketch') -> None:
+        """Adds values seen by 'other' to the sketch.
+
+        Raises:
+            ValueError: if 'other' has a different width or depth.
+
+        """
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError('sketches must have the same width and depth')
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    def estimate(self, hashes: np.ndarray) -> np.ndarray:
+        """Returns estimated number of occurrences of values with 'hashes'."""
+        columns = self._get_columns(hashes = hashes)
+        estimates = self.table[0][columns[0]]
+        for row in range(1, self.depth):
+            np.minimum(
+                estimates, self.table[row][columns[row]], out = estimates)
+        return estimates
+
+
+@dataclasses.dataclass
+class ColumnSketch(object):
+    """Approximate cardinality and heavy hitters of one column.
+
+    While a column has at most 'capacity' distinct values, the sketch keeps
+    their exact counts, which is cheaper than hashing every value. After
+    that, raw values are hashed into a 'HyperLogLog' and a 'CountMinSketch',
+    and values whose Count-Min estimate reaches 1 / ('capacity' + 1) of the
+    values seen are kept as heavy hitter candidates. Because estimates never
+    undercount, every value seen that often is kept unless more than
+    'capacity' candidates have larger estimates.
+
+    Args:
+        cardinality_error (Optional[float]): relative standard error of the
+            distinct value estimate. Defaults to 0.01.
+        frequency_error (Optional[float]): maximum overcount of frequency
+            estimates as a fraction of non-null values. Defaults to 0.001.
+        confidence (Optional[float]): probability that a frequency estimate
+            is within 'frequency_error'. Defaults to 0.99.
+        capacity (Optional[int]): number of exact counts or heavy hitter
+            candidates kept. Defaults to 1,000.
+
+    """
+    cardinality_error: Optional[float] = 0.01
+    frequency_error: Optional[float] = 0.001
+    confidence: Optional[float] = 0.99
+    capacity: Optional[int] = 1000
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        self.distinct = HyperLogLog(error = self.cardinality_error)
+        self.frequencies = CountMinSketch(
+            error = self.frequency_error,
+            confidence = self.confidence)
+        self.counts = pd.Series(dtype = np.int64)
+        self.candidates = None
+        self.nulls = 0
+        return self
+
+    """ Properties """
+
+    @property
+    def approximate(self) -> bool:
+        """Returns whether statistics are estimated rather than exact."""
+        return self.counts is None
+
+    @property
+    def count(self) -> int:
+        """Returns number of non-null values seen."""
+        if self.approximate:
+            return self.frequencies.total
+        else:
+            return int(self.counts.sum())
+
+    """ Private Methods """
+
+    def _add_candidates(self, values: pd.Series) -> None:
+        """Keeps at most 'capacity' of 'values' and current candidates."""
+        if self.candidates is not None:
+            values = pd.concat([self.candidates, values], ignore_index = True)
+        values = values.drop_duplicates()
+        estimates = self.frequencies.estimate(
+            hashes = _hash_values(values = values, unique = True))
+        keep = estimates * (self.capacity + 1) >= self.count
+        if np.count_nonzero(keep) > self.capacity:
+            cutoff = np.partition(
+                estimates[keep], -self.capacity)[-self.capacity]
+            keep &= estimates >= cutoff
+        self.candidates = values[keep].reset_index(drop = True)
+        return self
+
+    def _add_counts(self, counts: pd.Series) -> None:
+        """Adds exact 'counts' indexed by value to the approximate sketch."""
+        if len(counts):
+            values = pd.Series(counts.index)
+            hashes = _hash_values(values = values, unique = True)
+            self.distinct.update(hashes = hashes)
+            self.frequencies.update(
+                hashes = hashes,
+                counts = counts.to_numpy())
+            self._add_candidates(values = values)
+        return self
+
+    def _add_values(self, values: pd.Series) -> None:
+        """Adds non-null raw 'values' to the approximate sketch."""
+        if not (pd.api.types.is_numeric_dtype(values.dtype)
+                or values.dtype.kind in ['b', 'M', 'm']):
+            # Hashing objects factorizes them anyway, so each distinct value
+            # is hashed once and counted instead.
+            codes, uniques = pd.factorize(values)
+            return self._add_counts(
+                counts = pd.Series(np.bincount(codes), index = uniques))
+        hashes = _hash_values(values = values)
+        self.distinct.update(hashes = hashes)
+        self.frequencies.update(hashes = hashes)
+        estimates = self.frequencies.estimate(hashes = hashes)
+        self._add_candidates(
+            values = values[estimates * (self.capacity + 1) >= self.count])
+        return self
+
+    def _estimate(self) -> None:
+        """Moves exact counts into the approximate sketch."""
+        if not self.approximate:
+            counts = self.counts
+            self.counts = None
+            self._add_counts(counts = counts)
+        return self
+
+    """ Public Methods """
+
+    def update(self, column: pd.Series) -> None:
+        """Adds a chunk of rows of a column to the sketch.
+
+        Args:
+            column (pd.Series): chunk of rows.
+
+        """
+        # A sample with too many distinct values skips exact counting.
+        if (not self.approximate and column.iloc[
+                :10 * self.capacity].nunique() > self.capacity):
+            self._estimate()
+        if self.approximate:
+            values = column.dropna()
+            self.nulls += len(column) - len(values)
+            if len(values):
+                self._add_values(values = values)
+        else:
+            counts = column.value_counts(dropna = True, sort = False)
+            counts = counts[counts > 0]
+            self.nulls += len(column) - int(counts.sum())
+            counts = self.counts.add(counts, fill_value = 0)
+            self.counts = counts.astype(np.int64)
+            if len(self.counts) > self.capacity:
+                self._estimate()
+        return self
+
+    def merge(self, other: 'ColumnSketch') -> None:
+        """Adds values seen by 'other' to the sketch."""
+        self.nulls += other.nulls
+        if not self.approximate and not other.approximate:
+            counts = self.counts.add(other.counts, fill_value = 0)
+            self.counts = counts.astype(np.int64)
+            if len(self.counts) > self.capacity:
+                self._estimate()
+        else:
+            self._estimate()
+            if other.approximate:
+                self.distinct.merge(other.distinct)
+                self.frequencies.merge(other.frequencies)
+                if other.candidates is not None:
+                    self._add_candidates(values = other.candidates)
+                elif self.candidates is not None:
+                    self._add_candidates(values = self.candidates.iloc[:0])
+            else:
+                self._add_counts(counts = other.counts)
+        return self
+
+    def unique(self) -> int:
+        """Returns estimated number of distinct non-null values."""
+        if self.approximate:
+            return int(round(self.distinct.estimate()))
+        else:
+            return len(self.counts)
+
+    def heavy_hitters(self) -> pd.Series:
+        """Returns estimated counts of the most frequent values."""
+        if not self.approximate:
+            return self.counts.sort_values(ascending = False)
+        elif self.candidates is None or not len(self.candidates):
+            return pd.Series(dtype = np.int64)
+        estimates = self.frequencies.estimate(
+            hashes = _hash_values(values = self.candidates, unique = True))
+        return pd.Series(
+            estimates,
+            index = pd.Index(self.candidates)).sort_values(ascending = False)
+
+    def frequent(self, fraction: float) -> Optional[pd.Index]:
+        """Returns values which may make up at least 'fraction' of values.
+
+        No value at or above 'fraction' is missed. Values below 'fraction' by
+        less than 'frequency_error' may be included.
+
+        Args:
+            fraction (float): share of non-null values.
+
+        Returns:
+            Optional[pd.Index]: values which may be frequent, or None if
+                'capacity' is too small to guarantee that no frequent value
+                is missed.
+
+        """
+        if self.approximate and fraction * (self.capacity + 1) <= 1:
+            return None
+        hitters = self.heavy_hitters()
+        return hitters[hitters >= fraction * self.count].index
+
+
+def _sketch_chunk(
+        chunk: pd.DataFrame,
+        options: Dict[str, Any]) -> Dict[str, ColumnSketch]:
+    """Returns a 'ColumnSketch' for each column in 'chunk'."""
+    return {
+        name: ColumnSketch(**options).update(column = chunk[name])
+        for name in chunk.columns}
+
+
+def _merge_sketches(
+        sketches: Dict[str, ColumnSketch],
+        other: Dict[str, ColumnSketch]) -> Dict[str, ColumnSketch]:
+    """Merges each sketch in 'other' into 'sketches' in place."""
+    for name, sketch in other.items():
+        if name in sketches:
+            sketches[name].merge(sketch)
+        else:
+            sketches[name] = sketch
+    return sketches
+
+
+def sketch_frame(
+        data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+        columns: Optional[List[str]] = None,
+        chunk_size: Optional[int] = 1_000_000,
+        max_workers: Optional[int] = 1,
+        **kwargs) -> Dict[str, ColumnSketch]:
+    """Sketches 'columns' of 'data' one chunk of rows at a time.
+
+    Args:
+        data (Union[pd.DataFrame, Iterable[pd.DataFrame]]): a DataFrame, which
+            is divided into chunks of 'chunk_size' rows, or an iterable of
+            DataFrame chunks (such as a pandas csv reader).
+        columns (Optional[List[str]]): columns to sketch. Defaults to None,
+            meaning every column is sketched.
+        chunk_size (Optional[int]): number of rows in each chunk of a
+            DataFrame. Defaults to 1,000,000.
+        max_workers (Optional[int]): number of processes sketching chunks. If
+            1, chunks are sketched in this process. Defaults to 1.
+        kwargs: arguments passed to 'ColumnSketch'.
+
+    Returns:
+        Dict[str, ColumnSketch]: sketches merged across chunks, keyed by
+            column name.
+
+    """
+    if isinstance(data, pd.DataFrame):
+        chunks = (
+            data.iloc[start:start + chunk_size]
+            for start in range(0, max(len(data), 1), chunk_size))
+    else:
+        chunks = iter(data)
+    if columns is not None:
+        chunks = (chunk[columns] for chunk in chunks)
+    sketches = {}
+    if max_workers == 1:
+        results = (_sketch_chunk(chunk = chunk, options = kwargs)
+                   for chunk in chunks)
+        for result in results:
+            _merge_sketches(sketches = sketches, other = result)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers = max_workers) as executor:
+            futures = [
+                executor.submit(_sketch_chunk, chunk, kwargs)
+                for chunk in chunks]
+            for future in futures:
+                _merge_sketches(sketches = sketches, other = future.result())
+    return sketches
@@ -8,12 +8,54 @@
 
 import dataclasses
 import importlib
+import time
 import types
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from simplify import core
 
 
+""" Import Cache """
+
+# Modules imported through 'import_module' and the seconds each import took.
+_MODULES: Dict[str, types.ModuleType] = {}
+_IMPORT_TIMES: Dict[str, float] = {}
+
+
+def import_module(name: str) -> types.ModuleType:
+    """Returns module 'name', importing and timing it on first use.
+
+    Args:
+        name (str): dotted name of the module to import.
+
+    Returns:
+        types.ModuleType: the imported module.
+
+    """
+    try:
+        return _MODULES[name]
+    except KeyError:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        _IMPORT_TIMES[name] = time.perf_counter() - start
+        _MODULES[name] = module
+        return module
+
+
+def import_profile() -> List[Tuple[str, float]]:
+    """Returns modules imported by 'Technique' instances and their times.
+
+    Times include any modules first imported as dependencies, so the module
+    which triggers a heavy package absorbs its cost.
+
+    Returns:
+        List[Tuple[str, float]]: module names and seconds, slowest first.
+
+    """
+    return sorted(
+        _IMPORT_TIMES.items(), key = lambda item: item[1], reverse = True)
+
+
 @dataclasses.dataclass
 class Technique(core.SimpleLoader):
     """Base method wrapper for applying algorithms to data.
@@ -36,18 +78,38 @@ class Technique(core.SimpleLoader):
             'algorithm' when 'algorithm' is instanced. Defaults to an empty
             dictionary.
 
+    'algorithm' is not imported when an instance is created. It is imported
+    by 'load' when the 'Technique' is finalized, so building large catalogs
+    of techniques does not import the packages they point to.
+
     """
     name: Optional[str] = None
-    
+
     module: Optional[str] = dataclasses.field(
         default_factory = lambda: 'simplify.core')
     algorithm: Optional[Union[str, object]] = None
     parameters: Optional[Dict[str, Any]] = dataclasses.field(
         default_factory = dict)
 
-    def __post_init__(self) -> None:
-        self.load('algorithm')
-        return self
+    """ Public Methods """
+
+    def load(self, attribute: str) -> object:
+        """Imports, stores, and returns object named in 'attribute'.
+
+        Args:
+            attribute (str): name of a local attribute which holds the name of
+                an object in 'module'.
+
+        Returns:
+            object: from 'module' or the value of 'attribute' if it is not a
+                string or 'module' is not set.
+
+        """
+        value = getattr(self, attribute)
+        if isinstance(value, str) and self.module:
+            value = getattr(import_module(self.module), value)
+            setattr(self, attribute, value)
+        return value
 
     """ Other Dunder Methods """
 
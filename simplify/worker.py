@@ -7,9 +7,11 @@
 """
 
 import collections.abc
+import copy
 import dataclasses
 import importlib
 import itertools
+import time
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 try:
@@ -23,6 +25,7 @@ import pandas as pd
 import simplify
 from simplify import core
 from simplify.core import utilities
+from simplify.dataset import Dataset
 
 
 @dataclasses.dataclass
@@ -441,6 +444,141 @@ class Sequencer(Worker):
         return book
 
 
+@dataclasses.dataclass
+class TechniqueNode(object):
+    """A single shared step in a 'PrefixTrie'.
+
+    Args:
+        technique (Optional[core.Technique]): instance applied at this node.
+            Only the root node of a 'PrefixTrie' has a 'technique' of None.
+        depth (Optional[int]): number of techniques applied once this node has
+            been applied. Defaults to 0.
+        children (Optional[Dict[Tuple[str, str, str], 'TechniqueNode']]): keys
+            are technique keys (see 'PrefixTrie.make_key') and values are the
+            nodes which follow this one. Defaults to an empty dictionary.
+        chapters (Optional[List[int]]): indices of chapters in a book whose
+            shared prefix ends at this node. Defaults to an empty list.
+
+    """
+    technique: Optional[core.Technique] = None
+    depth: Optional[int] = 0
+    children: Optional[Dict[Tuple[str, str, str], 'TechniqueNode']] = (
+        dataclasses.field(default_factory = dict))
+    chapters: Optional[List[int]] = dataclasses.field(default_factory = list)
+
+    """ Dunder Methods """
+
+    def __iter__(self) -> Iterable:
+        """Returns iterable of child nodes."""
+        return iter(self.children.values())
+
+    def __len__(self) -> int:
+        """Returns number of nodes below and including this node."""
+        return 1 + sum(len(child) for child in self)
+
+
+@dataclasses.dataclass
+class PrefixTrie(object):
+    """Prefix tree of the 'Technique' instances in a parallel book.
+
+    A 'Comparer' book stores every combination of techniques as a separate
+    chapter, so chapters share long identical prefixes (for example, the same
+    fill, categorize, and scale steps). Storing the chapters in a trie allows
+    each shared prefix to be fit and applied once with its results reused by
+    every chapter below it.
+
+    Args:
+        root (Optional[TechniqueNode]): root node which does not store a
+            technique. Defaults to an empty 'TechniqueNode'.
+        boundaries (Optional[List[str]]): steps at which prefix sharing stops.
+            Techniques at and after a boundary step are applied separately for
+            each chapter because the step changes how the remaining techniques
+            are applied (for example, 'split' applies them to each fold and
+            'search' refits them for each candidate). Defaults to
+            ['split', 'search'].
+
+    """
+    root: Optional[TechniqueNode] = dataclasses.field(
+        default_factory = TechniqueNode)
+    boundaries: Optional[List[str]] = dataclasses.field(
+        default_factory = lambda: ['split', 'search'])
+
+    """ Factory Method """
+
+    @classmethod
+    def create(cls,
+            book: core.SimplePlan,
+            boundaries: Optional[List[str]] = None) -> 'PrefixTrie':
+        """Creates a 'PrefixTrie' from the chapters in 'book'.
+
+        Args:
+            book (core.SimplePlan): iterable storing chapter instances.
+            boundaries (Optional[List[str]]): steps at which prefix sharing
+                stops. Defaults to None. If not passed, ['split', 'search'] is
+                used.
+
+        Returns:
+            PrefixTrie: with a node for each distinct shared prefix.
+
+        """
+        if boundaries is None:
+            trie = cls()
+        else:
+            trie = cls(boundaries = boundaries)
+        for i, chapter in enumerate(book.chapters):
+            trie.add(chapter = chapter, index = i)
+        return trie
+
+    """ Dunder Methods """
+
+    def __iter__(self) -> Iterable:
+        """Returns iterable of top-level nodes."""
+        return iter(self.root)
+
+    def __len__(self) -> int:
+        """Returns number of nodes, excluding the root node."""
+        return len(self.root) - 1
+
+    """ Public Methods """
+
+    @staticmethod
+    def make_key(technique: core.Technique) -> Tuple[str, str, str]:
+        """Returns hashable key for identifying identical techniques.
+
+        Args:
+            technique (core.Technique): instance to make a key for.
+
+        Returns:
+            Tuple[str, str, str]: step, name, and parameters of 'technique'.
+
+        """
+        return (
+            str(getattr(technique, 'step', None)),
+            str(technique.name),
+            str(sorted(getattr(technique, 'parameters', {}).items())))
+
+    def add(self, chapter: core.SimplePlan, index: int) -> None:
+        """Adds techniques in 'chapter' to the trie.
+
+        Args:
+            chapter (core.SimplePlan): instance with 'techniques' to add.
+            index (int): position of 'chapter' in its book.
+
+        """
+        node = self.root
+        for technique in chapter.techniques:
+            if getattr(technique, 'step', None) in self.boundaries:
+                break
+            key = self.make_key(technique = technique)
+            if key not in node.children:
+                node.children[key] = TechniqueNode(
+                    technique = technique,
+                    depth = node.depth + 1)
+            node = node.children[key]
+        node.chapters.append(index)
+        return self
+
+
 @dataclasses.dataclass
 class Specialist(core.SimpleHandler):
     """Constructs 'Technique' with an 'algorithm' and 'parameters'.
@@ -831,24 +969,240 @@ class Scholar(core.SimpleHandler):
         instructions (Optional[Instructions]): an instance with information to
             create and apply the essential components of a Worker. Defaults to
             None.
+        prefix_sharing (Optional[bool]): whether chapters with identical
+            leading techniques should share the application of those
+            techniques through a 'PrefixTrie' (True) or whether each chapter
+            should be applied from scratch (False). Defaults to False.
+        prefix_boundaries (Optional[List[str]]): steps at which prefix sharing
+            stops. Defaults to ['split', 'search'].
 
     """
     name: Optional[str] = None
     instructions: Optional[Instructions] = None
     idea: Optional[core.Idea] = None
+    prefix_sharing: Optional[bool] = False
+    prefix_boundaries: Optional[List[str]] = dataclasses.field(
+        default_factory = lambda: ['split', 'search'])
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
         self = self.idea.apply(instance = self)
         return self
 
+    """ Public Methods """
+
+    def compare_execution(self,
+            book: 'Book',
+            data: 'Dataset') -> Dict[str, float]:
+        """Times applying 'book' with and without prefix sharing.
+
+        Both modes are applied to a deep copy of 'book' and a fork of 'data'
+        so that neither is modified.
+
+        Args:
+            book ('Book'): instance with stored 'Chapter' instances.
+            data ('Dataset'): primary instance used by 'project'.
+
+        Returns:
+            Dict[str, float]: wall-clock seconds for the 'flat' and 'prefix'
+                modes along with the number of technique applications each
+                mode requires.
+
+        """
+        report = {}
+        for mode, method in {
+                'flat': self._apply_chapters,
+                'prefix': self._apply_trie}.items():
+            trial_book = copy.deepcopy(book)
+            trial_data = self._fork_data(data = data, last = False)
+            start = time.perf_counter()
+            method(book = trial_book, data = trial_data)
+            report[mode] = time.perf_counter() - start
+        trie = PrefixTrie.create(
+            book = book,
+            boundaries = self.prefix_boundaries)
+        report['flat_applications'] = sum(
+            len(chapter.techniques) for chapter in book.chapters)
+        report['prefix_applications'] = self._count_applications(
+            node = trie.root,
+            book = book)
+        if self.verbose:
+            print('Flat application took', f'{report["flat"]:.3f}', 'seconds')
+            print('Prefix application took', f'{report["prefix"]:.3f}',
+                  'seconds')
+        return report
+
     """ Private Methods """
 
+    def _apply_common_prefix(self,
+            book: 'Book',
+            data: 'Dataset') -> Tuple[int, 'Dataset']:
+        """Applies the techniques which begin every chapter in 'book' once.
+
+        Chapters applied in separate worker processes cannot share prefixes
+        with each other, so the prefix common to all of them is applied before
+        they are sent. Each chapter is pointed at the shared, fitted
+        techniques.
+
+        Args:
+            book ('Book'): instance with stored 'Chapter' instances.
+            data ('Dataset'): primary instance used by 'project'.
+
+        Returns:
+            Tuple[int, 'Dataset']: number of techniques applied and 'data'
+                with them applied.
+
+        """
+        trie = PrefixTrie.create(
+            book = book,
+            boundaries = self.prefix_boundaries)
+        node = trie.root
+        path = []
+        while len(node.children) == 1 and not node.chapters:
+            node = next(iter(node))
+            if not node.technique.name in ['none', None]:
+                if self.verbose:
+                    print('Applying', node.technique.name, 'to', data.name)
+                data = node.technique.apply(data = data)
+            path.append(node.technique)
+        for chapter in book.chapters:
+            chapter.techniques[:node.depth] = path
+        return node.depth, data
+
+    def _apply_trie(self,
+            book: 'Book',
+            data: 'Dataset') -> 'Book':
+        """Applies 'chapters' in 'book' to 'data' sharing common prefixes.
+
+        Each distinct prefix of techniques is applied once and the resulting
+        'data' is reused by every chapter which begins with that prefix. 'data'
+        is only forked where the trie branches.
+
+        Args:
+            book ('Book'): instance with stored 'Chapter' instances.
+            data ('Dataset'): primary instance used by 'project'.
+
+        Returns:
+            'Book': with modifications made and/or 'data' incorporated.
+
+        """
+        trie = PrefixTrie.create(
+            book = book,
+            boundaries = self.prefix_boundaries)
+        self._apply_node(node = trie.root, book = book, data = data, path = [])
+        return book
+
+    def _apply_node(self,
+            node: TechniqueNode,
+            book: 'Book',
+            data: 'Dataset',
+            path: List[core.Technique]) -> None:
+        """Applies 'node' and then every branch below it.
+
+        Args:
+            node (TechniqueNode): node in a 'PrefixTrie' to apply.
+            book ('Book'): instance with stored 'Chapter' instances.
+            data ('Dataset'): instance with all prefixes above 'node' applied.
+            path (List[core.Technique]): applied techniques above 'node'.
+
+        """
+        if node.technique is not None:
+            if not node.technique.name in ['none', None]:
+                if self.verbose:
+                    print('Applying', node.technique.name, 'to', data.name)
+                data = node.technique.apply(data = data)
+            path = path + [node.technique]
+        remaining = len(node.chapters) + len(node.children)
+        for index in node.chapters:
+            remaining -= 1
+            chapter = book.chapters[index]
+            # Points the chapter at the shared, already fitted techniques.
+            chapter.techniques[:node.depth] = path
+            self._apply_suffix(
+                manuscript = chapter,
+                start = node.depth,
+                data = self._fork_data(data = data, last = remaining == 0))
+        for child in node:
+            remaining -= 1
+            self._apply_node(
+                node = child,
+                book = book,
+                data = self._fork_data(data = data, last = remaining == 0),
+                path = path)
+        return self
+
+    def _apply_suffix(self,
+            manuscript: 'Chapter',
+            start: int,
+            data: 'Dataset') -> 'Chapter':
+        """Applies the techniques in 'manuscript' after a shared prefix.
+
+        Args:
+            manuscript ('Chapter'): instance with stored 'techniques'.
+            start (int): index of the first technique not yet applied.
+            data ('Dataset'): instance with the shared prefix applied.
+
+        Returns:
+            'Chapter': with modifications made and 'data' incorporated.
+
+        """
+        for technique in manuscript.techniques[start:]:
+            if self.verbose:
+                print('Applying', technique.name, 'to', data.name)
+            data = technique.apply(data = data)
+        setattr(manuscript, 'data', data)
+        return manuscript
+
+    def _count_applications(self, node: TechniqueNode, book: 'Book') -> int:
+        """Returns number of technique applications made by '_apply_trie'.
+
+        Args:
+            node (TechniqueNode): node in a 'PrefixTrie' to count from.
+            book ('Book'): instance with stored 'Chapter' instances.
+
+        Returns:
+            int: applications at and below 'node'.
+
+        """
+        count = 0 if node.technique is None else 1
+        for index in node.chapters:
+            count += len(book.chapters[index].techniques) - node.depth
+        for child in node:
+            count += self._count_applications(node = child, book = book)
+        return count
+
+    def _fork_data(self,
+            data: Union['Dataset', 'Book'],
+            last: bool,
+            label: Optional[str] = None) -> Union['Dataset', 'Book']:
+        """Returns 'data' for a chapter or a branch of a 'PrefixTrie'.
+
+        Args:
+            data (Union['Dataset', 'Book']): instance to fork.
+            last (bool): whether this is the last user of 'data', in which
+                case no fork is needed.
+            label (Optional[str]): name of the fork in its 'lineage'.
+                Defaults to None.
+
+        Returns:
+            Union['Dataset', 'Book']: 'data' itself or a copy-on-write fork of
+                it. A 'Book' is never forked.
+
+        """
+        if last or not isinstance(data, Dataset):
+            return data
+        else:
+            return data.fork(label = label)
+
+
     def _apply_chapters(self,
             book: 'Book',
             data: Union['Dataset', 'Book']) -> 'Book':
         """Applies 'chapters' in 'Book' instance in 'project' to 'data'.
 
+        Each chapter is applied to its own copy-on-write fork of 'data', so
+        that chapters do not see changes made by other chapters.
+
         Args:
             book ('Book'): instance with stored 'Chapter' instances.
             data ('Dataset'): primary instance used by 'project'.
@@ -863,7 +1217,10 @@ class Scholar(core.SimpleHandler):
                 print('Applying', chapter.name, str(i + 1), 'to', data.name)
             new_chapters.append(self._apply_techniques(
                 manuscript = chapter,
-                data = data))
+                data = self._fork_data(
+                    data = data,
+                    last = False,
+                    label = chapter.name)))
         book.chapters = new_chapters
         return book
 
@@ -912,6 +1269,8 @@ class Scholar(core.SimpleHandler):
         """
         if hasattr(book, 'techniques'):
             book = self._apply_techniques(manuscript = book, data = data)
+        elif self.prefix_sharing:
+            book = self._apply_trie(book = book, data = data)
         else:
             book = self._apply_chapters(book = book, data = data)
         return book
\ No newline at end of file
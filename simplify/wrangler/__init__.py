@@ -6,10 +6,16 @@
 :license: Apache-2.0
 """
 
-from .manual import Manual
+from simplify.lazy import make_lazy
 
 __version__ = '0.1.1'
 
 __author__ = 'Corey Rayburn Yung'
 
-__all__ = ['Manual']
\ No newline at end of file
+__all__ = ['Manual']
+
+# Public object names and the modules where they are located.
+_LAZY_OBJECTS = {'Manual': '.manual'}
+
+
+__getattr__, __dir__ = make_lazy(package = __name__, objects = _LAZY_OBJECTS)
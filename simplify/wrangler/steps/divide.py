@@ -6,34 +6,272 @@
 :license: Apache-2.0
 """
 
-from dataclasses.dataclasses import dataclasses.dataclass
+import concurrent.futures
+import dataclasses
+import glob
+import io
+import json
 import os
+import shutil
+
+import pandas as pd
 
 from simplify.core.definitionsetter import WranglerTechnique
 
 
+# File extensions which have a header line.
+HEADER_EXTENSIONS = ['.csv', '.tsv']
+# File extensions which can be divided at line boundaries.
+LINE_EXTENSIONS = ['.csv', '.tsv', '.jsonl', '.ndjson', '.txt']
+
+
+def _find_boundaries(file_path, start, shard_size):
+    """Returns byte offsets of shards which begin at the start of a line.
+
+    Args:
+        file_path(str): path of the file to divide.
+        start(int): offset of the first record (after any header).
+        shard_size(int): approximate number of bytes in each shard.
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [start]
+    with open(file_path, 'rb') as source:
+        position = start + shard_size
+        while position < size:
+            source.seek(position)
+            # Moves to the start of the next record.
+            source.readline()
+            boundary = source.tell()
+            if boundary >= size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+            position = boundary + shard_size
+    boundaries.append(size)
+    return boundaries
+
+
+def _copy_range(file_path, start, end, shard_path, header):
+    """Copies bytes 'start' to 'end' of 'file_path' after 'header'."""
+    with open(file_path, 'rb') as source, open(shard_path, 'wb') as shard:
+        shard.write(header)
+        source.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = source.read(min(remaining, 1 << 20))
+            if not block:
+                break
+            shard.write(block)
+            remaining -= len(block)
+    return {'path': shard_path, 'start': start, 'end': end,
+            'bytes': os.path.getsize(shard_path)}
+
+
+def _hash_range(file_path, start, end, header, key, shards, folder, stem,
+                part, read_kwargs):
+    """Writes rows in a byte range of a csv file to shards by 'key' hash.
+
+    Each call writes its own part file for every shard that receives rows,
+    so calls never write to the same file. Values are read as text so that a
+    key hashes the same way in every range, whatever datatype pandas would
+    infer from the rows in that range.
+    """
+    with open(file_path, 'rb') as source:
+        source.seek(start)
+        data = header + source.read(end - start)
+    df = pd.read_csv(io.BytesIO(data), **read_kwargs)
+    codes = pd.util.hash_pandas_object(df[key], index = False) % shards
+    extension = os.path.splitext(file_path)[1].lower()
+    written = []
+    for shard, rows in df.groupby(codes.to_numpy()):
+        shard_path = os.path.join(
+            folder, f'{stem}_shard{int(shard):04d}_part{part:04d}{extension}')
+        rows.to_csv(shard_path, index = False, sep = read_kwargs['sep'])
+        written.append({'shard': int(shard), 'path': shard_path,
+                        'rows': len(rows)})
+    return written
+
+
 @dataclasses.dataclass
 class Divide(WranglerTechnique):
     """Divides data source files so that they can be loaded in memory.
 
+    Files are divided either by byte ranges which end at record boundaries
+    ('bytes') or by the hash of a key column ('hash'), so that every row with
+    the same key is in the same shard. Shards are written in parallel to a
+    subfolder of the interim folder with a json manifest describing them.
+    Records are assumed to be single lines, so csv files must not have line
+    breaks inside quoted values.
+
     Args:
         step(str): name of step.
         parameters(dict): dictionary of parameters to pass to selected
-            algorithm.
+            algorithm. 'file_paths' may list the files to divide.
         name(str): name of class for matching settings in the Idea instance
             and elsewhere in the siMpLify package.
         auto_draft(bool): whether 'publish' method should be called when
             the class is instanced. This should generally be set to True.
+        method(str): 'bytes' or 'hash'.
+        shard_size(int): approximate number of bytes in each shard, and in
+            each range read by a worker when hashing. Defaults to 256 MB.
+        shards(int): number of shards when 'method' is 'hash'.
+        key(str): name of the column hashed when 'method' is 'hash'.
+        max_workers(int): number of parallel workers. If None, one per CPU.
+        encoding(str): encoding of csv files when 'method' is 'hash'.
     """
 
     step: object = None
     parameters: object = None
     name: str = 'converter'
     auto_draft: bool = True
+    method: str = 'bytes'
+    shard_size: int = 256_000_000
+    shards: int = 16
+    key: str = None
+    max_workers: int = None
+    encoding: str = 'utf-8'
 
     def __post_init__(self) -> None:
         super().__post_init__()
         return self
 
-    def publish(self, dataset):
-        return self
+    def _read_header(self, file_path):
+        """Returns header line of 'file_path' and offset of first record."""
+        if os.path.splitext(file_path)[1].lower() in HEADER_EXTENSIONS:
+            with open(file_path, 'rb') as source:
+                header = source.readline()
+            return header, len(header)
+        return b'', 0
+
+    def _make_folder(self, file_path, folder):
+        """Returns an empty folder for shards of 'file_path'.
+
+        Shards from an earlier division (a folder with a manifest) are
+        replaced, but other folders which are not empty are never removed.
+        """
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        folder = folder or os.path.join(self.clerk['interim'], 'shards')
+        folder = os.path.join(folder, stem)
+        if os.path.isdir(folder) and os.listdir(folder):
+            if os.path.isfile(os.path.join(folder, 'manifest.json')):
+                shutil.rmtree(folder)
+            else:
+                raise FileExistsError(' '.join(
+                    [folder, 'is not empty and does not contain shards']))
+        os.makedirs(folder, exist_ok = True)
+        return folder, stem
+
+    def _divide_bytes(self, file_path, folder, stem, boundaries, header,
+                      executor):
+        extension = os.path.splitext(file_path)[1]
+        futures = [
+            executor.submit(
+                _copy_range,
+                file_path,
+                start,
+                end,
+                os.path.join(folder, f'{stem}_shard{number:04d}{extension}'),
+                header)
+            for number, (start, end) in enumerate(
+                zip(boundaries[:-1], boundaries[1:]))]
+        return [future.result() for future in futures]
+
+    def _divide_hash(self, file_path, folder, stem, boundaries, header,
+                     executor):
+        if not self.key:
+            raise ValueError('hash division requires a key column')
+        if os.path.splitext(file_path)[1].lower() in ['.tsv']:
+            separator = '\t'
+        else:
+            separator = ','
+        read_kwargs = {'encoding': self.encoding,
+                       'sep': separator,
+                       'dtype': str,
+                       'keep_default_na': False}
+        futures = [
+            executor.submit(
+                _hash_range,
+                file_path,
+                start,
+                end,
+                header,
+                self.key,
+                self.shards,
+                folder,
+                stem,
+                part,
+                read_kwargs)
+            for part, (start, end) in enumerate(
+                zip(boundaries[:-1], boundaries[1:]))]
+        shards = {}
+        for future in futures:
+            for written in future.result():
+                shard = shards.setdefault(
+                    written['shard'],
+                    {'shard': written['shard'], 'paths': [], 'rows': 0})
+                shard['paths'].append(written['path'])
+                shard['rows'] += written['rows']
+        return [shards[number] for number in sorted(shards)]
+
+    def divide(self, file_path, folder = None):
+        """Divides 'file_path' into shards and writes a manifest.
+
+        Args:
+            file_path(str): path of a csv, tsv, json lines, or text file.
+            folder(str): folder where a subfolder of shards is created.
+                Defaults to the 'shards' subfolder of the interim folder.
+
+        Returns:
+            dict: the manifest, which is also saved as 'manifest.json' in
+                the folder of shards.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in LINE_EXTENSIONS:
+            raise ValueError(' '.join(
+                [extension, 'files cannot be divided at record boundaries']))
+        if self.method in ['hash'] and extension not in HEADER_EXTENSIONS:
+            raise ValueError('hash division requires a csv or tsv file')
+        folder, stem = self._make_folder(file_path = file_path,
+                                         folder = folder)
+        header, start = self._read_header(file_path = file_path)
+        boundaries = _find_boundaries(file_path = file_path,
+                                      start = start,
+                                      shard_size = self.shard_size)
+        if self.method in ['hash']:
+            pool = concurrent.futures.ProcessPoolExecutor
+        else:
+            # Copying bytes releases the GIL, so threads are enough.
+            pool = concurrent.futures.ThreadPoolExecutor
+        with pool(max_workers = self.max_workers) as executor:
+            shards = getattr(self, '_divide_' + self.method)(
+                file_path = file_path,
+                folder = folder,
+                stem = stem,
+                boundaries = boundaries,
+                header = header,
+                executor = executor)
+        status = os.stat(file_path)
+        manifest = {
+            'source': os.path.abspath(file_path),
+            'bytes': status.st_size,
+            'modified': status.st_mtime,
+            'method': self.method,
+            'key': self.key,
+            'header': header.decode(self.encoding, errors = 'replace'),
+            'shards': shards}
+        with open(os.path.join(folder, 'manifest.json'), 'w') as stored:
+            json.dump(manifest, stored, indent = 2)
+        return manifest
+
+    def publish(self, dataset = None):
+        """Divides files in 'parameters' or every divisible raw file."""
+        parameters = self.parameters or {}
+        file_paths = parameters.get('file_paths')
+        if not file_paths:
+            file_paths = sorted(
+                path for path in glob.glob(
+                    os.path.join(self.clerk['raw'], '*'))
+                if os.path.splitext(path)[1].lower() in LINE_EXTENSIONS)
+        self.manifests = [
+            self.divide(file_path = file_path) for file_path in file_paths]
+        return dataset
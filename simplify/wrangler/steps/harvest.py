@@ -6,9 +6,13 @@
 :license: Apache-2.0
 """
 
-from dataclasses.dataclasses import dataclasses.dataclass
+import dataclasses
+import glob
+import itertools
 import os
 
+import pandas as pd
+
 from simplify.core.definitionsetter import WranglerTechnique
 
 
@@ -36,11 +40,20 @@ class Harvest(SimpleIterable):
             and elsewhere in the siMpLify package.
         auto_draft(bool): whether 'publish' method should be called when
             the class is instanced. This should generally be set to True.
+        max_workers(int): number of processes used to organize and parse
+            text. If None, one process per CPU is used. Defaults to 1.
+        chunk_size(int): number of strings sent to a process at a time.
+            Defaults to 10,000.
+        block_size(int): number of documents in each DataFrame produced by
+            'stream' and 'export_stream'. Defaults to 10,000.
     """
 
     steps: object = None
     name: str = 'harvester'
     auto_draft: bool = True
+    max_workers: int = 1
+    chunk_size: int = 10_000
+    block_size: int = 10_000
 
     def __post_init__(self) -> None:
         super().__post_init__()
@@ -50,7 +63,11 @@ class Harvest(SimpleIterable):
         file_path = os.path.join(self.clerk.techniques,
                                  'organizer_' + key + '.csv')
         self.parameters = {'step': self.step,
-                           'file_path': file_path}
+                           'file_path': file_path,
+                           'max_workers': self.max_workers,
+                           'chunk_size': self.chunk_size,
+                           'cache_folder': os.path.join(
+                               self.clerk.techniques, 'compiled')}
         algorithm = self.workers[self.step](**self.parameters)
         self._set_columns(algorithm)
         return algorithm
@@ -59,7 +76,11 @@ class Harvest(SimpleIterable):
         file_path = os.path.join(self.clerk.techniques,
                                  'parser_' + key + '.csv')
         self.parameters = {'step': self.step,
-                           'file_path': file_path}
+                           'file_path': file_path,
+                           'max_workers': self.max_workers,
+                           'chunk_size': self.chunk_size,
+                           'cache_folder': os.path.join(
+                               self.clerk.techniques, 'compiled')}
         algorithm = self.workers[self.step](**self.parameters)
         return algorithm
 
@@ -93,4 +114,106 @@ class Harvest(SimpleIterable):
             else:
                 algorithm = getattr(self, '_publish_generic_list')(key = key)
             self.algorithms.append(algorithm)
-        return self
\ No newline at end of file
+        return self
+
+    def _iterate_documents(self, sources, file_pattern = '*.txt',
+                           per_line = False, encoding = 'utf-8'):
+        """Yields (document id, text) from files without reading them all.
+
+        Args:
+            sources(str or list): file paths or folders. Folders are searched
+                recursively for files matching 'file_pattern'.
+            file_pattern(str): glob pattern for files in folders.
+            per_line(bool): whether each line of a file is a document (True)
+                or each file is a document (False).
+            encoding(str): text encoding of the files.
+        """
+        if isinstance(sources, (str, os.PathLike)):
+            sources = [sources]
+        for source in sources:
+            if os.path.isdir(source):
+                file_paths = sorted(glob.glob(
+                    os.path.join(source, '**', file_pattern),
+                    recursive = True))
+            else:
+                file_paths = [source]
+            for file_path in file_paths:
+                with open(file_path, 'r', encoding = encoding,
+                          errors = 'replace') as document:
+                    if per_line:
+                        for number, line in enumerate(document):
+                            yield (f'{file_path}:{number}',
+                                   line.rstrip('\r\n'))
+                    else:
+                        yield file_path, document.read()
+
+    def _harvest_block(self, df, source):
+        """Applies organizers and then parsers to one block of documents."""
+        for algorithm in self.algorithms:
+            if algorithm.step in ['organize']:
+                df, source = algorithm.implement(df = df, source = source)
+            else:
+                df = algorithm.implement(df = df, source = source)
+        return df
+
+    def stream(self, sources, file_pattern = '*.txt', per_line = False,
+               encoding = 'utf-8', source_column = 'source'):
+        """Yields harvested DataFrames of at most 'block_size' documents.
+
+        Documents are read lazily, so only one block is held in memory at a
+        time.
+
+        Args:
+            sources(str or list): file paths or folders of documents.
+            file_pattern(str): glob pattern for files in folders.
+            per_line(bool): whether each line of a file is a document.
+            encoding(str): text encoding of the files.
+            source_column(str): name of the column holding document text
+                while it is organized and parsed.
+        """
+        documents = self._iterate_documents(sources = sources,
+                                            file_pattern = file_pattern,
+                                            per_line = per_line,
+                                            encoding = encoding)
+        start = 0
+        while True:
+            block = list(itertools.islice(documents, self.block_size))
+            if not block:
+                return
+            # Numbers rows across blocks so that indices stay unique.
+            df = pd.DataFrame(block,
+                              columns = ['document', source_column],
+                              index = range(start, start + len(block)))
+            start += len(block)
+            yield self._harvest_block(df = df, source = source_column)
+
+    def export_stream(self, sources, file_name = 'harvested',
+                      file_format = None, **kwargs):
+        """Harvests 'sources' and saves each block to the interim folder.
+
+        Blocks are handed to 'clerk' as soon as they are harvested, so the
+        size of a corpus is limited by disk rather than memory. If the
+        'clerk' exporter is asynchronous, writing a block overlaps with
+        harvesting the next one.
+
+        Args:
+            sources(str or list): file paths or folders of documents.
+            file_name(str): prefix of the exported file names. Each block is
+                saved as '{file_name}_{number}'.
+            file_format(str): key of a file format in 'clerk'. Defaults to
+                the 'interim_format' of 'clerk'.
+            kwargs: passed to 'stream'.
+
+        Returns:
+            int: number of blocks exported.
+        """
+        file_format = file_format or self.clerk.interim_format
+        count = 0
+        for count, block in enumerate(self.stream(sources = sources,
+                                                  **kwargs), start = 1):
+            self.clerk.save(variable = block,
+                            folder = 'interim',
+                            file_name = f'{file_name}_{count:05d}',
+                            file_format = file_format)
+        self.clerk.flush()
+        return count
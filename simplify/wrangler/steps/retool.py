@@ -16,10 +16,18 @@ classes and methods to address the specified goals based upon the
 arguments passed.
 """
 
-from dataclasses.dataclasses import dataclasses.dataclass
+import concurrent.futures
+import dataclasses
+import hashlib
+import io
+import itertools
+import os
+import pickle
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
 import numpy as np
 import pandas as pd
-import re
 
 from simplify.core.definitionsetter import SimpleDirector
 
@@ -33,16 +41,14 @@ class ReTool(SimpleDirector):
     particularly help data scientists munging text data with keywords instead
     of natural language processing.
 
-    Because the methods iterrate through the expressions dictionaries, any
-    efficiency gains of vectorization in the target dataframes or series are
-    lost with very long lookup tables. Further, because regular expressions
-    cannot be hashed like ordinary dictionary keys, some of the speed
-    advantages of dictionaries cannot be replicated. The tipping point for
-    expressions dataframe length versus using .apply or other non-vectorized
-    options for matching varies and needs to be tested based upon the
-    particular use case. The normal use case where ReTool has efficiency gains
-    is with a very large dataframe and a relatively small (< 500 rows)
-    expressions dictionary.
+    Keyword and parse tables are compiled into a single 'ReMatcher', so each
+    string is scanned once regardless of the length of the expressions
+    table. Large text columns may be divided into blocks of 'chunk_size'
+    strings and matched in 'max_workers' processes.
+
+    If 'file_path' and 'cache_folder' are set, the loaded table is stored
+    in 'cache_folder' as a 'ReTable' keyed by a hash of the file and reused
+    until the file changes.
     """
     step: str
     keys: str = 'keys'
@@ -56,6 +62,9 @@ class ReTool(SimpleDirector):
     section_prefix: str = 'section'
     edit_prefixes: bool = True
     auto_draft: bool = True
+    max_workers: int = 1
+    chunk_size: int = 10_000
+    cache_folder: str = ''
 
     def __post_init__(self) -> None:
         self.draft()
@@ -91,25 +100,6 @@ class ReTool(SimpleDirector):
                 raise AttributeError(error)
         return df, source
 
-    def _compile_expressions(self):
-        """Compiles regular expressions (whether built or loaded)."""
-        for i, row in self.expressions.iterrows():
-            self._aggregate_flags(row)
-            if self.flags:
-                self.expressions.loc[i, self.keys] = (
-                    re.compile(self.expressions.loc[i, self.keys],
-                               flags = self.flags))
-            else:
-                self.expressions.loc[i, self.keys] = (
-                    re.compile(self.expressions.loc[i, self.keys]))
-        return self
-
-    def _convert_to_dict(self):
-        self.expressions = self.expressions[[self.keys, self.values]]
-        self.expressions = (self.expressions.set_index(
-                self.keys).to_dict()[self.values])
-        return self
-
     def draft(self) -> None:
         # Sets str names for corresponding regex compiling flags.
         self.flag_options = {'ignorecase': re.IGNORECASE,
@@ -119,9 +109,10 @@ class ReTool(SimpleDirector):
                              'verbose': re.VERBOSE,
                              'ascii': re.ASCII}
         # Sets options for matcher classes.
-        self._options = SimpleRepository(contents = {'organize': ReOrganize,
+        self.workers = {'organize': ReOrganize,
                         'parse': ReSearch,
                         'keyword': ReFrame}
+        self.default_values = ReTypes().draft().default_values
         return self
 
     def _set_matcher(self):
@@ -130,130 +121,625 @@ class ReTool(SimpleDirector):
                       'sections': self.sections,
                       'datatypes': self.datatypes,
                       'edit_prefixes': self.edit_prefixes,
-                      'section_prefix': self.section_prefix}
+                      'section_prefix': self.section_prefix,
+                      'max_workers': self.max_workers,
+                      'chunk_size': self.chunk_size}
+        # Reuses the matcher compiled with the loaded or cached table.
+        if self.step in ['keyword', 'parse']:
+            parameters['matcher'] = self.table.matcher
         self.matcher = self.workers[self.step](**parameters)
         self.matcher.default_values = self.default_values
         return self
 
     def publish(self):
+        """Compiles the expressions table and creates 'matcher'.
+
+        The table is loaded from 'file_path' (or from 'cache_folder', if
+        it was compiled before) or built from 'keys' and 'values'.
+        """
         if self.file_path:
-            tool = ReLoad(keys = self.keys,
-                          values = self.values,
-                          sections = self.sections,
-                          datatypes = self.datatypes,
-                          file_path = self.file_path,
-                          auto_draft = self.auto_draft,
-                          encoding = self.encoding,
-                          section_prefix = self.section_prefix,
-                          flag_options = self.flag_options)
+            self.table = ReTable.create(
+                file_path = self.file_path,
+                folder = self.cache_folder,
+                keys = self.keys,
+                values = self.values,
+                encoding = self.encoding,
+                flag_options = self.flag_options)
         else:
-            tool = ReBuild(keys = self.keys,
-                           values = self.values,
-                           sections = self.sections,
-                           datatypes = self.datatypes,
-                           flags = self.flags,
-                           zipped = self.zipped,
-                           auto_draft = self.auto_draft,
-                           section_prefix = self.section_prefix,
-                           flag_options = self.flag_options)
-            self.keys = tool.keys
-            self.values = tool.values
-        self.sections = tool.sections
-        self.datatypes = tool.datatypes
-        self.expressions = tool.expressions
-        self._compile_expressions()
-        self._convert_to_dict()
+            expressions = pd.DataFrame({
+                'keys': list(self.keys),
+                'values': list(self.values)})
+            for flag in self.flag_options.keys():
+                if self.flags and flag in self.flags:
+                    expressions[flag] = True
+            self.table = ReTable.from_frame(
+                table = expressions,
+                flag_options = self.flag_options)
+            # Keeps sections and datatypes passed with the keys and values.
+            self.table.sections = self.table.sections or self.sections
+            self.table.datatypes = self.table.datatypes or self.datatypes
+        self.sections = self.table.sections
+        self.datatypes = self.table.datatypes
+        self.expressions = self.table.expressions
         self._set_matcher()
         return self
 
-    def publish(self, data = None, df = None, source = None,
-              remove_from_source = True):
-        df, source = self._check_dataset(data = dataset,
-                                             df = df,
-                                             source = source)
-        if remove_from_source:
-            df, source = self.matcher.implement(df = df, source = source)
-        else:
-            df = self.matcher.implement(df = df, source = source)
-        return dataset
+    def implement(self, df, source):
+        """Applies 'matcher' to 'source' and adds its output to 'df'."""
+        return self.matcher.implement(df = df, source = source)
 
     def update(self, key, value):
         self.expressions.update({key: value})
         return self
 
 
+# State shipped once to each worker process by '_initialize_worker'.
+_WORKER_STATE = {}
+
+
+def _initialize_worker(state: Dict[str, Any]) -> None:
+    """Stores 'state' for every chunk applied in a worker process."""
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+    return
+
+
+def _apply_chunk(function: Callable, items: List[Any]) -> Any:
+    """Calls 'function' on 'items' with the state of the worker process."""
+    return function(items, **_WORKER_STATE)
+
+
+def _map_chunks(function: Callable,
+        items: List[Any],
+        state: Dict[str, Any],
+        chunk_size: int = 10_000,
+        max_workers: Optional[int] = 1) -> List[Any]:
+    """Applies 'function' to blocks of 'items' and returns results in order.
+
+    Args:
+        function (Callable): module-level function which takes a list of
+            items and the keyword arguments in 'state'.
+        items (List[Any]): items to divide into blocks.
+        state (Dict[str, Any]): keyword arguments for 'function'. In a process
+            pool, they are pickled once per worker instead of once per block.
+        chunk_size (int): number of items in each block. Defaults to 10,000.
+        max_workers (Optional[int]): number of worker processes. If 1, blocks
+            are applied in this process. If None, one worker per CPU is used.
+            Defaults to 1.
+
+    Returns:
+        List[Any]: results of 'function' for each block in order.
+
+    """
+    chunks = [
+        items[start:start + chunk_size]
+        for start in range(0, len(items), chunk_size)]
+    if max_workers == 1 or len(chunks) < 2:
+        return [function(chunk, **state) for chunk in chunks]
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers = max_workers,
+            initializer = _initialize_worker,
+            initargs = (state,)) as executor:
+        return list(executor.map(
+            _apply_chunk, itertools.repeat(function), chunks))
+
+
+def _match_chunk(items: List[str], matcher: 'ReMatcher') -> Tuple[
+        np.ndarray, np.ndarray, List[str]]:
+    """Returns matches of 'matcher' in 'items'."""
+    return matcher.match(source = items)
+
+
+def _organize_chunk(items: List[str],
+        expressions: List[Tuple[Union[str, re.Pattern], str]],
+        default: str) -> Tuple[List[Dict[str, str]], List[str]]:
+    """Divides each of 'items' into sections with 'expressions'.
+
+    Each expression is searched in order. Its first match is stored under its
+    output column and all of its matches are removed before the next
+    expression is searched.
+
+    Args:
+        items (List[str]): strings to divide.
+        expressions (List[Tuple[Union[str, re.Pattern], str]]): keys and
+            output column names.
+        default (str): value stored when an expression does not match.
+
+    Returns:
+        Tuple[List[Dict[str, str]], List[str]]: output values for each item
+            and each item with every matched section removed.
+
+    """
+    records = []
+    remainders = []
+    for source in items:
+        record = {}
+        if isinstance(source, str):
+            for key, out_column in expressions:
+                match = re.search(key, source)
+                if match:
+                    record[out_column] = match.group(0).strip()
+                    source = re.sub(key, '', source)
+                else:
+                    record[out_column] = default
+        records.append(record)
+        remainders.append(source)
+    return records, remainders
+
+
+# Characters which make a key a regular expression instead of a literal.
+_METACHARACTERS = re.compile(r'[\\.^$*+?{}\[\]|()]')
+# Flags which do not change how a literal key matches.
+_LITERAL_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE
+# Leading global flags in a key, such as '(?i)'.
+_INLINE_FLAGS = re.compile(r'^\(\?([aiLmsux]+)\)')
+_FLAG_LETTERS = {
+    'a': re.ASCII,
+    'i': re.IGNORECASE,
+    'L': re.LOCALE,
+    'm': re.MULTILINE,
+    's': re.DOTALL,
+    'u': re.UNICODE,
+    'x': re.VERBOSE}
+# Flags which may be scoped to one alternative with '(?flags:...)'.
+_SCOPED_FLAGS = {
+    re.IGNORECASE: 'i',
+    re.MULTILINE: 'm',
+    re.DOTALL: 's',
+    re.VERBOSE: 'x'}
+
+
+def _make_trie(words: Iterable[str]) -> str:
+    """Returns regular expression of 'words' arranged as a prefix tree.
+
+    The pattern matches the longest word at a position after testing only
+    the characters along one path of the tree, so its cost does not grow
+    with the number of words the way a flat alternation does.
+
+    Args:
+        words (Iterable[str]): literal strings to match.
+
+    Returns:
+        str: regular expression matching any of 'words'.
+
+    """
+    root = {}
+    for word in words:
+        node = root
+        for character in word:
+            node = node.setdefault(character, {})
+        node[''] = True
+
+    def _branch(node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(character) + _branch(child)
+            for character, child in sorted(node.items()) if character]
+        if not branches:
+            return ''
+        elif len(branches) == 1:
+            body = branches[0]
+        else:
+            body = '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return '(?:' + body + ')?'
+        else:
+            return body
+
+    return _branch(root)
+
+
+def _code_version() -> str:
+    """Returns hash of this module, which defines how tables are compiled."""
+    with open(__file__, 'rb') as module:
+        return hashlib.sha256(module.read()).hexdigest()
+
+
+def _make_flags(table: pd.DataFrame, flag_options: Dict[str, int]) -> np.ndarray:
+    """Returns combined regular expression flags for each row of 'table'.
+
+    Args:
+        table (pd.DataFrame): expressions table with an optional column for
+            each flag name in 'flag_options'. Cells which are True or a
+            string such as 'true', 'yes', or '1' set the flag.
+        flag_options (Dict[str, int]): flag names and 're' flags.
+
+    Returns:
+        np.ndarray: integer flags for each row.
+
+    """
+    flags = np.zeros(len(table), dtype = np.int64)
+    for name, flag in flag_options.items():
+        if name in table:
+            selected = (table[name].astype(str).str.strip().str.lower()
+                        .isin(['true', 'yes', 'y', '1', 'x']))
+            flags[selected.to_numpy()] |= int(flag)
+    return flags
+
+
 @dataclasses.dataclass
-class ReBuild(object):
+class ReMatcher(object):
+    """Compiled matcher which applies an expressions table in one scan.
+
+    Literal keys are combined into prefix tree patterns (one for case
+    sensitive keys and one for case insensitive keys). Other keys are
+    combined into one pattern which stops where any key matches and then
+    tries every key in its own lookahead with a named group. Keys with
+    backreferences or named groups cannot share group numbers and names and
+    are searched separately. Combined patterns are wrapped in a lookahead so
+    that matches starting at every position are found, including overlapping
+    matches.
+
+    At one position, the longest literal key is found and every key which is
+    a prefix of it is also reported. Every regular expression key which
+    matches at a position is reported, so results are the same as searching
+    each key separately.
+
+    Args:
+        keys (List[Union[str, re.Pattern]]): regular expressions or literal
+            strings to match. Compiled patterns keep their flags.
+        flags (Optional[List[int]]): regular expression flags for each key in
+            'keys' which is a string. Defaults to None.
 
-    keys: str = 'keys'
-    values: str = 'values'
-    sections: str = 'sections'
-    datatypes: str = 'datatypes'
-    flags: object = None
-    zipped: object = None
-    auto_draft: bool = True
-    section_prefix: str = 'section'
-    flag_options: object = None
+    """
+    keys: List[Union[str, re.Pattern]]
+    flags: Optional[List[int]] = None
 
     def __post_init__(self) -> None:
-        if self.auto_draft:
-            self.publish()
+        """Compiles the combined patterns."""
+        self.patterns = []
+        self.flags = self.flags or [0] * len(self.keys)
+        for index, key in enumerate(self.keys):
+            if isinstance(key, re.Pattern):
+                pattern, flags = key.pattern, key.flags & ~re.UNICODE
+            else:
+                pattern, flags = key, self.flags[index] or 0
+            # Moves leading inline flags into 'flags' so that the key can be
+            # combined with others.
+            inline = _INLINE_FLAGS.match(pattern)
+            if inline:
+                pattern = pattern[inline.end():]
+                for letter in inline.group(1):
+                    flags |= _FLAG_LETTERS[letter]
+                flags &= ~re.UNICODE
+            self.patterns.append((pattern, flags))
+        self.compile()
         return self
 
-    def publish(self):
-        """Builds regular expressions table."""
-        self.expressions = pd.DataFrame(list(zip(self.keys, self.values)),
-                                        columns = ['keys', 'values'])
-        # Implements common column naming scheme regardless of source of data
-        # for the expressions table.
-        self.keys = 'keys'
-        self.values = 'values'
-        for flag in self.flag_options.keys():
-            if self.flags and flag in self.flags:
-                self.expressions[flag] = True
+    """ Private Methods """
+
+    def _is_literal(self, pattern: str, flags: int) -> bool:
+        """Returns whether 'pattern' only matches itself."""
+        return (not _METACHARACTERS.search(pattern)
+                and not flags & ~_LITERAL_FLAGS
+                and bool(pattern))
+
+    def _scope(self, pattern: str, flags: int) -> str:
+        """Returns 'pattern' with its flags scoped to itself."""
+        letters = ''.join(
+            letter for flag, letter in _SCOPED_FLAGS.items() if flags & flag)
+        if letters:
+            return ''.join(['(?', letters, ':', pattern, ')'])
+        else:
+            return pattern
+
+    def _compile_sources(self) -> None:
+        """Compiles pattern strings in 'sources'."""
+        self.tries = {
+            folded: re.compile(
+                source, flags = re.IGNORECASE if folded else 0)
+            for folded, source in self.sources['tries'].items()}
+        if self.sources['alternation']:
+            self.alternation = re.compile(self.sources['alternation'])
+        else:
+            self.alternation = None
+        self.isolated = [
+            (index, re.compile(pattern, flags = flags))
+            for index, pattern, flags in self.sources['isolated']]
         return self
 
+    """ Public Methods """
+
+    def compile(self) -> None:
+        """Builds and compiles combined patterns from 'keys'."""
+        # Maps matched literal text to the indices of every key which is a
+        # prefix of that text, one mapping per case sensitivity.
+        self.literals = {False: {}, True: {}}
+        alternatives = []
+        lookaheads = []
+        self.groups = {}
+        self.sources = {'tries': {}, 'alternation': None, 'isolated': []}
+        for index, (pattern, flags) in enumerate(self.patterns):
+            if self._is_literal(pattern = pattern, flags = flags):
+                folded = bool(flags & re.IGNORECASE)
+                text = pattern.lower() if folded else pattern
+                self.literals[folded].setdefault(text, []).append(index)
+            elif re.search(r'\\\d|\(\?P[=<]', pattern):
+                self.sources['isolated'].append((index, pattern, flags))
+            else:
+                name = f'_k{index}'
+                self.groups[name] = index
+                scoped = self._scope(pattern = pattern, flags = flags)
+                alternatives.append(scoped)
+                # Each lookahead always succeeds and captures its key only if
+                # the key matches, so one key cannot hide another.
+                lookaheads.append(''.join(
+                    ['(?=(?P<', name, '>', scoped, ')|)']))
+        for folded, texts in self.literals.items():
+            if texts:
+                # Adds indices of keys which are prefixes of longer keys.
+                for text in sorted(texts, key = len):
+                    for end in range(1, len(text)):
+                        if text[:end] in texts:
+                            texts[text] = texts[text] + [
+                                i for i in texts[text[:end]]
+                                if i not in texts[text]]
+                self.sources['tries'][folded] = ''.join(
+                    ['(?=(', _make_trie(texts), '))'])
+        if alternatives:
+            self.sources['alternation'] = ''.join(
+                ['(?=(?:', '|'.join(alternatives), '))'] + lookaheads)
+        return self._compile_sources()
+
+    def search(self, source: str) -> List[Tuple[int, str]]:
+        """Returns indices of matching keys and matched text in 'source'.
+
+        Like 're.findall', matches of the same key do not overlap, but
+        matches of different keys may.
+
+        Args:
+            source (str): string to search.
+
+        Returns:
+            List[Tuple[int, str]]: index in 'keys' and matched text for each
+                match, in order of position for each kind of key.
+
+        """
+        found = []
+        ends = {}
+
+        def _add(index: int, start: int, text: str) -> None:
+            if start >= ends.get(index, 0):
+                ends[index] = start + max(len(text), 1)
+                found.append((index, text))
+
+        for folded, trie in self.tries.items():
+            texts = self.literals[folded]
+            for match in trie.finditer(source):
+                text = match.group(1)
+                for index in texts[text.lower() if folded else text]:
+                    _add(index, match.start(),
+                         text[:len(self.patterns[index][0])])
+        if self.alternation is not None:
+            for match in self.alternation.finditer(source):
+                for name, index in self.groups.items():
+                    text = match.group(name)
+                    if text is not None:
+                        _add(index, match.start(), text)
+        for index, pattern in self.isolated:
+            for match in pattern.finditer(source):
+                _add(index, match.start(), match.group(0))
+        return found
+
+    def match(self,
+            source: Iterable[str],
+            chunk_size: int = 10_000,
+            max_workers: Optional[int] = 1) -> Tuple[
+                np.ndarray, np.ndarray, List[str]]:
+        """Returns every match of every key in each item of 'source'.
+
+        Args:
+            source (Iterable[str]): strings to search. Missing values are
+                skipped.
+            chunk_size (int): number of items searched by a worker process at
+                a time. Defaults to 10,000.
+            max_workers (Optional[int]): number of worker processes. If 1,
+                'source' is searched in this process. If None, one worker per
+                CPU is used. Defaults to 1.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, List[str]]: positions in 'source',
+                indices in 'keys', and matched text of each match.
+
+        """
+        if max_workers != 1:
+            source = list(source)
+            results = _map_chunks(
+                function = _match_chunk,
+                items = source,
+                state = {'matcher': self},
+                chunk_size = chunk_size,
+                max_workers = max_workers)
+            offsets = range(0, len(source), chunk_size)
+            if not results:
+                return self.match(source = [])
+            return (
+                np.concatenate(
+                    [r[0] + offset for r, offset in zip(results, offsets)]),
+                np.concatenate([r[1] for r in results]),
+                list(itertools.chain.from_iterable(r[2] for r in results)))
+        rows = []
+        indices = []
+        texts = []
+        for row, item in enumerate(source):
+            if isinstance(item, str):
+                for index, text in self.search(source = item):
+                    rows.append(row)
+                    indices.append(index)
+                    texts.append(text)
+        return (np.asarray(rows, dtype = np.int64),
+                np.asarray(indices, dtype = np.int64),
+                texts)
+
+    """ Dunder Methods """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns keys and pattern strings without compiled patterns.
+
+        Storing the built pattern strings lets an unpickled matcher skip
+        rebuilding the prefix trees and only compile the combined patterns.
+        """
+        state = self.__dict__.copy()
+        for name in ['tries', 'alternation', 'isolated']:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores pickled state and compiles the combined patterns."""
+        self.__dict__.update(state)
+        self._compile_sources()
+        return
+
 
 @dataclasses.dataclass
-class ReLoad(object):
+class ReTable(object):
+    """Expressions table compiled once and cached by the hash of its file.
+
+    Flags set in the table are stored as leading inline flags of each key
+    (such as '(?i)'), so 'expressions' works with 're' functions and
+    'ReMatcher' without compiling every key separately.
+
+    Args:
+        keys (List[str]): regular expressions or literal strings.
+        values (List[str]): output values for each of 'keys'.
+        sections (Optional[Dict[str, str]]): keys are values and values are
+            section names. Defaults to an empty dictionary.
+        datatypes (Optional[Dict[str, str]]): keys are section names and
+            values are datatypes. Defaults to an empty dictionary.
+        matcher (Optional[ReMatcher]): compiled matcher for 'keys'. Defaults
+            to None. If not passed, one is created.
 
-    keys: str = 'keys'
-    values: str = 'values'
-    sections: str = 'sections'
-    datatypes: str = 'datatypes'
-    file_path: str = ''
-    auto_draft: bool = True
-    encoding: str = 'windows-1252'
-    section_prefix: str = 'section'
-    flag_options: object = None
+    """
+    keys: List[str]
+    values: List[str]
+    sections: Optional[Dict[str, str]] = dataclasses.field(
+        default_factory = dict)
+    datatypes: Optional[Dict[str, str]] = dataclasses.field(
+        default_factory = dict)
+    matcher: Optional[ReMatcher] = None
 
     def __post_init__(self) -> None:
-        if self.auto_draft:
-            self.publish()
+        """Compiles 'matcher', if not passed."""
+        if self.matcher is None:
+            self.matcher = ReMatcher(keys = self.keys)
         return self
 
-    def _explode_sections(self):
-        if 'section' in self.expressions:
-            self.expressions.explode(column = 'section')
-        return self
+    """ Factory Methods """
+
+    @classmethod
+    def create(cls,
+            file_path: str,
+            folder: Optional[str] = None,
+            keys: str = 'keys',
+            values: str = 'values',
+            encoding: str = 'windows-1252',
+            flag_options: Optional[Dict[str, int]] = None) -> 'ReTable':
+        """Returns table loaded from 'folder' or compiled from 'file_path'.
+
+        Args:
+            file_path (str): path of a .csv file with the expressions table.
+            folder (Optional[str]): folder where compiled tables are cached.
+                Defaults to None, which disables caching.
+            keys (str): name of the column with keys. Defaults to 'keys'.
+            values (str): name of the column with values. Defaults to
+                'values'.
+            encoding (str): encoding of 'file_path'. Defaults to
+                'windows-1252'.
+            flag_options (Optional[Dict[str, int]]): names of columns which
+                set 're' flags and those flags. Defaults to None.
+
+        Returns:
+            ReTable: compiled expressions table.
 
-    def publish(self):
-        """Loads data for expressions table from .csv file, converts keys to
-        strings, and removes a common encording error character.
         """
-        self.expressions = (pd.implement_csv(self.file_path,
-                                        index_col = False,
-                                        encoding = self.encoding)
-                              .astype(str)
-                              .replace('Â', ''))
-        self._explode_sections()
-        if 'section' in self.expressions:
-            self.sections = (
-                self.expressions.set_index('values').to_dict()['section'])
-        if 'datatypes' in self.expressions:
-            self.datatypes = (
-                self.expressions.set_index('section').to_dict()['datatype'])
-        return self
+        flag_options = flag_options or {}
+        with open(file_path, 'rb') as source:
+            contents = source.read()
+        digest = hashlib.sha256(contents)
+        digest.update(repr((
+            keys, values, encoding, sorted(flag_options.items()),
+            cls.__name__)).encode())
+        # Tables pickled by older compiling code are not reused.
+        digest.update(_code_version().encode())
+        if folder:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            cache_path = os.path.join(
+                folder, '_'.join([name, digest.hexdigest()[:16]]) + '.pickle')
+            try:
+                with open(cache_path, 'rb') as cached:
+                    return pickle.load(cached)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+        table = cls.from_frame(
+            table = pd.read_csv(
+                io.BytesIO(contents),
+                index_col = False,
+                encoding = encoding,
+                dtype = str,
+                keep_default_na = False).replace('Â', ''),
+            keys = keys,
+            values = values,
+            flag_options = flag_options)
+        if folder:
+            os.makedirs(folder, exist_ok = True)
+            temporary = cache_path + '.tmp'
+            with open(temporary, 'wb') as cached:
+                pickle.dump(table, cached, protocol = pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, cache_path)
+        return table
+
+    @classmethod
+    def from_frame(cls,
+            table: pd.DataFrame,
+            keys: str = 'keys',
+            values: str = 'values',
+            flag_options: Optional[Dict[str, int]] = None) -> 'ReTable':
+        """Returns compiled table from a DataFrame of expressions.
+
+        Args:
+            table (pd.DataFrame): expressions table with columns named
+                'keys' and 'values' and optional 'section', 'datatype', and
+                flag columns.
+            keys (str): name of the column with keys. Defaults to 'keys'.
+            values (str): name of the column with values. Defaults to
+                'values'.
+            flag_options (Optional[Dict[str, int]]): names of columns which
+                set 're' flags and those flags. Defaults to None.
+
+        Returns:
+            ReTable: compiled expressions table.
+
+        """
+        flags = _make_flags(table = table, flag_options = flag_options or {})
+        letters = {flag: letter for letter, flag in _FLAG_LETTERS.items()}
+        prefixes = {
+            flag: ''.join(['(?', ''.join(
+                letter for value, letter in letters.items()
+                if flag & value and letter != 'u'), ')'])
+            for flag in set(flags.tolist()) if flag}
+        compiled_keys = [
+            prefixes[flag] + key if flag else key
+            for key, flag in zip(table[keys].tolist(), flags.tolist())]
+        sections = {}
+        datatypes = {}
+        if 'section' in table:
+            sections = dict(zip(table[values], table['section']))
+            for column in ['datatype', 'datatypes']:
+                if column in table:
+                    datatypes = dict(zip(table['section'], table[column]))
+        # Keeps the last value of duplicate keys, as a dictionary would.
+        expressions = dict(zip(compiled_keys, table[values].tolist()))
+        return cls(
+            keys = list(expressions.keys()),
+            values = list(expressions.values()),
+            sections = sections,
+            datatypes = datatypes)
+
+    """ Public Methods """
+
+    @property
+    def expressions(self) -> Dict[str, str]:
+        """Returns mapping of keys to values."""
+        return dict(zip(self.keys, self.values))
 
 
 @dataclasses.dataclass
@@ -276,94 +762,141 @@ class ReMatch(object):
             self.source = self.value
         return self
 
-    def publish(self, df):
-        for self.key, self.value in self.expressions.items():
-            self._set_source()
-            self.section = self.sections[self.value]
-            self.datatype = self.datatypes[self.section]
+    def _draft_matcher(self):
+        self.keys = list(self.expressions.keys())
+        self.values = list(self.expressions.values())
+        if getattr(self, 'matcher', None) is None:
+            self.matcher = ReMatcher(keys = self.keys)
+        return self
+
+    def _get_datatype(self, value: str) -> str:
+        try:
+            return self.datatypes[self.sections[value]]
+        except (KeyError, TypeError):
+            return 'boolean'
+
+    def _make_column(self, value, datatype, rows, texts, length):
+        if datatype in ['list', 'patterns']:
+            column = [[] for _ in range(length)]
+            for row, text in zip(rows, texts):
+                if text not in column[row]:
+                    column[row].append(text)
+            return column
+        elif datatype in ['pattern']:
+            column = np.full(length, self.default_values[datatype],
+                             dtype = object)
+            # Keeps the first match in each row.
+            column[rows[::-1]] = np.asarray(texts, dtype = object)[::-1]
+            return column
+        found = np.zeros(length, dtype = bool)
+        found[rows] = True
+        if datatype in ['boolean']:
+            return found
+        column = np.where(found, value, self.default_values['string'])
+        if datatype in ['integer']:
+            return pd.to_numeric(column, errors = 'coerce',
+                                 downcast = 'integer')
+        elif datatype in ['float']:
+            return pd.to_numeric(column, errors = 'coerce',
+                                 downcast = 'float')
+        return column
+
+    def _publish_frame(self, df, source):
+        """Adds output columns for every expression to 'df' in one scan.
+
+        'source' may be the name of a column in 'df' or a series of strings
+        aligned with 'df'. Matched text for 'remove' expressions is only
+        removed when 'source' is a column name.
+        """
+        if isinstance(source, str):
+            texts = df[source]
+        else:
+            texts = source
+        rows, indices, texts = self.matcher.match(
+            texts,
+            chunk_size = self.chunk_size,
+            max_workers = self.max_workers)
+        texts = np.asarray(texts, dtype = object)
+        # Groups matches by output value with one sort instead of one pass
+        # over all matches for each value.
+        codes, uniques = pd.factorize(pd.Series(self.values, dtype = object))
+        hit_codes = codes[indices]
+        order = np.argsort(hit_codes, kind = 'stable')
+        bounds = np.searchsorted(hit_codes[order], np.arange(len(uniques) + 1))
+        columns = {}
+        removals = []
+        for code, value in enumerate(uniques):
+            self.value = value
             self._set_out_column()
-            df = getattr(self, '_' + self.datatype)(df = df)
+            datatype = self._get_datatype(value = value)
+            if datatype in ['remove']:
+                removals.extend(np.flatnonzero(codes == code))
+                continue
+            selected = order[bounds[code]:bounds[code + 1]]
+            columns[self.out_column] = self._make_column(
+                value = value,
+                datatype = datatype,
+                rows = rows[selected],
+                texts = texts[selected],
+                length = len(df))
+        # Adds every output column at once to avoid fragmenting 'df'.
+        outputs = pd.DataFrame(columns, index = df.index)
+        df = pd.concat(
+            [df.drop(columns = outputs.columns, errors = 'ignore'), outputs],
+            axis = 1)
+        if removals and isinstance(source, str):
+            df[source] = df[source].str.replace(
+                '|'.join(self.matcher._scope(*self.matcher.patterns[i])
+                         for i in removals),
+                '',
+                regex = True)
         return df
 
-
 @dataclasses.dataclass
 class ReFrame(ReMatch):
     """Stores and applies vectorized string and regular expression matching
-    methods (when possible) to pandas dataframes.
+    methods to pandas dataframes.
 
     ReFrame allows keys and values to be formed from pandas series,
     python lists, or imported from a .csv file.
 
-    Using the match method, the user can pass a dataframe containing source
-    and output columns. Regular expressions are used as keys and may be
-    compliled with or without any flag selected.
+    Using the implement method, the user can pass a dataframe and the name of
+    its source column. Regular expressions are used as keys and may be
+    compliled with or without any flag selected. Every key is combined into
+    one 'ReMatcher', so each cell of the source column is scanned once
+    regardless of the length of the expressions table.
 
     If out_type is boolean, new dataframe columns are created with headers derived
     from the values in the dictionary. A boolean value is returned.
 
     if out_type is 'pattern', a single column is used or created with the name
-    passed in 'out_column.' The return is the matched values from the
-    regular expression expressions table.
+    passed in 'out_column.' The return is the first matched text.
 
     If out_type is string, integer or float, a single column is used or created
     with the header name passed in 'out_column.' The return is the matched
     value of the key in the expressions table.
 
-    If out_type is list, a single column is used or created with the header
-    name passed in 'out_column.' The return is all matched patterns based upon
-    a regular expression stored in a python list within each dataframe column.
+    If out_type is list or patterns, a single column is used or created with
+    the header name passed in 'out_column.' The return is all matched text
+    stored in a python list within each dataframe column.
+
+    If out_type is remove, matched text is removed from the source column.
     """
     expressions: object
     sections: object
     datatypes: object
     edit_prefixes: bool = True
     section_prefix: str = 'section'
+    max_workers: int = 1
+    chunk_size: int = 10_000
+    matcher: Optional['ReMatcher'] = None
 
     def __post_init__(self) -> None:
+        self._draft_matcher()
         return self
 
-    def _boolean(self, df):
-        df[self.out_column] = np.where(
-                df[self.source].str.contains(self.key, True,
-                self.default_values[self.datatype]))
-        return df
-
-    def _divider(self, df):
-        df = df.join(df[self.source].str.split(
-                self.key, expand = True).edit_prefix(self.value))
-        return df
-
-    def _float(self, df):
-        df = self._string(df)
-        df[self.out_column] = pd.to_numeric(df[self.out_column],
-                                            errors = 'coerce',
-                                            downcast = float)
-        return df
-
-    def _integer(self, df):
-        df = self._string(df)
-        df[self.out_column] = pd.to_numeric(df[self.out_column],
-                                            errors = 'coerce',
-                                            downcast = 'integer')
-        return df
-
-    def _pattern(self, df):
-        df[self.out_column] = df[self.source].str.find(self.key)
-        return df
-
-    def _patterns(self, df):
-        df[self.value] = df[self.source].str.findall(self.key)
-        return df
-
-    def _remove(self, df):
-        df[self.value] = df[self.source].replace(self.key, '')
-        return df
-
-    def _string(self, df):
-        df[self.out_column] = np.where(
-                df[self.source].str.contains(self.key),
-                     self.value, self.default_values[self.datatype])
-        return df
+    def implement(self, df, source):
+        return self._publish_frame(df = df, source = source)
 
 
 @dataclasses.dataclass
@@ -374,57 +907,23 @@ class ReSearch(ReMatch):
     datatypes: object
     edit_prefixes: bool = True
     section_prefix: str = 'section'
+    max_workers: int = 1
+    chunk_size: int = 10_000
+    matcher: Optional['ReMatcher'] = None
 
     def __post_init__(self) -> None:
         super().__post_init__()
         return self
 
-    def _boolean(self, df):
-        if re.search(self.key, self.source):
-            df[self.out_column] = True
-        else:
-            df[self.out_column] = False
-        return df
-
-    def _float(self, df):
-        df = self._string(df)
-        df[self.out_column] = float(df[self.out_column])
-        return df
-
-    def _integer(self, df):
-        df = self._string(df)
-        df[self.out_column] = int(df[self.out_column])
-        return df
-
-    def _list(self, df):
-        temp_list = []
-        temp_list += re.findall(self.key, self.source)
-        if temp_list:
-            temp_list = list(deduplicate(temp_list))
-            df[self.out_column] = temp_list
-        else:
-            df[self.out_column] = self.default_values[self.datatype]
-        return df
-
-    def _pattern(self, df):
-        if re.search(self.key, self.source):
-            df[self.out_column] = self.value
-        return df
-
-    def _patterns(self, df):
-        if re.search(self.key, self.source):
-            df[self.out_column] = re.search(
-                    self.key, self.source).group(0).strip()
-        return df
-
-    def _string(self, df):
-        if re.search(self.key, self.source):
-            df[self.out_column] = self.value
-        else:
-            df[self.out_column] = self.default_value
-        df[self.out_column] = str(df[self.out_column])
-        return df
+    def implement(self, df, source):
+        """Parses every string in 'source' and adds results to 'df'.
 
+        Strings are divided into blocks of 'chunk_size' and searched in
+        'max_workers' processes with a single compiled 'ReMatcher'.
+        """
+        if not hasattr(self, 'values'):
+            self._draft_matcher()
+        return self._publish_frame(df = df, source = source)
 
 @dataclasses.dataclass
 class ReOrganize(ReMatch):
@@ -448,21 +947,53 @@ class ReOrganize(ReMatch):
     datatypes: object
     edit_prefixes: bool = True
     section_prefix: str = 'section'
+    max_workers: int = 1
+    chunk_size: int = 10_000
 
     def __post_init__(self) -> None:
         return self
 
-    def publish(self, df, source):
-        for self.key, self.value in self.expressions.items():
-            self._set_out_column()
-            if re.search(self.key, source):
-                df[self.out_column] = re.search(
-                        self.key, source).group(0).strip()
-                source = re.sub(self.key, '', source)
-            else:
-                df[self.out_column] = self.default_values['string']
-        return df, source
+    def implement(self, df, source):
+        """Organizes every string in 'source' into columns added to 'df'.
+
+        Strings are divided into blocks of 'chunk_size' and organized in
+        'max_workers' processes. The expressions are sent to each process
+        once and the blocks are reassembled in order.
 
+        Returns:
+            tuple: 'df' with a column for each expression and 'source' with
+                matched sections removed.
+        """
+        if isinstance(source, str):
+            texts = df[source]
+        else:
+            texts = pd.Series(source, index = df.index)
+        expressions = []
+        for key, self.value in self.expressions.items():
+            self._set_out_column()
+            expressions.append((key, self.out_column))
+        results = _map_chunks(
+            function = _organize_chunk,
+            items = texts.tolist(),
+            state = {
+                'expressions': expressions,
+                'default': self.default_values['string']},
+            chunk_size = self.chunk_size,
+            max_workers = self.max_workers)
+        records = list(itertools.chain.from_iterable(r[0] for r in results))
+        remainders = list(itertools.chain.from_iterable(r[1] for r in results))
+        outputs = pd.DataFrame.from_records(
+            records,
+            index = df.index,
+            columns = [column for _, column in expressions])
+        df = pd.concat(
+            [df.drop(columns = outputs.columns, errors = 'ignore'), outputs],
+            axis = 1)
+        remainders = pd.Series(remainders, index = df.index, name = texts.name)
+        if isinstance(source, str):
+            df[source] = remainders
+            return df, source
+        return df, remainders
 
 @dataclasses.dataclass
 class ReTypes(SimpleType):
@@ -0,0 +1,175 @@
+"""
+.. module:: analyst test
+:synopsis: tests analyst classes and functions
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import types
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import KFold
+
+from simplify.analyst import (AnalystSpecialist, ToolCache, _apply_fold,
+                              _standardize_columns, decorrelate)
+from simplify.dataset import Dataset
+
+
+def test_tool_cache(tmp_path):
+    cache = ToolCache(folder = tmp_path, max_size = 10_000)
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': [0.5, 0.25, 0.125]})
+    assert cache.fingerprint(df) == cache.fingerprint(df.copy())
+    assert cache.fingerprint(df) != cache.fingerprint(df.iloc[:2])
+    assert cache.get(key = 'missing') is None
+    cache.put(key = 'frame', value = df)
+    assert cache.get(key = 'frame').equals(df)
+    assert cache.report()['hits'] == 1
+    assert cache.report()['misses'] == 1
+    cache.max_size = 0
+    cache.put(key = 'other', value = df)
+    assert cache.report()['entries'] == 0
+    return
+
+
+def test_standardize_columns():
+    df = pd.DataFrame({
+        'a': [1.0, 2.0, np.nan, 4.0],
+        'b': [3, 3, 3, 3],
+        'c': [True, False, True, False]})
+    standardized = _standardize_columns(df = df, block_size = 2)
+    assert standardized.dtype == np.float32
+    assert standardized.flags['F_CONTIGUOUS']
+    assert np.allclose(np.linalg.norm(standardized, axis = 0), [1, 0, 1])
+    assert standardized[2, 0] == 0
+    projected = _standardize_columns(
+        df = df,
+        projection_size = 2,
+        generator = np.random.default_rng(0),
+        chunk_size = 3)
+    assert projected.shape == (2, 3)
+    assert not projected[:, 1].any()
+    return
+
+def test_decorrelate():
+    generator = np.random.default_rng(0)
+    base = generator.standard_normal((1000, 3))
+    df = pd.DataFrame({
+        'a': base[:, 0],
+        'b': base[:, 1],
+        'a_copy': base[:, 0] * 2 + 1,
+        'constant': np.ones(1000),
+        'c': base[:, 2],
+        'b_copy': -base[:, 1],
+        'name': ['x'] * 1000})
+    data = decorrelate(
+        data = Dataset.create(data = df.copy()),
+        columns = list(df.columns),
+        block_size = 2)
+    assert list(data.data.columns) == ['a', 'b', 'constant', 'c', 'name']
+    data = decorrelate(
+        data = Dataset.create(data = df.copy()),
+        columns = list(df.columns),
+        block_size = 3,
+        sample_size = 500,
+        projection_size = 200,
+        seed = 0)
+    assert list(data.data.columns) == ['a', 'b', 'constant', 'c', 'name']
+    return
+
+def test_tool_cache_failures(tmp_path, monkeypatch):
+    cache = ToolCache(folder = tmp_path)
+    path = cache._make_path(key = 'corrupt')
+    path.write_bytes(b'not a pickle')
+    assert cache.get(key = 'corrupt') is None
+    assert cache.report()['misses'] == 1
+    assert not path.exists()
+    cache.put(key = 'frame', value = pd.DataFrame({'a': [1]}))
+
+    def _fail(value, filename):
+        open(filename, 'wb').write(b'partial')
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(joblib, 'dump', _fail)
+    with pytest.raises(KeyboardInterrupt):
+        cache.put(key = 'frame', value = pd.DataFrame({'a': [2]}))
+    monkeypatch.undo()
+    assert cache.get(key = 'frame')['a'].tolist() == [1]
+    assert [p.name for p in tmp_path.iterdir()] == [
+        cache._make_path(key = 'frame').name]
+    return
+
+
+def _make_split_data():
+    df = pd.DataFrame({'a': np.arange(6.0), 'label': [0, 1] * 3})
+    data = Dataset.create(data = df)
+    data.create_xy(label = 'label')
+    # Folds are applied in the 'testing' stage, as set by '_split_loop'.
+    data.stages.change('testing')
+    return data
+
+def _make_model(fitted):
+
+    def apply(data):
+        fitted.append(data.x_train.index.tolist())
+        return data
+
+    return types.SimpleNamespace(
+        name = 'model',
+        step = 'model',
+        algorithm = types.SimpleNamespace(predict = lambda x: x['a'] > 2),
+        apply = apply)
+
+def test_apply_fold():
+    fitted = []
+    result = _apply_fold(
+        techniques = [_make_model(fitted = fitted)],
+        data = _make_split_data(),
+        fold = 1,
+        train_index = np.array([0, 1, 2, 3]),
+        test_index = np.array([4, 5]))
+    assert result.fold == 1
+    assert fitted == [[0, 1, 2, 3]]
+    assert result.predictions.tolist() == [True, True]
+    assert result.predictions.index.tolist() == [4, 5]
+    return
+
+def test_split_loop():
+    for parallel_folds in [False, True]:
+        searched = []
+        fitted = []
+        search = types.SimpleNamespace(
+            name = 'searcher',
+            step = 'search',
+            algorithm = types.SimpleNamespace(
+                search = lambda **kwargs: searched.append(kwargs)))
+        split = types.SimpleNamespace(
+            name = 'kfold',
+            step = 'split',
+            algorithm = KFold(n_splits = 3))
+        chapter = types.SimpleNamespace(
+            techniques = [split, search, _make_model(fitted = fitted)])
+        specialist = AnalystSpecialist(
+            worker = None,
+            parallel_folds = parallel_folds,
+            fold_workers = 1)
+        specialist.verbose = False
+        chapter, data = specialist._split_loop(
+            chapter = chapter,
+            index = 0,
+            data = _make_split_data())
+        # Searches inside every fold on its training rows only.
+        assert [kwargs['x'].index.tolist() for kwargs in searched] == [
+            [2, 3, 4, 5], [0, 1, 4, 5], [0, 1, 2, 3]]
+        assert [kwargs['y'].index.tolist() for kwargs in searched] == [
+            [2, 3, 4, 5], [0, 1, 4, 5], [0, 1, 2, 3]]
+        assert all(kwargs['prefix'] == [] for kwargs in searched)
+        assert fitted == [[2, 3, 4, 5], [0, 1, 4, 5], [0, 1, 2, 3]]
+        assert data.x_test.index.tolist() == [4, 5]
+        if parallel_folds:
+            assert [f.fold for f in chapter.folds] == [0, 1, 2]
+            assert chapter.folds[0].predictions.tolist() == [False, False]
+    return
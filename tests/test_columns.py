@@ -0,0 +1,34 @@
+"""
+.. module:: columns test
+:synopsis: tests column datatype indexes
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+from simplify.columns import DatatypeIndex
+
+
+def test_datatype_index():
+    index = DatatypeIndex(contents = {
+        'a': 'float', 'b': 'integer', 'c': 'float', 'd': 'float'})
+    assert index.columns(datatype = 'float') == ['a', 'c', 'd']
+    # Re-typing keeps each column at its original rank.
+    index['c'] = 'integer'
+    assert index.columns(datatype = 'float') == ['a', 'd']
+    assert index.columns(datatype = 'integer') == ['b', 'c']
+    index['a'] = 'integer'
+    assert index.columns(datatype = 'integer') == ['a', 'b', 'c']
+    index['c'] = 'float'
+    assert index.columns(datatype = 'float') == ['c', 'd']
+    # Deleted columns are removed and re-added columns go last.
+    del index['b']
+    assert index.columns(datatype = 'integer') == ['a']
+    index['b'] = 'float'
+    index['e'] = 'float'
+    assert index.columns(datatype = 'float') == ['c', 'd', 'b', 'e']
+    assert index.columns(datatype = 'boolean') == []
+    assert list(index) == ['a', 'c', 'd', 'b', 'e']
+    assert dict(index) == {
+        'a': 'integer', 'c': 'float', 'd': 'float', 'b': 'float', 'e': 'float'}
+    return
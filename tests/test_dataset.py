@@ -6,11 +6,13 @@
 :license: Apache-2.0
 """
 
-from pathlib import pathlib.Path
-
+import numpy as np
 import pandas as pd
 
-from simplify.core.dataset import Dataset
+from simplify import dataset
+from simplify.dataset import (
+    ColumnProfile, DataBunch, Dataset, DataTypes, FeatureStore,
+    account_memory)
 
 
 def test_dataset():
@@ -27,6 +29,197 @@ def test_dataset():
     assert data.x['name'].tolist() == ['allison', 'brian', 'corey']
     return
 
+def test_downcast_frame():
+    df = pd.DataFrame({
+        'huge': [1e20, 2.0, 3.0],
+        'unsigned': pd.Series([2**63 + 5, 1, 2], dtype = 'uint64'),
+        'precise': [123456789.123, 1.5, 2.5],
+        'halves': [0.5, 1.25, -2.0],
+        'small': [1, 2, 3],
+        'negative': [-200, 5, 6],
+        'missing': [1.0, None, 3.0]})
+    data, report = DataTypes().downcast_frame(data = df)
+    assert data['huge'].dtype == 'float64'
+    assert data['huge'].tolist() == [1e20, 2.0, 3.0]
+    assert data['unsigned'].dtype == 'uint64'
+    assert data['unsigned'].tolist() == [2**63 + 5, 1, 2]
+    assert data['precise'].dtype == 'float64'
+    assert data['precise'].tolist() == df['precise'].tolist()
+    assert data['halves'].dtype == 'float32'
+    assert data['small'].dtype == 'uint8'
+    assert data['negative'].dtype == 'int16'
+    assert str(data['missing'].dtype) == 'UInt8'
+    lossy, _ = DataTypes().downcast_frame(
+        data = df[['precise']],
+        lossy_floats = True)
+    assert lossy['precise'].dtype == 'float32'
+    return
+
+def test_downcast_strings():
+    df = pd.DataFrame({
+        'strings': pd.Series(['a', 'b'] * 50, dtype = 'string'),
+        'objects': pd.Series(['a', 'b'] * 50, dtype = object),
+        'flags': pd.Series([True, False, None, True] * 25, dtype = object)})
+    data, _ = DataTypes().downcast_frame(data = df)
+    assert isinstance(data['strings'].dtype, pd.CategoricalDtype)
+    assert isinstance(data['objects'].dtype, pd.CategoricalDtype)
+    assert str(data['flags'].dtype) == 'boolean'
+    return
+
 
 if __name__ == '__main__':
-    test_dataset()
\ No newline at end of file
+    test_dataset()
+
+def test_fork():
+    df = pd.DataFrame({'a': np.arange(1_000.0), 'b': np.arange(1_000)})
+    data = Dataset.create(data = df)
+    first = data.fork(label = 'trial')
+    second = data.fork(label = 'trial')
+    assert first.lineage == second.lineage == ['trial']
+    first['a'] = 0.0
+    first.data.loc[0, 'b'] = -1
+    assert data['a'].tolist() == df['a'].tolist()
+    assert data.data.loc[0, 'b'] == 0
+    assert second.data.loc[0, 'b'] == 0
+    report = account_memory(datasets = [data, first, second])
+    assert len(report) == 4
+    assert report.loc['total', 'logical_bytes'] == (
+        report['logical_bytes'].iloc[:3].sum())
+    return
+
+def test_fork_without_copy_on_write(monkeypatch):
+    monkeypatch.setattr(dataset, 'copy_on_write', lambda: False)
+    data = Dataset.create(data = pd.DataFrame({'a': np.arange(10.0)}))
+    fork = data.fork()
+    assert fork.lineage == ['fork_1']
+    assert not set(fork.buffers()) & set(data.buffers())
+    return
+
+def test_copy_on_write(monkeypatch):
+    options = {'mode.copy_on_write': 'warn'}
+    monkeypatch.setattr(pd, '__version__', '2.2.3')
+    monkeypatch.setattr(pd, 'get_option', options.get)
+    monkeypatch.setattr(pd, 'set_option', options.__setitem__)
+    assert not dataset.copy_on_write()
+    assert dataset.enable_copy_on_write()
+    assert options['mode.copy_on_write'] is True
+    options['mode.copy_on_write'] = False
+    assert not dataset.copy_on_write()
+    return
+
+def test_databunch_view():
+    full = DataBunch(
+        name = 'full',
+        x = pd.DataFrame({'a': np.arange(10), 'b': np.arange(10.0)}),
+        y = pd.Series(np.arange(10)))
+    view = full.view(name = 'training', index = np.array([1, 3, 5]))
+    assert view.is_view()
+    assert view.x['a'].tolist() == [1, 3, 5]
+    # Rows are taken once and reused until 'parent' data is replaced.
+    assert view.x is view.x
+    full.x = full.x * 2
+    assert view.x['a'].tolist() == [2, 6, 10]
+    view.x = view.x.drop(columns = 'b')
+    assert list(view.x.columns) == ['a']
+    assert view.is_view()
+    view.y = view.y + 1
+    assert view.y.tolist() == [2, 4, 6]
+    assert not view.is_view()
+    return
+
+def test_feature_store_round_trip(tmp_path):
+    x = pd.DataFrame({
+        'name': ['allison', None, 'corey'],
+        0: pd.Series([2**60 + 1, None, 3], dtype = 'Int64'),
+        'flag': pd.Series([True, None, False], dtype = 'boolean'),
+        'grade': pd.Categorical(['b', 'a', 'b'], categories = ['b', 'a', 'c']),
+        'score': [1.5, 2.5, 3.5],
+        'count': np.array([1, 2, 3], dtype = 'int32')})
+    x['text'] = pd.Series(['x', 'y', None], dtype = 'string')
+    y = pd.Series(pd.array([1, None, 0], dtype = 'Int8'), name = 'label')
+    datatypes = {'name': 'string', 0: 'integer', 'flag': 'boolean'}
+    bunch = DataBunch(name = 'full', x = x, y = y)
+    store = FeatureStore(folder = tmp_path).save(
+        bunch = bunch,
+        datatypes = datatypes)
+    loaded_x, loaded_y, loaded_datatypes = store.load()
+    pd.testing.assert_frame_equal(loaded_x, x)
+    pd.testing.assert_series_equal(loaded_y, y)
+    assert loaded_datatypes == datatypes
+    return
+
+def test_feature_store_writable(tmp_path):
+    x = pd.DataFrame({'a': np.arange(5.0), 'b': np.arange(5.0)})
+    store = FeatureStore(folder = tmp_path).save(
+        bunch = DataBunch(name = 'full', x = x))
+    loaded_x, loaded_y, _ = store.load()
+    assert loaded_y is None
+    loaded_x.loc[0, 'a'] = 100.0
+    assert loaded_x.loc[0, 'a'] == 100.0
+    # Writes stay in memory and do not change the saved store.
+    assert store.load()[0].loc[0, 'a'] == 0.0
+    return
+
+def test_column_profile_approximate():
+    df = pd.DataFrame({
+        'a': [3.0, None, -1.5, 8.0, 2.0] * 40,
+        'b': pd.Series([1, None, 4, 2, 5] * 40, dtype = 'Int64'),
+        'when': pd.date_range('2020-01-01', periods = 200)})
+    exact = ColumnProfile().update(data = df)
+    approximate = ColumnProfile(chunk_size = 7).update(
+        data = df,
+        approximate = True)
+    for name in ['a', 'b']:
+        assert approximate[name]['sketch'] is not None
+        for statistic in ['minimum', 'maximum', 'count', 'nulls']:
+            assert approximate[name][statistic] == exact[name][statistic]
+        assert np.isclose(approximate[name]['mean'], exact[name]['mean'])
+    assert approximate['when']['minimum'] == df['when'].min()
+    assert approximate['when']['maximum'] == df['when'].max()
+    return
+
+def test_column_profile():
+    df = pd.DataFrame({
+        'a': [1.0, 2.0, None, 2.0],
+        'b': [True, False, False, False],
+        'c': ['x', 'y', 'x', None]})
+    profiles = ColumnProfile(block_size = 1).update(data = df)
+    assert profiles['a']['unique'] == 2
+    assert profiles['a']['nulls'] == 1
+    assert profiles['a']['mean'] == 5 / 3
+    assert profiles['b']['mean'] == 0.25
+    assert profiles['c']['counts'].to_dict() == {'x': 2, 'y': 1}
+    cached = profiles['c']
+    profiles.update(data = df)
+    assert profiles['c'] is cached
+    # Changes made in place are found by the checksum of the values.
+    df.loc[0, 'a'] = 100.0
+    profiles.update(data = df)
+    assert profiles['a']['maximum'] == 100.0
+    assert profiles['c'] is cached
+    return
+
+def test_dataset_profile():
+    data = Dataset.create(data = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 4, 5]}))
+    assert data.profile()['b']['unique'] == 2
+    data['b'] = pd.Series([1, 2, 3])
+    assert 'b' not in data.profiles
+    assert data.profile(columns = 'b')['b']['unique'] == 3
+    data.data.loc[0, 'a'] = 10
+    assert data.profile(columns = 'a')['a']['maximum'] == 10
+    return
+
+def test_column_positions():
+    df = pd.DataFrame({name: [1, 2] for name in ['a', 'b', 'c', 'd', 'e']})
+    data = Dataset.create(data = df)
+    assert data._get_indices(columns = ['e', 'a']) == [4, 0]
+    data.drop_columns(columns = ['b', 'd'])
+    assert data._get_positions() == {'a': 0, 'c': 1, 'e': 2}
+    del data['a']
+    data['f'] = [3, 4]
+    assert data._get_positions() == {'c': 0, 'e': 1, 'f': 2}
+    # Columns replaced outside of 'Dataset' methods are indexed again.
+    data.data = data.data[['f', 'c']]
+    data.drop_columns(columns = 'c')
+    assert data._get_positions() == {'f': 0}
+    return
@@ -0,0 +1,76 @@
+"""
+.. module:: divide test
+:synopsis: tests dividing data source files into shards
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from simplify.wrangler.steps.divide import Divide
+
+
+def _read_shards(manifest, separator = ','):
+    return pd.concat(
+        [pd.read_csv(path, sep = separator, dtype = str)
+         for shard in manifest['shards'] for path in shard['paths']])
+
+
+def test_divide_hash_keys(tmp_path):
+    # Later rows have text keys, so pandas would infer a different datatype
+    # for the key column in later byte ranges.
+    keys = ['7', '8', '9'] * 20 + ['7', 'x', '8'] * 20
+    file_path = os.path.join(tmp_path, 'source.csv')
+    pd.DataFrame({'key': keys, 'value': range(len(keys))}).to_csv(
+        file_path, index = False)
+    divider = Divide(method = 'hash', key = 'key', shards = 8,
+                     shard_size = 64, max_workers = 1, auto_draft = False)
+    manifest = divider.divide(file_path = file_path, folder = tmp_path)
+    shards = {}
+    for shard in manifest['shards']:
+        for path in shard['paths']:
+            for key in pd.read_csv(path, dtype = str)['key']:
+                shards.setdefault(key, set()).add(shard['shard'])
+    assert all(len(numbers) == 1 for numbers in shards.values())
+    assert len(_read_shards(manifest)) == len(keys)
+    return
+
+
+def test_divide_hash_tsv(tmp_path):
+    file_path = os.path.join(tmp_path, 'source.tsv')
+    df = pd.DataFrame({'key': ['a', 'b', 'c'] * 10,
+                       'text': ['one, two'] * 30})
+    df.to_csv(file_path, index = False, sep = '\t')
+    divider = Divide(method = 'hash', key = 'key', shards = 2,
+                     max_workers = 1, auto_draft = False)
+    manifest = divider.divide(file_path = file_path, folder = tmp_path)
+    paths = [path for shard in manifest['shards'] for path in shard['paths']]
+    assert all(path.endswith('.tsv') for path in paths)
+    shards = _read_shards(manifest, separator = '\t')
+    assert list(shards.columns) == ['key', 'text']
+    assert (shards['text'] == 'one, two').all()
+    return
+
+
+def test_divide_folder_guard(tmp_path):
+    file_path = os.path.join(tmp_path, 'source.txt')
+    with open(file_path, 'w') as source:
+        source.write('line\n' * 100)
+    divider = Divide(shard_size = 100, max_workers = 1, auto_draft = False)
+    divider.divide(file_path = file_path, folder = tmp_path)
+    # Shards from an earlier division are replaced.
+    manifest = divider.divide(file_path = file_path, folder = tmp_path)
+    assert len(manifest['shards']) == 5
+    other = os.path.join(tmp_path, 'other', 'source')
+    os.makedirs(other)
+    with open(os.path.join(other, 'keep.txt'), 'w') as kept:
+        kept.write('keep')
+    with pytest.raises(FileExistsError):
+        divider.divide(file_path = file_path,
+                       folder = os.path.join(tmp_path, 'other'))
+    assert os.path.isfile(os.path.join(other, 'keep.txt'))
+    return
@@ -0,0 +1,186 @@
+"""
+.. module:: files test
+:synopsis: tests file importing and exporting
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from simplify.files import Clerk
+
+
+class _Idea(object):
+    """Idea stand-in with the 'files' settings used by these tests."""
+
+    def apply(self, instance):
+        instance.boolean_out = True
+        return instance
+
+
+def _make_clerk(tmp_path):
+    return Clerk(root_folder = str(tmp_path), idea = _Idea())
+
+
+def test_file_format_kwargs(tmp_path):
+    clerk = _make_clerk(tmp_path)
+    clerk.encoding = 'utf-8'
+    clerk.filters = [('a', '>', 1)]
+    parquet = clerk.file_formats['parquet']
+    imported = clerk.data_importer._make_parameters(file_format = parquet)
+    exported = clerk.data_exporter._make_parameters(file_format = parquet)
+    assert imported['filters'] == [('a', '>', 1)]
+    assert 'filters' not in exported and 'columns' not in exported
+    csv = clerk.data_importer._make_parameters(
+        file_format = clerk.file_formats['csv'])
+    assert csv['encoding'] == 'utf-8'
+    return
+
+
+def test_csv_round_trip(tmp_path):
+    clerk = _make_clerk(tmp_path)
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    file_path = tmp_path.joinpath('data.csv')
+    clerk.data_exporter.apply(
+        variable = df,
+        file_path = file_path,
+        file_format = 'csv',
+        index = False)
+    loaded = clerk.data_importer.apply(
+        file_path = file_path,
+        file_format = 'csv')
+    pd.testing.assert_frame_equal(loaded, df)
+    return
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip('pyarrow')
+    clerk = _make_clerk(tmp_path)
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    file_path = tmp_path.joinpath('data.parquet')
+    clerk.data_exporter.apply(
+        variable = df,
+        file_path = file_path,
+        file_format = 'parquet')
+    loaded = clerk.data_importer.apply(
+        file_path = file_path,
+        file_format = 'parquet',
+        filters = [('a', '>', 1)],
+        columns = ['a'])
+    assert loaded['a'].tolist() == [2, 3]
+    assert list(loaded.columns) == ['a']
+    return
+
+
+def test_import_batch(tmp_path):
+    clerk = _make_clerk(tmp_path)
+    folder = tmp_path.joinpath('batch')
+    folder.mkdir()
+    pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}).to_csv(
+        folder.joinpath('first.csv'), index = False)
+    pd.DataFrame({'a': [3, None], 'b': ['z', 'x']}).to_csv(
+        folder.joinpath('second.csv'), index = False)
+    pd.DataFrame({'a': ['bad'], 'b': ['x']}).to_csv(
+        folder.joinpath('third.csv'), index = False)
+    datatypes = {'a': 'integer', 'b': 'categorical'}
+    with pytest.warns(UserWarning, match = '1 of 3 files'):
+        data = clerk.data_importer.import_batch(
+            folder = folder,
+            file_format = 'csv',
+            datatypes = datatypes,
+            max_workers = 1)
+    assert str(data['a'].dtype) == 'Int64'
+    assert data['a'].tolist()[:3] == [1, 2, 3]
+    assert list(data['b'].cat.categories) == ['x', 'y', 'z']
+    assert clerk.data_importer.batch_report['error'].notna().sum() == 1
+    with pytest.raises(ValueError):
+        clerk.data_importer.import_batch(
+            folder = folder,
+            file_format = 'csv',
+            datatypes = datatypes,
+            raise_errors = True)
+    return
+
+
+def test_asynchronous_export(tmp_path):
+    clerk = _make_clerk(tmp_path)
+    exporter = clerk.data_exporter
+    exporter.asynchronous = True
+    # Holds the background writer until 'df' has been changed.
+    gate = threading.Event()
+    write = exporter._write
+    exporter._write = lambda **item: gate.wait() and write(**item)
+    df = pd.DataFrame({'a': [1, 2, 3]})
+    file_path = tmp_path.joinpath('data.csv')
+    exporter.apply(
+        variable = df,
+        file_path = file_path,
+        file_format = 'csv',
+        index = False)
+    df.loc[0, 'a'] = 100
+    gate.set()
+    clerk.close()
+    assert exporter._writer is None
+    assert pd.read_csv(file_path)['a'].tolist() == [1, 2, 3]
+    exporter.apply(
+        variable = df,
+        file_path = tmp_path.joinpath('missing', 'data.csv'),
+        file_format = 'csv')
+    with pytest.raises(OSError):
+        clerk.close()
+    assert exporter._writer is None
+    return
+
+
+def test_stream(tmp_path):
+    clerk = _make_clerk(tmp_path)
+    file_path = tmp_path.joinpath('data.csv')
+    pd.DataFrame({'a': [1, 2, 3, 4], 'b': ['y', 'y', 'x', 'z']}).to_csv(
+        file_path, index = False)
+    datatypes = {'a': 'integer', 'b': 'categorical'}
+    chunks = list(clerk.data_importer.stream(
+        file_path = file_path,
+        file_format = 'csv',
+        chunk_size = 2,
+        datatypes = datatypes))
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+    assert str(chunks[0]['a'].dtype) == 'Int64'
+    assert list(chunks[0]['b'].cat.categories) == ['y']
+    assert list(chunks[1]['b'].cat.categories) == ['y', 'x', 'z']
+    data = pd.concat(chunks, ignore_index = True)
+    assert data['b'].tolist() == ['y', 'y', 'x', 'z']
+    empty = tmp_path.joinpath('empty.csv')
+    pd.DataFrame({'a': [], 'b': []}).to_csv(empty, index = False)
+    rows = clerk.data_importer.feed(
+        consumers = [],
+        file_path = empty,
+        file_format = 'csv',
+        datatypes = datatypes)
+    assert rows == 0
+    return
+
+
+def test_sample_size(tmp_path):
+    pytest.importorskip('pyarrow')
+    clerk = _make_clerk(tmp_path)
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    for file_format, extension in [('parquet', 'parquet'), ('stata', 'dta')]:
+        file_path = tmp_path.joinpath('.'.join(['data', extension]))
+        clerk.data_exporter.apply(
+            variable = df,
+            file_path = file_path,
+            file_format = file_format,
+            **({'write_index': False} if file_format == 'stata' else {}))
+        loaded = clerk.data_importer.apply(
+            file_path = file_path,
+            file_format = file_format,
+            sample_size = 2,
+            datatypes = {'a': 'integer', 'b': 'categorical'})
+        assert isinstance(loaded, pd.DataFrame)
+        assert loaded['a'].tolist() == [1, 2]
+        assert str(loaded['a'].dtype) == 'Int64'
+    return
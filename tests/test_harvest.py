@@ -0,0 +1,96 @@
+"""
+.. module:: harvest test
+:synopsis: tests streaming documents through harvest organizers and parsers
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import os
+import types
+
+import pandas as pd
+
+from simplify.wrangler.steps.harvest import Harvest
+
+
+class _Clerk(object):
+    """Clerk stand-in which records saved blocks."""
+
+    def __init__(self):
+        self.interim_format = 'parquet'
+        self.saved = []
+        self.flushed = False
+
+    def save(self, variable, folder, file_name, file_format):
+        self.saved.append((file_name, file_format, variable))
+        return self
+
+    def flush(self):
+        self.flushed = True
+        return self
+
+
+def _make_harvester(block_size, clerk = None):
+    # Skips drafting, which needs project settings and expression tables.
+    harvester = Harvest.__new__(Harvest)
+    harvester.block_size = block_size
+    harvester.clerk = clerk
+
+    def organize(df, source):
+        df['length'] = df[source].str.len()
+        return df, source
+
+    def parse(df, source):
+        df['has_cat'] = df[source].str.contains('cat')
+        return df
+
+    harvester.algorithms = [
+        types.SimpleNamespace(step = 'organize', implement = organize),
+        types.SimpleNamespace(step = 'parse', implement = parse)]
+    return harvester
+
+
+def _write_documents(folder):
+    os.makedirs(os.path.join(folder, 'sub'))
+    with open(os.path.join(folder, 'a.txt'), 'w') as document:
+        document.write('cat\ndog\nbird\n')
+    with open(os.path.join(folder, 'sub', 'b.txt'), 'w') as document:
+        document.write('catfish\r\nfox\n')
+    with open(os.path.join(folder, 'skipped.csv'), 'w') as document:
+        document.write('cat\n')
+    return
+
+
+def test_harvest_stream(tmp_path):
+    _write_documents(folder = tmp_path)
+    harvester = _make_harvester(block_size = 2)
+    blocks = list(harvester.stream(sources = str(tmp_path), per_line = True))
+    assert [len(block) for block in blocks] == [2, 2, 1]
+    data = pd.concat(blocks)
+    assert data.index.tolist() == [0, 1, 2, 3, 4]
+    assert data['source'].tolist() == ['cat', 'dog', 'bird', 'catfish', 'fox']
+    assert data['length'].tolist() == [3, 3, 4, 7, 3]
+    assert data['has_cat'].tolist() == [True, False, False, True, False]
+    assert data['document'].iloc[3].endswith(os.path.join('sub', 'b.txt:0'))
+    files = list(harvester.stream(sources = str(tmp_path)))
+    assert [len(block) for block in files] == [2]
+    assert files[0]['source'].tolist() == ['cat\ndog\nbird\n', 'catfish\nfox\n']
+    return
+
+
+def test_harvest_export_stream(tmp_path):
+    _write_documents(folder = tmp_path)
+    clerk = _Clerk()
+    harvester = _make_harvester(block_size = 2, clerk = clerk)
+    count = harvester.export_stream(
+        sources = [os.path.join(tmp_path, 'a.txt')],
+        file_name = 'pets',
+        per_line = True)
+    assert count == 2
+    assert [(name, file_format) for name, file_format, _ in clerk.saved] == [
+        ('pets_00001', 'parquet'), ('pets_00002', 'parquet')]
+    assert clerk.saved[1][2]['source'].tolist() == ['bird']
+    assert clerk.flushed
+    assert harvester.export_stream(sources = []) == 0
+    return
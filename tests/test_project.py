@@ -6,21 +6,87 @@
 :license: Apache-2.0
 """
 
-from pathlib import pathlib.Path
+import pathlib
+import types
 
 import pandas as pd
 import pytest
 
-from simplify.core.idea import Idea
-from simplify.core.project import Project
+import simplify
+from simplify.dataset import Dataset
+from simplify.project import Checkpoints, Project
 
 
 def test_project():
-    idea = Idea(
+    idea = simplify.Idea(
         configuration = pathlib.Path.cwd().joinpath('tests', 'idea_settings.ini'))
     project = Project(idea = idea)
-    print('test', project.library)
+    assert not project.checkpoint
     return
 
-if __name__ == '__main__':
-    test_project()
\ No newline at end of file
+def test_stage_settings():
+    project = types.SimpleNamespace(
+        workers = {'wrangler': None, 'analyst': None, 'critic': None},
+        idea = {
+            'general': {'seed': 43},
+            'wrangler': {'wrangler_steps': 'divide, retool'},
+            'analyst': {
+                'analyst_steps': 'scaler, modeler',
+                'scaler_techniques': 'normalize, minmax',
+                'modeler_techniques': ['xgboost']},
+            'critic': {'critic_steps': 'explainer', 'join_predictions': True},
+            'modeler_parameters': {'n_estimators': 100},
+            'xgboost_parameters': {'max_depth': 3},
+            'retool_parameters': {'keys': 'all'},
+            'mode_parameters': {'a': 1},
+            'unknown_parameters': {'b': 2}})
+    analyst = Project._stage_settings(project, name = 'analyst')
+    assert set(analyst) == {
+        'general', 'analyst', 'modeler_parameters', 'xgboost_parameters'}
+    wrangler = Project._stage_settings(project, name = 'wrangler')
+    # Sections which match no worker go to the first worker.
+    assert set(wrangler) == {
+        'general', 'wrangler', 'retool_parameters', 'mode_parameters',
+        'unknown_parameters'}
+    critic = Project._stage_settings(project, name = 'critic')
+    assert set(critic) == {'general', 'critic'}
+    return
+
+def test_checkpoints(tmp_path):
+    data = pd.DataFrame({'a': [1, 2, 3], 'b': [4.0, 5.0, 6.0]})
+    names = ['analyst', 'critic']
+    stages = [{'analyst': {'seed': 43}}, {'critic': {}}]
+    checkpoints = Checkpoints(folder = tmp_path, version = '0.1.1')
+    keys = checkpoints.chain(data = data, stages = stages)
+    assert checkpoints.resume(names = names, keys = keys) == 0
+    dataset = Dataset.create(data = data)
+    dataset.idea = 'saved idea'
+    dataset.clerk = 'saved clerk'
+    checkpoints.save(
+        name = 'analyst',
+        key = keys[0],
+        dataset = dataset,
+        book = 'book',
+        results = 'results')
+    assert dataset.idea == 'saved idea'
+    checkpoints = Checkpoints(folder = tmp_path, version = '0.1.1')
+    assert checkpoints.resume(names = names, keys = keys) == 1
+    assert checkpoints.load(name = 'analyst', key = keys[0]) == (
+        'book', 'results')
+    loaded = checkpoints.load_dataset(
+        name = 'analyst',
+        key = keys[0],
+        idea = 'current idea',
+        clerk = 'current clerk')
+    assert loaded.idea == 'current idea'
+    assert loaded.clerk == 'current clerk'
+    pd.testing.assert_frame_equal(loaded.data, data)
+    with pytest.raises(KeyError):
+        checkpoints.load_dataset(name = 'analyst', key = keys[1])
+    # Changed code invalidates every stage.
+    upgraded = Checkpoints(folder = tmp_path, version = '0.1.2')
+    upgraded_keys = upgraded.chain(data = data, stages = stages)
+    assert upgraded.resume(names = names, keys = upgraded_keys) == 0
+    assert Checkpoints(folder = tmp_path).version == (
+        Checkpoints(folder = tmp_path).version)
+    return
@@ -0,0 +1,127 @@
+"""
+.. module:: retool test
+:synopsis: tests regular expression matching of expressions tables
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import os
+import re
+
+import pandas as pd
+
+from simplify.wrangler.steps import retool
+from simplify.wrangler.steps.retool import ReMatcher, ReTool
+
+
+def _search_each(keys, source):
+    found = []
+    for index, key in enumerate(keys):
+        found.extend(
+            (index, match.group(0)) for match in re.finditer(key, source))
+    return sorted(found)
+
+
+def test_rematcher_reports_every_key():
+    keys = [r'\d+', r'\d{3}', r'colou?r', 'colour', r'(\w)\1', '(?i)ID']
+    matcher = ReMatcher(keys = keys)
+    for source in ['id 123 colour', 'color 4567 tool', '', 'no match']:
+        assert sorted(matcher.search(source)) == _search_each(keys, source)
+        for index, key in enumerate(keys):
+            assert (any(i == index for i, _ in matcher.search(source))
+                    == bool(re.search(key, source)))
+    return
+
+
+def test_rematcher_match():
+    matcher = ReMatcher(keys = ['cat', 'category', r'\bdog\w*'])
+    rows, indices, texts = matcher.match(
+        source = ['category dogs', None, 'cat'])
+    assert list(rows) == [0, 0, 0, 2]
+    assert sorted(zip(indices, texts)) == [
+        (0, 'cat'), (0, 'cat'), (1, 'category'), (2, 'dogs')]
+    return
+
+
+def test_retool_keyword():
+    tool = ReTool(step = 'keyword',
+                  keys = ['cat', r'\bdog\w*'],
+                  values = ['feline', 'canine'],
+                  flags = ['ignorecase'])
+    df = pd.DataFrame({'text': ['A Cat', 'dogs', None]})
+    df = tool.implement(df = df, source = 'text')
+    assert df['section_feline'].tolist() == [True, False, False]
+    assert df['section_canine'].tolist() == [False, True, False]
+    return
+
+
+def test_retool_cached_table(tmp_path):
+    file_path = os.path.join(tmp_path, 'pets.csv')
+    pd.DataFrame({'keys': ['cat', 'dog'],
+                  'values': ['feline', 'canine'],
+                  'section': ['pets', 'pets'],
+                  'datatype': ['boolean', 'boolean']}).to_csv(
+                      file_path, index = False)
+    tool = ReTool(step = 'parse',
+                  file_path = file_path,
+                  cache_folder = tmp_path)
+    assert tool.datatypes == {'pets': 'boolean'}
+    assert any(name.endswith('.pickle') for name in os.listdir(tmp_path))
+    cached = ReTool(step = 'parse',
+                    file_path = file_path,
+                    cache_folder = tmp_path)
+    df = pd.DataFrame({'text': ['cat', 'dog']})
+    df = cached.implement(df = df, source = 'text')
+    assert df['section_feline'].tolist() == [True, False]
+    return
+
+
+def test_retool_cache_version(tmp_path, monkeypatch):
+    file_path = os.path.join(tmp_path, 'pets.csv')
+    pd.DataFrame({'keys': ['cat'], 'values': ['feline']}).to_csv(
+        file_path, index = False)
+    folder = os.path.join(tmp_path, 'cache')
+    ReTool(step = 'parse', file_path = file_path, cache_folder = folder)
+    first = os.listdir(folder)
+    ReTool(step = 'parse', file_path = file_path, cache_folder = folder)
+    assert os.listdir(folder) == first
+    # Changes to the compiling code make earlier cached tables stale.
+    monkeypatch.setattr(retool, '_code_version', lambda: 'changed')
+    ReTool(step = 'parse', file_path = file_path, cache_folder = folder)
+    assert len(os.listdir(folder)) == 2
+    return
+
+
+def test_rematcher_match_chunks():
+    matcher = ReMatcher(keys = ['cat', 'category', r'\bdog\w*'])
+    source = ['category dogs', None, 'cat', 'dog', '', 'cats and dogs'] * 3
+    serial = matcher.match(source = source)
+    for max_workers in [1, 2]:
+        chunked = matcher.match(
+            source = source,
+            chunk_size = 4,
+            max_workers = max_workers)
+        assert chunked[0].tolist() == serial[0].tolist()
+        assert chunked[1].tolist() == serial[1].tolist()
+        assert chunked[2] == serial[2]
+    rows, indices, texts = matcher.match(source = [], max_workers = 2)
+    assert len(rows) == len(indices) == len(texts) == 0
+    return
+
+
+def test_retool_keyword_chunks():
+    df = pd.DataFrame({'text': ['A Cat', 'dogs', None, 'cat dog'] * 3})
+    results = []
+    for max_workers in [1, 2]:
+        tool = ReTool(step = 'keyword',
+                      keys = ['cat', r'\bdog\w*'],
+                      values = ['feline', 'canine'],
+                      flags = ['ignorecase'],
+                      max_workers = max_workers,
+                      chunk_size = 5)
+        results.append(tool.implement(df = df.copy(), source = 'text'))
+    pd.testing.assert_frame_equal(results[0], results[1])
+    assert results[1]['section_canine'].tolist()[:4] == [
+        False, True, False, True]
+    return
@@ -0,0 +1,94 @@
+"""
+.. module:: scholar test
+:synopsis: tests applying chapters in worker processes
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import dataclasses
+import gc
+import pickle
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simplify.dataset import Dataset
+from simplify.scholar import (SharedFrame, _WORKER_STATE, _apply_chapter,
+                              _initialize_worker, _restore_data)
+
+
+def test_shared_frame():
+    df = pd.DataFrame({
+        'a': [1.0, 2.0, 3.0],
+        'b': [4, 5, 6],
+        'c': ['x', 'y', 'z']})
+    shared = SharedFrame.create(data = df)
+    # Attaching handles must outlive the attached frame, as in workers.
+    handle = SharedFrame(
+        blocks = shared.blocks,
+        extras = shared.extras,
+        columns = shared.columns,
+        index = shared.index)
+    try:
+        attached = handle.attach()
+        pd.testing.assert_frame_equal(attached, df)
+        with pytest.raises(ValueError):
+            attached['a'].to_numpy()[0] = 10.0
+        assert df['a'].iloc[0] == 1.0
+        del attached
+    finally:
+        handle.close()
+        shared.close()
+        shared.unlink()
+    return
+
+def _double_b(manuscript, data):
+    data.x = data.x.assign(b = data.x['b'] * 2.0)
+    manuscript.data = data
+    return manuscript
+
+def test_apply_chapter_payload():
+    df = pd.DataFrame({
+        'a': np.arange(100_000.0),
+        'b': np.arange(100_000.0),
+        'label': [0, 1] * 50_000})
+    data = Dataset.create(data = df)
+    data.create_xy(label = 'label')
+    template = data.fork()
+    template.data = None
+    shared_x = SharedFrame.create(data = data.x)
+    shared_y = SharedFrame.create(data = data.y)
+    try:
+        _initialize_worker(
+            method = _double_b,
+            template = template,
+            x = dataclasses.replace(shared_x),
+            y = dataclasses.replace(shared_y),
+            seed = 43)
+        chapter = _apply_chapter(
+            index = 0,
+            chapter = types.SimpleNamespace(name = 'double'))
+        payload = pickle.dumps(chapter)
+        # Only the changed column is sent back, not 'a' or the label.
+        assert len(payload) < 1.1 * data.x['b'].nbytes
+        returned = pickle.loads(payload)
+        _restore_data(
+            data = returned.data,
+            sources = {'x': data.x, 'y': data.y})
+        pd.testing.assert_frame_equal(
+            returned.data.x,
+            data.x.assign(b = data.x['b'] * 2.0))
+        pd.testing.assert_series_equal(returned.data.y, data.y)
+    finally:
+        shared = _WORKER_STATE.get('shared', ())
+        _WORKER_STATE.clear()
+        template = chapter = None
+        gc.collect()
+        for handle in list(shared) + [shared_x, shared_y]:
+            handle.close()
+        shared_x.unlink()
+        shared_y.unlink()
+    return
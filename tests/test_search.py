@@ -0,0 +1,95 @@
+"""
+.. module:: search test
+:synopsis: tests hyperparameter search
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from simplify.search import Candidate, Searcher
+
+
+def test_searcher():
+    rng = np.random.RandomState(43)
+    x = pd.DataFrame(rng.normal(size = (200, 3)), columns = ['a', 'b', 'c'])
+    y = pd.Series((x['a'] + rng.normal(scale = 0.5, size = 200)) > 0)
+    for method in ['grid', 'random', 'halving', 'hyperband']:
+        model = types.SimpleNamespace(
+            name = 'logit',
+            algorithm = LogisticRegression(),
+            parameters = {},
+            parameter_space = {'C': [0.001, 1.0, 10.0]})
+        searcher = Searcher(method = method, n_iter = 3, cv = 3, n_jobs = 1,
+                            seed = 43)
+        best = searcher.search(techniques = [model], x = x, y = y)
+        assert best['C'] in [0.001, 1.0, 10.0]
+        assert model.parameters['C'] == best['C']
+        assert model.algorithm.C == best['C']
+    return
+
+
+def test_searcher_prefix():
+    rng = np.random.RandomState(43)
+    x = pd.DataFrame(rng.normal(size = (90, 2)), columns = ['a', 'b'])
+    y = pd.Series(x['a'] > 0)
+    fitted = []
+    scaler = types.SimpleNamespace(
+        name = 'scaler',
+        fit = lambda x, y: fitted.append(len(x)),
+        transform = lambda x, y: x * 2)
+    model = types.SimpleNamespace(
+        name = 'logit',
+        algorithm = LogisticRegression(),
+        parameters = {},
+        parameter_space = {'C': [0.1, 1.0]})
+    searcher = Searcher(method = 'grid', cv = 3, n_jobs = 1)
+    searcher.search(techniques = [model], x = x, y = y, prefix = [scaler])
+    assert fitted == [60, 60, 60]
+    return
+
+def test_searcher_repeated():
+    rng = np.random.RandomState(43)
+    x = pd.DataFrame(rng.normal(size = (90, 2)), columns = ['a', 'b'])
+    y = pd.Series(x['a'] > 0)
+    searcher = Searcher(method = 'grid', cv = 3, n_jobs = 1)
+    first = types.SimpleNamespace(
+        name = 'logit',
+        algorithm = LogisticRegression(),
+        parameters = {},
+        parameter_space = {'C': [0.1, 1.0]})
+    searcher.search(techniques = [first], x = x, y = y)
+    second = types.SimpleNamespace(
+        name = 'tree',
+        algorithm = DecisionTreeClassifier(random_state = 43),
+        parameters = {},
+        parameter_space = {'max_depth': [1, 2]})
+    best = searcher.search(techniques = [second], x = x, y = y)
+    assert list(best) == ['max_depth']
+    assert len(searcher.candidates) == 2
+    assert all('max_depth' in c.parameters for c in searcher.candidates)
+    assert second.algorithm.max_depth == best['max_depth']
+    return
+
+def test_searcher_choose_best():
+    searcher = Searcher(method = 'halving')
+    with pytest.raises(ValueError):
+        searcher._choose_best()
+    searcher.candidates = [
+        Candidate(parameters = {'C': 1}, scores = [0.9], resource = 10),
+        Candidate(parameters = {'C': 2}, scores = [0.5, 0.4], resource = 30,
+                  stopped = True),
+        Candidate(parameters = {'C': 3}, scores = [0.6, 0.5], resource = 30,
+                  stopped = True)]
+    assert searcher._choose_best().parameters == {'C': 3}
+    searcher.candidates.append(
+        Candidate(parameters = {'C': 4}, scores = [0.2], resource = 30))
+    assert searcher._choose_best().parameters == {'C': 4}
+    return
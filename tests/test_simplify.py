@@ -1,5 +1,35 @@
+import collections
+import importlib.util
+import sys
+import types
+
+import pytest
+
+import simplify
 from simplify import __version__
+from simplify.lazy import make_lazy
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_lazy_modules():
+    for name in ['Dataset', 'Clerk', 'Project', 'Worker']:
+        assert importlib.util.find_spec(simplify._LAZY_OBJECTS[name])
+    return
+
+
+def test_make_lazy():
+    package = types.ModuleType('lazy_package')
+    sys.modules['lazy_package'] = package
+    package.__getattr__, package.__dir__ = make_lazy(
+        package = 'lazy_package',
+        objects = {'OrderedDict': 'collections'})
+    assert 'OrderedDict' in dir(package)
+    assert package.OrderedDict is collections.OrderedDict
+    assert 'OrderedDict' in vars(package)
+    with pytest.raises(AttributeError):
+        package.missing
+    del sys.modules['lazy_package']
+    return
@@ -0,0 +1,63 @@
+"""
+.. module:: sketches test
+:synopsis: tests approximate column statistics
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import numpy as np
+import pandas as pd
+
+from simplify.sketches import ColumnSketch, sketch_frame
+
+
+def test_sketch_frame():
+    rng = np.random.RandomState(43)
+    values = pd.Series(rng.zipf(1.5, size = 50_000) % 2_000).astype(str)
+    df = pd.DataFrame({'values': values.where(rng.rand(50_000) > 0.1)})
+    sketches = sketch_frame(data = df, chunk_size = 7_000, capacity = 200)
+    sketch = sketches['values']
+    exact = df['values'].nunique()
+    assert abs(sketch.unique() - exact) < 4 * sketch.distinct.relative_error * exact
+    assert sketch.nulls == df['values'].isna().sum()
+    counts = df['values'].value_counts()
+    frequent = sketch.frequent(fraction = 0.01)
+    assert set(counts[counts >= 0.01 * sketch.count].index) <= set(frequent)
+    hitters = sketch.heavy_hitters()
+    assert (hitters >= counts[hitters.index]).all()
+    assert sketch.frequent(fraction = 0.001) is None
+    return
+
+def test_column_sketch_exact_counts():
+    values = pd.Series(['a', 'b', None, 'a', 'c', 'a'] * 1_000)
+    sketch = ColumnSketch(capacity = 10)
+    sketch.update(column = values.iloc[:2_500])
+    sketch.update(column = values.iloc[2_500:])
+    assert not sketch.approximate
+    assert sketch.unique() == 3
+    assert sketch.nulls == 1_000
+    assert sketch.heavy_hitters().to_dict() == {
+        'a': 3_000, 'b': 1_000, 'c': 1_000}
+    assert sketch.frequent(fraction = 0.5).tolist() == ['a']
+    return
+
+def test_column_sketch_merge():
+    rng = np.random.RandomState(43)
+    values = pd.Series(rng.zipf(1.5, size = 40_000) % 5_000)
+    exact = ColumnSketch(capacity = 100).update(column = values.iloc[:50])
+    approximate = ColumnSketch(capacity = 100).update(
+        column = values.iloc[50:])
+    assert not exact.approximate
+    assert approximate.approximate
+    exact.merge(approximate)
+    assert exact.approximate
+    assert exact.count == len(values)
+    counts = values.value_counts()
+    assert abs(exact.unique() - len(counts)) < (
+        4 * exact.distinct.relative_error * len(counts))
+    hitters = exact.heavy_hitters()
+    assert (hitters >= counts[hitters.index]).all()
+    assert set(counts[counts >= 0.02 * len(values)].index) <= set(
+        exact.frequent(fraction = 0.02))
+    return
@@ -0,0 +1,101 @@
+"""
+.. module:: worker test
+:synopsis: tests applying techniques in books and chapters
+:author: Corey Rayburn Yung
+:copyright: 2019-2020
+:license: Apache-2.0
+"""
+
+import types
+
+import pandas as pd
+
+from simplify.dataset import Dataset
+from simplify.worker import PrefixTrie, Scholar
+
+
+class _Idea(object):
+    """Idea stand-in with the 'scholar' settings used by these tests."""
+
+    def apply(self, instance):
+        instance.verbose = False
+        return instance
+
+
+def _make_technique(name, step, applied):
+    return types.SimpleNamespace(
+        name = name,
+        step = step,
+        parameters = {},
+        apply = lambda data: applied.append(name) or data)
+
+
+def test_apply_common_prefix():
+    applied = []
+    scale = _make_technique('scale', 'scale', applied)
+    chapters = [
+        types.SimpleNamespace(techniques = [
+            _make_technique('scale', 'scale', applied),
+            _make_technique('smote', 'sample', applied),
+            _make_technique(name, 'model', applied)])
+        for name in ['logit', 'forest']]
+    chapters[0].techniques[0] = scale
+    book = types.SimpleNamespace(chapters = chapters)
+    data = types.SimpleNamespace(name = 'data')
+    scholar = Scholar(idea = _Idea())
+    start, returned = scholar._apply_common_prefix(book = book, data = data)
+    assert start == 2
+    assert returned is data
+    assert applied == ['scale', 'smote']
+    assert chapters[1].techniques[0] is scale
+    assert [t.name for t in chapters[1].techniques] == [
+        'scale', 'smote', 'forest']
+    chapters[1].techniques[1].step = 'split'
+    applied.clear()
+    start, _ = scholar._apply_common_prefix(book = book, data = data)
+    assert start == 1
+    assert applied == ['scale']
+    return
+
+
+def _make_book(applied):
+    return types.SimpleNamespace(chapters = [
+        types.SimpleNamespace(name = '_'.join(names), techniques = [
+            _make_step(name = name, applied = applied) for name in names])
+        for names in [
+            ['scale', 'smote', 'logit'],
+            ['scale', 'smote', 'forest'],
+            ['scale', 'none', 'forest']]])
+
+
+def _make_step(name, applied):
+
+    def apply(data):
+        applied.append(name)
+        data[name] = 1
+        return data
+
+    return types.SimpleNamespace(
+        name = name,
+        step = name,
+        parameters = {},
+        apply = apply)
+
+
+def test_apply_trie():
+    applied = []
+    book = _make_book(applied = applied)
+    trie = PrefixTrie.create(book = book)
+    assert len(trie) == 6
+    data = Dataset.create(data = pd.DataFrame({'a': [1, 2]}))
+    scholar = Scholar(idea = _Idea(), prefix_sharing = True)
+    assert scholar._count_applications(node = trie.root, book = book) == 6
+    scholar._apply_trie(book = book, data = data)
+    assert applied == ['scale', 'smote', 'logit', 'forest', 'forest']
+    columns = [list(chapter.data.data.columns) for chapter in book.chapters]
+    assert columns == [
+        ['a', 'scale', 'smote', 'logit'],
+        ['a', 'scale', 'smote', 'forest'],
+        ['a', 'scale', 'forest']]
+    assert book.chapters[1].techniques[0] is book.chapters[0].techniques[0]
+    return